@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# this_file: scripts/select_tests.py
+"""Print the test files affected by uncommitted changes, one per line.
+
+Used by scripts/test.sh to run only the tests that can observe a change. A test
+file is selected when it changed itself or when it imports (directly or through
+other brosh modules) a changed module under src/brosh. Nothing is printed when
+the full suite must run: no changes at all, or a change to anything this
+mapping cannot reason about (conftest.py, pyproject.toml, scripts, ...).
+"""
+
+import ast
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src" / "brosh"
+TESTS = ROOT / "tests"
+PACKAGE = "brosh"
+
+
+def changed_files() -> list[str]:
+    """Tracked files changed against HEAD plus untracked, non-ignored files."""
+    git = ["git", "-C", str(ROOT)]
+    diff = subprocess.run([*git, "diff", "--name-only", "HEAD"], capture_output=True, text=True, check=True)
+    new = subprocess.run(
+        [*git, "ls-files", "--others", "--exclude-standard"], capture_output=True, text=True, check=True
+    )
+    return sorted({line for line in (diff.stdout + new.stdout).splitlines() if line})
+
+
+def brosh_imports(path: Path, *, in_package: bool) -> set[str]:
+    """Names of the brosh modules a file imports (``__init__`` for the package itself)."""
+    found: set[str] = set()
+    for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"))):
+        if isinstance(node, ast.ImportFrom):
+            if in_package and node.level == 1:
+                base = node.module
+            elif node.level == 0 and node.module and node.module.split(".")[0] == PACKAGE:
+                base = node.module.partition(".")[2] or None
+            else:
+                continue
+            if base:
+                found.add(base.split(".")[0])
+            else:
+                # ``from . import x`` / ``from brosh import x``: x may be a submodule or a re-export
+                found.add("__init__")
+                found.update(alias.name for alias in node.names if (SRC / f"{alias.name}.py").exists())
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                parts = alias.name.split(".")
+                if parts[0] == PACKAGE:
+                    found.add(parts[1] if len(parts) > 1 else "__init__")
+    return found
+
+
+def module_closure(graph: dict[str, set[str]], roots: set[str]) -> set[str]:
+    """All modules reachable from ``roots`` in the import graph."""
+    seen: set[str] = set()
+    stack = list(roots)
+    while stack:
+        name = stack.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        stack.extend(graph.get(name, ()))
+    return seen
+
+
+def main() -> int:
+    changes = changed_files()
+    if not changes:
+        return 0
+
+    changed_modules: set[str] = set()
+    changed_tests: set[str] = set()
+    for name in changes:
+        path = Path(name)
+        if path.parent == Path("src", PACKAGE) and path.suffix == ".py":
+            changed_modules.add(path.stem)
+        elif path.parent == Path("tests") and path.name.startswith("test_") and path.suffix == ".py":
+            changed_tests.add(name)
+        elif path.suffix == ".md":
+            continue
+        else:
+            return 0  # Unknown blast radius: run everything
+
+    graph = {path.stem: brosh_imports(path, in_package=True) for path in SRC.glob("*.py")}
+    # conftest.py is loaded for every test, so its imports are shared dependencies
+    shared = brosh_imports(TESTS / "conftest.py", in_package=False)
+    selected = set(changed_tests)
+    for test_file in TESTS.glob("test_*.py"):
+        deps = module_closure(graph, shared | brosh_imports(test_file, in_package=False))
+        if deps & changed_modules:
+            selected.add(str(test_file.relative_to(ROOT)))
+
+    sys.stdout.write("".join(f"{name}\n" for name in sorted(selected) if (ROOT / name).exists()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -37,22 +37,66 @@ else
     echo -e "${YELLOW}⚠️  MyPy not found, skipping type checking${NC}"
 fi
 
+# Parallelize across test modules when pytest-xdist is available. --dist=loadfile
+# keeps all tests from one file on the same worker so module-level fixtures and
+# mocks are reused. Set BROSH_TEST_WORKERS to pin the worker count (0 = serial).
+XDIST_ARGS=()
+if python -c "import xdist" &> /dev/null; then
+    BROSH_TEST_WORKERS="${BROSH_TEST_WORKERS:-auto}"
+    if [ "$BROSH_TEST_WORKERS" != "0" ]; then
+        XDIST_ARGS=(-n "$BROSH_TEST_WORKERS" --dist=loadfile --max-worker-restart=3)
+        echo -e "${YELLOW}  Using pytest-xdist with $BROSH_TEST_WORKERS workers${NC}"
+    fi
+else
+    echo -e "${YELLOW}⚠️  pytest-xdist not found, running tests serially${NC}"
+fi
+
+# Run only the tests affected by uncommitted changes unless --full is given.
+# select_tests.py prints nothing when the whole suite has to run. A partial run
+# cannot meet the project-wide coverage floor, so the floor only applies to
+# full runs.
+TEST_PATHS=(tests/)
+FAIL_UNDER=70
+if [ "${1:-}" != "--full" ]; then
+    SELECTED=$(python scripts/select_tests.py || true)
+    if [ -n "$SELECTED" ]; then
+        read -r -a TEST_PATHS <<< "$(echo "$SELECTED" | tr '\n' ' ')"
+        FAIL_UNDER=0
+        echo -e "${YELLOW}  Running tests affected by local changes: ${TEST_PATHS[*]}${NC}"
+        echo -e "${YELLOW}  (pass --full to run the whole suite)${NC}"
+    fi
+fi
+
+# Prefer SlipCover for coverage: it removes instrumentation from lines once they
+# have been covered, so coverage runs cost close to a plain run. coverage.py via
+# pytest-cov remains the fallback. SlipCover replaces the pytest-cov options from
+# pyproject.toml, so addopts is reset and its non-coverage options passed again.
+PYTEST_ARGS=("${TEST_PATHS[@]}" --verbose --tb=short -x)
+if python -c "import slipcover" &> /dev/null; then
+    echo -e "${YELLOW}  Measuring coverage with SlipCover${NC}"
+    COVERAGE_REPORT="coverage.xml"
+    RUNNER=(python -m slipcover --branch --xml --out coverage.xml --source src/brosh --fail-under "$FAIL_UNDER" -m pytest)
+    PYTEST_ARGS+=(-o addopts= -p no:cov --strict-markers --strict-config)
+else
+    COVERAGE_REPORT="htmlcov/index.html"
+    RUNNER=(python -m pytest)
+    PYTEST_ARGS+=(
+        --cov=src/brosh
+        --cov-report=term-missing
+        --cov-report=html:htmlcov
+        --cov-report=xml
+        --cov-fail-under="$FAIL_UNDER"
+    )
+fi
+
 # Run tests
 echo -e "${BLUE}🧪 Running tests...${NC}"
-python -m pytest tests/ \
-    --verbose \
-    --tb=short \
-    --cov=src/brosh \
-    --cov-report=term-missing \
-    --cov-report=html:htmlcov \
-    --cov-report=xml \
-    --cov-fail-under=70 \
-    -x
+"${RUNNER[@]}" "${PYTEST_ARGS[@]}" ${XDIST_ARGS[@]+"${XDIST_ARGS[@]}"}
 
 # Check test results
 if [ $? -eq 0 ]; then
     echo -e "${GREEN}✅ All tests passed!${NC}"
-    echo -e "${BLUE}📊 Coverage report generated in htmlcov/index.html${NC}"
+    echo -e "${BLUE}📊 Coverage report generated in ${COVERAGE_REPORT}${NC}"
 else
     echo -e "${RED}❌ Some tests failed${NC}"
     exit 1
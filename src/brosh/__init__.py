@@ -3,15 +3,21 @@
 
 """Browser screenshot tool using Playwright async API."""
 
-from .api import (
-    capture_animation,
-    capture_full_page,
-    capture_visible_area,
-    capture_webpage,
-)
-from .cli import BrowserScreenshotCLI
-from .models import CaptureConfig, ImageFormat
-from .tool import BrowserScreenshotTool
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .api import (
+        capture_animation,
+        capture_full_page,
+        capture_visible_area,
+        capture_webpage,
+        capture_webpage_async,
+        capture_webpages,
+    )
+    from .cli import BrowserScreenshotCLI
+    from .models import CaptureConfig, ImageFormat
+    from .tool import BrowserScreenshotTool
 
 try:
     from .__version__ import __version__
@@ -27,4 +33,36 @@ __all__ = [
     "capture_full_page",
     "capture_visible_area",
     "capture_webpage",
+    "capture_webpage_async",
+    "capture_webpages",
 ]
+
+# Public names and the submodule defining each. They are imported on first
+# access (PEP 562) so that `import brosh` does not load Playwright, Pydantic
+# and the rest of the capture stack up front.
+_LAZY_EXPORTS = {
+    "BrowserScreenshotCLI": ".cli",
+    "BrowserScreenshotTool": ".tool",
+    "CaptureConfig": ".models",
+    "ImageFormat": ".models",
+    "capture_animation": ".api",
+    "capture_full_page": ".api",
+    "capture_visible_area": ".api",
+    "capture_webpage": ".api",
+    "capture_webpage_async": ".api",
+    "capture_webpages": ".api",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -4,15 +4,71 @@
 """Public API for brosh - single source of truth for all parameters."""
 
 import asyncio
+from collections.abc import Awaitable
+from functools import lru_cache
 from pathlib import Path
-from typing import Annotated, Any
+from typing import Annotated, Any, TypeVar
 
+from loguru import logger
 from pydantic import Field
 from pydantic.networks import AnyUrl
 
+from .browser import BrowserManager
 from .models import CaptureConfig, ImageFormat
 from .tool import BrowserScreenshotTool, dflt_output_folder
 
+# Pages captured at the same time by capture_webpages
+DEFAULT_BATCH_CONCURRENCY = 4
+
+_T = TypeVar("_T")
+
+
+@lru_cache(maxsize=1)
+def _default_output_dir() -> Path:
+    """Default screenshot folder, resolved through platformdirs once per process."""
+    return Path(dflt_output_folder())
+
+
+def _build_config(
+    url: AnyUrl | str, *, output_dir: Path | None, output_format: ImageFormat, **options: Any
+) -> CaptureConfig:
+    """Build and validate the CaptureConfig shared by the sync and async entry points.
+
+    Args:
+        url: The webpage URL to capture
+        output_dir: Directory to save screenshots (None for the default folder)
+        output_format: Output image format
+        **options: Remaining capture_webpage parameters, named as on CaptureConfig
+
+    Returns:
+        Validated capture configuration
+
+    Raises:
+        ValueError: For invalid parameters
+    """
+    # Handle default for output_dir
+    if output_dir is None:
+        output_dir = _default_output_dir()
+
+    config = CaptureConfig(url=str(url), format=output_format, output_dir=str(output_dir), **options)
+    config.validate()
+    return config
+
+
+async def _stopping_playwright(capture: Awaitable[_T]) -> _T:
+    """Await a capture, then stop the Playwright driver of the loop that is about to end.
+
+    Args:
+        capture: Pending BrowserScreenshotTool.capture call
+
+    Returns:
+        The capture's result
+    """
+    try:
+        return await capture
+    finally:
+        await BrowserManager.stop_playwright()
+
 
 def capture_webpage(
     url: Annotated[AnyUrl, Field(description="The webpage URL to capture")],
@@ -30,7 +86,7 @@ def capture_webpage(
     ] = "",
     output_dir: Annotated[
         Path | None,
-        Field(default_factory=lambda: Path(dflt_output_folder()), description="Output directory for screenshots"),
+        Field(default_factory=_default_output_dir, description="Output directory for screenshots"),
     ] = None,
     *,
     subdirs: Annotated[bool, Field(default=False, description="Create subdirectories per domain")] = False,
@@ -40,6 +96,9 @@ def capture_webpage(
     anim_spf: Annotated[
         float, Field(default=0.5, ge=0.1, le=10.0, description="Seconds per frame for APNG animation")
     ] = 0.5,
+    anim_optimize: Annotated[
+        bool, Field(default=False, description="Compress APNG animation harder: smaller but much slower")
+    ] = False,
     fetch_html: Annotated[
         bool, Field(default=False, description="Include visible HTML content for each screenshot")
     ] = False,
@@ -53,6 +112,9 @@ def capture_webpage(
     from_selector: Annotated[
         str, Field(default="", description="CSS selector to scroll to before starting capture")
     ] = "",
+    paint_settle_ms: Annotated[
+        int, Field(default=0, ge=0, le=10000, description="Extra wait in ms after each scroll, for animated pages")
+    ] = 0,
 ) -> dict[str, dict[str, Any]]:
     """Capture webpage screenshots with comprehensive options.
 
@@ -71,6 +133,8 @@ def capture_webpage(
         subdirs: Whether to create domain-based subdirectories
         output_format: Output image format (png, jpg, or apng)
         anim_spf: Animation speed for APNG format
+        anim_optimize: Whether to compress the APNG animation at the highest
+            (and slowest) level
         fetch_html: Whether to include HTML content in results
         fetch_image: Whether to include image data in MCP output
         fetch_image_path: Whether to include image path in MCP output
@@ -78,6 +142,8 @@ def capture_webpage(
         trim_text: Whether to trim text to 200 characters
         max_frames: Maximum frames to capture (0 for unlimited)
         from_selector: CSS selector to start capture from
+        paint_settle_ms: Extra wait in milliseconds after each scroll has
+            painted, for pages that animate in content
 
     Returns:
         Dictionary mapping file paths to metadata:
@@ -92,30 +158,26 @@ def capture_webpage(
 
     Raises:
         ValueError: For invalid parameters
-        RuntimeError: For browser or capture failures
+        RuntimeError: For browser or capture failures, or when called from a
+            running event loop (use capture_webpage_async there)
 
     Used in:
     - __init__.py
     - cli.py
-    - mcp.py
     """
-    # Handle default for output_dir
-    if output_dir is None:
-        output_dir = Path(dflt_output_folder())
-
-    # Create configuration object
-    config = CaptureConfig(
-        url=str(url),
+    config = _build_config(
+        url,
+        zoom=zoom,
         width=width,
         height=height,
-        zoom=zoom,
         scroll_step=scroll_step,
         scale=scale,
-        format=output_format,
         app=app,
-        output_dir=str(output_dir),
+        output_dir=output_dir,
         subdirs=subdirs,
+        output_format=output_format,
         anim_spf=anim_spf,
+        anim_optimize=anim_optimize,
         fetch_html=fetch_html,
         fetch_image=fetch_image,
         fetch_image_path=fetch_image_path,
@@ -123,28 +185,13 @@ def capture_webpage(
         trim_text=trim_text,
         max_frames=max_frames,
         from_selector=from_selector,
+        paint_settle_ms=paint_settle_ms,
     )
 
-    # Validate configuration
-    config.validate()
-
-    # Create and run tool
+    # Create and run tool. Callers already running an event loop (e.g. MCP)
+    # use capture_webpage_async instead.
     tool = BrowserScreenshotTool()
-
-    # Handle async execution
-    from contextlib import suppress  # Added import
-
-    loop = None
-    with suppress(RuntimeError):  # SIM105
-        loop = asyncio.get_running_loop()
-
-    if loop is not None:
-        # Already in async context (e.g., from MCP): hand the coroutine back so the
-        # caller awaits it. The return type is declared as the resolved dict for the
-        # common sync path, so this branch is intentionally not statically checkable.
-        return tool.capture(config)  # type: ignore[return-value]
-    # Sync context (e.g., from CLI)
-    return asyncio.run(tool.capture(config))
+    return asyncio.run(_stopping_playwright(tool.capture(config)))
 
 
 # Async version for MCP and other async contexts
@@ -164,7 +211,7 @@ async def capture_webpage_async(
     ] = "",
     output_dir: Annotated[
         Path | None,
-        Field(default_factory=lambda: Path(dflt_output_folder()), description="Output directory for screenshots"),
+        Field(default_factory=_default_output_dir, description="Output directory for screenshots"),
     ] = None,
     *,
     subdirs: Annotated[bool, Field(default=False, description="Create subdirectories per domain")] = False,
@@ -174,6 +221,9 @@ async def capture_webpage_async(
     anim_spf: Annotated[
         float, Field(default=0.5, ge=0.1, le=10.0, description="Seconds per frame for APNG animation")
     ] = 0.5,
+    anim_optimize: Annotated[
+        bool, Field(default=False, description="Compress APNG animation harder: smaller but much slower")
+    ] = False,
     fetch_html: Annotated[
         bool, Field(default=False, description="Include visible HTML content for each screenshot")
     ] = False,
@@ -187,28 +237,31 @@ async def capture_webpage_async(
     from_selector: Annotated[
         str, Field(default="", description="CSS selector to scroll to before starting capture")
     ] = "",
+    paint_settle_ms: Annotated[
+        int, Field(default=0, ge=0, le=10000, description="Extra wait in ms after each scroll, for animated pages")
+    ] = 0,
 ) -> dict[str, dict[str, Any]]:
     """Async version of capture_webpage for use in async contexts like MCP.
 
     See capture_webpage for full documentation.
-    """
-    # Handle default for output_dir
-    if output_dir is None:
-        output_dir = Path(dflt_output_folder())
 
-    # Create configuration object
-    config = CaptureConfig(
-        url=str(url),
+    Used in:
+    - __init__.py
+    - mcp.py
+    """
+    config = _build_config(
+        url,
+        zoom=zoom,
         width=width,
         height=height,
-        zoom=zoom,
         scroll_step=scroll_step,
         scale=scale,
-        format=output_format,
         app=app,
-        output_dir=str(output_dir),
+        output_dir=output_dir,
         subdirs=subdirs,
+        output_format=output_format,
         anim_spf=anim_spf,
+        anim_optimize=anim_optimize,
         fetch_html=fetch_html,
         fetch_image=fetch_image,
         fetch_image_path=fetch_image_path,
@@ -216,14 +269,87 @@ async def capture_webpage_async(
         trim_text=trim_text,
         max_frames=max_frames,
         from_selector=from_selector,
+        paint_settle_ms=paint_settle_ms,
     )
 
-    # Validate configuration
-    config.validate()
+    # Create and run tool. The caller's loop, and with it the Playwright
+    # driver, outlives this call (e.g. MCP), so the tool's cached context and
+    # browser connection must be closed here or they pile up in the browser.
+    tool = BrowserScreenshotTool()
+    try:
+        return await tool.capture(config)
+    finally:
+        await tool.browser_manager.shutdown()
+
 
-    # Create and run tool
+async def _capture_many(configs: list[CaptureConfig], concurrency: int) -> dict[str, dict[str, dict[str, Any]]]:
+    """Run several captures side by side on one tool, sharing its browser connection.
+
+    Args:
+        configs: Validated capture configurations, one per URL
+        concurrency: Maximum number of captures running at the same time
+
+    Returns:
+        Dictionary mapping each captured URL to its results
+    """
     tool = BrowserScreenshotTool()
-    return await tool.capture(config)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def capture_one(config: CaptureConfig) -> dict[str, dict[str, Any]]:
+        async with semaphore:
+            return await tool.capture(config)
+
+    try:
+        outcomes = await asyncio.gather(*(capture_one(config) for config in configs), return_exceptions=True)
+    finally:
+        await tool.browser_manager.shutdown()
+
+    results = {}
+    for config, outcome in zip(configs, outcomes, strict=True):
+        if isinstance(outcome, BaseException):
+            if not isinstance(outcome, Exception):
+                raise outcome
+            logger.error(f"Failed to capture {config.url}: {outcome}")
+        else:
+            results[config.url] = outcome
+    return results
+
+
+def capture_webpages(
+    urls: list[AnyUrl | str], concurrency: int = DEFAULT_BATCH_CONCURRENCY, **kwargs: Any
+) -> dict[str, dict[str, dict[str, Any]]]:
+    """Capture several webpages concurrently over one browser connection.
+
+    Each URL is captured in its own page of the same browser session, so the
+    connection is made once for the whole batch.
+
+    Args:
+        urls: Webpage URLs to capture
+        concurrency: Maximum number of pages captured at the same time
+        **kwargs: Other capture_webpage parameters, applied to every URL
+
+    Returns:
+        Dictionary mapping each captured URL to its capture_webpage result;
+        URLs whose capture failed are logged and left out, and a URL given
+        more than once is captured once
+
+    Raises:
+        ValueError: For invalid parameters
+        RuntimeError: When called from a running event loop
+
+    Used in:
+    - __init__.py
+    - cli.py
+    """
+    if concurrency < 1:
+        msg = f"Concurrency must be at least 1, got {concurrency}"
+        raise ValueError(msg)
+    output_dir = kwargs.pop("output_dir", None)
+    output_format = kwargs.pop("output_format", ImageFormat.PNG)
+    # Results are keyed by URL, and two captures of one page would write the same files
+    unique_urls = dict.fromkeys(str(url) for url in urls)
+    configs = [_build_config(url, output_dir=output_dir, output_format=output_format, **kwargs) for url in unique_urls]
+    return asyncio.run(_stopping_playwright(_capture_many(configs, concurrency)))
 
 
 # Convenience functions for common use cases
@@ -4,18 +4,42 @@
 """Browser management utilities for brosh."""
 
 import asyncio
+import contextlib
+import ctypes
+import os
 import platform
+import random
+import re
 import shutil
 import subprocess
+import weakref
+from collections.abc import Iterator
+from functools import cache
 from pathlib import Path
+from typing import Any, ClassVar
 
 from loguru import logger
+from platformdirs import user_data_dir
+
+try:
+    import psutil
+
+    HAS_PSUTIL = True
+except ImportError:
+    HAS_PSUTIL = False
+
+# Host OS, resolved once at import; it cannot change while the process runs
+_SYSTEM = platform.system()
+_IS_DARWIN = _SYSTEM == "Darwin"
+_IS_WINDOWS = _SYSTEM == "Windows"
 
 # Default screen dimensions if detection fails
 DEFAULT_FALLBACK_WIDTH = 1440
 DEFAULT_FALLBACK_HEIGHT = 900
 # Minimum physical width to consider a display Retina for scaling
 RETINA_MIN_WIDTH = 2560
+# First "Resolution: 2880 x 1800 Retina" line of system_profiler SPDisplaysDataType
+_RESOLUTION_RE = re.compile(r"Resolution:\s*(?P<width>\d+)\s*x\s*(?P<height>\d+)(?P<rest>.*)")
 # Timeout for subprocess calls like system_profiler
 SUBPROCESS_TIMEOUT = 10
 # Timeout for pkill/taskkill subprocess calls
@@ -24,14 +48,275 @@ SUBPROCESS_PKILL_TIMEOUT = 5
 DEFAULT_VIEWPORT_HEIGHT_IF_FULLPAGE = 900
 # Seconds to wait after killing browser processes before starting a new one
 BROWSER_LAUNCH_WAIT_SECONDS = 2
-# Seconds between attempts to connect to a newly launched browser
-BROWSER_CONNECT_RETRY_INTERVAL_SECONDS = 1
+# Wait before the first attempt to connect to a newly launched browser
+BROWSER_CONNECT_INITIAL_DELAY_SECONDS = 0.1
+# Growth factor and cap of the wait between further connection attempts
+BROWSER_CONNECT_BACKOFF_FACTOR = 1.6
+BROWSER_CONNECT_MAX_DELAY_SECONDS = 2.0
+# Fraction of each wait that is randomized so retries do not run in lockstep
+BROWSER_CONNECT_JITTER = 0.2
 # Maximum number of attempts to connect to a newly launched browser
-BROWSER_CONNECT_MAX_ATTEMPTS = 10
+BROWSER_CONNECT_MAX_ATTEMPTS = 12
+# Seconds a browser that never became reachable gets to exit before it is killed
+BROWSER_TERMINATE_GRACE_SECONDS = 1
+# Timeout in seconds for the TCP probe run before each CDP connection attempt
+DEBUG_PORT_PROBE_TIMEOUT_SECONDS = 0.2
 # Timeout in milliseconds for playwright.chromium.connect_over_cdp
 BROWSER_CONNECT_CDP_TIMEOUT_MS = 5000
 # Default zoom level percentage
 DEFAULT_ZOOM_LEVEL = 100
+# macOS framework exporting the CoreGraphics display functions
+APPLICATION_SERVICES_PATH = "/System/Library/Frameworks/ApplicationServices.framework/ApplicationServices"
+# GetSystemMetrics indices for the primary screen width and height
+SM_CXSCREEN = 0
+SM_CYSCREEN = 1
+# Init script applying the zoom level (in percent) once the page body exists
+ZOOM_INIT_SCRIPT = "document.addEventListener('DOMContentLoaded', () => {{ document.body.style.zoom = '{zoom}%'; }});"
+# Substrings of a user-supplied app name and the browser each selects, checked in order
+APP_NAME_ALIASES = {
+    "chrome": "chrome",
+    "chromium": "chrome",
+    "edge": "edge",
+    "safari": "safari",
+}
+# Fixed command-line flags for Chrome/Edge started in debug mode
+CHROMIUM_DEBUG_ARGS = (
+    "--no-startup-window",
+    "--noerrdialogs",
+    "--no-user-gesture-required",
+    "--no-network-profile-warning",
+    "--no-first-run",
+    "--no-experiments",
+    "--no-default-browser-check",
+    "--disable-web-security",
+    "--disable-features=VizDisplayCompositor",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-infobars",
+    "--disable-extensions",
+    "--disable-sync",
+    "--disable-translate",
+    "--disable-background-networking",
+)
+# Extra Chromium flags for a windowless debug browser: no window server
+# connection and no GPU process, so it starts noticeably faster
+CHROMIUM_HEADLESS_ARGS = (
+    "--headless=new",
+    "--disable-gpu",
+)
+# Well-known install locations of each browser, in priority order
+BROWSER_PATHS = {
+    "chrome": (
+        "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+        "/Applications/Chromium.app/Contents/MacOS/Chromium",
+        "/usr/bin/google-chrome",
+        "/usr/bin/chromium-browser",
+        "/opt/google/chrome/chrome",
+        "C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe",
+        "C:\\Program Files (x86)\\Google\\Chrome\\Application\\chrome.exe",
+    ),
+    "edge": (
+        "/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge",
+        "C:\\Program Files (x86)\\Microsoft\\Edge\\Application\\msedge.exe",
+        "C:\\Program Files\\Microsoft\\Edge\\Application\\msedge.exe",
+    ),
+    "safari": ("/Applications/Safari.app/Contents/MacOS/Safari",),
+}
+# Executable names looked up on PATH before the well-known install locations
+BROWSER_EXECUTABLE_NAMES = {
+    "chrome": ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"),
+    "edge": ("microsoft-edge", "microsoft-edge-stable", "msedge"),
+}
+
+
+def _existing_paths(paths: list[str]) -> Iterator[str]:
+    """Yield those of ``paths`` that exist, listing each parent directory once.
+
+    Candidates sharing a directory are answered from a single ``os.scandir``
+    instead of one ``stat`` each, and directories are only listed when reached.
+
+    Args:
+        paths: Candidate file paths in priority order
+
+    Yields:
+        Existing paths, in the order given
+
+    """
+    listings: dict[str, set[str]] = {}
+    for path in paths:
+        parent, name = os.path.split(path)
+        if parent not in listings:
+            try:
+                with os.scandir(parent) as entries:
+                    listings[parent] = {entry.name for entry in entries}
+            except OSError:  # Missing or unreadable directory, or a path for another OS
+                listings[parent] = set()
+        if name in listings[parent]:
+            yield path
+
+
+def _first_existing_path(paths: list[str]) -> str | None:
+    """Return the first of ``paths`` that exists, or None."""
+    return next(_existing_paths(paths), None)
+
+
+@cache
+def _debug_profile_dir(browser_type: str, debug_port: int) -> Path:
+    """Get the browser profile directory used in debug mode.
+
+    Each browser/port pair gets its own profile, so Chrome and Edge never
+    contend for one profile lock. It lives in the user's data folder rather
+    than a shared /tmp path, and persists so logins made in the debug
+    browser survive restarts.
+
+    Args:
+        browser_type: Type of browser (chrome, edge)
+        debug_port: Remote debugging port
+
+    Returns:
+        Path to the (created) profile directory
+
+    """
+    profile_dir = Path(user_data_dir("brosh")) / "profiles" / f"{browser_type}-{debug_port}"
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    return profile_dir
+
+
+def _macos_main_display_size() -> tuple[int, int] | None:
+    """Get the main display size in points straight from CoreGraphics.
+
+    Points are already logical (CSS) pixels, so no Retina scaling is needed.
+
+    Returns:
+        Tuple of (width, height), or None if CoreGraphics is unavailable
+
+    """
+    try:
+        quartz = ctypes.CDLL(APPLICATION_SERVICES_PATH)
+    except OSError:
+        return None
+    quartz.CGMainDisplayID.restype = ctypes.c_uint32
+    for name in ("CGDisplayPixelsWide", "CGDisplayPixelsHigh"):
+        getattr(quartz, name).argtypes = [ctypes.c_uint32]
+        getattr(quartz, name).restype = ctypes.c_size_t
+    display_id = quartz.CGMainDisplayID()
+    width = quartz.CGDisplayPixelsWide(display_id)
+    height = quartz.CGDisplayPixelsHigh(display_id)
+    # Zero means no window server session (e.g. over ssh)
+    return (width, height) if width and height else None
+
+
+def _windows_screen_size() -> tuple[int, int] | None:
+    """Get the primary screen size with a single user32 call.
+
+    The process is left DPI-unaware, so Windows reports the scaled (logical)
+    size, the same value tkinter's winfo_screenwidth/height return.
+
+    Returns:
+        Tuple of (width, height), or None if user32 is unavailable
+
+    """
+    try:
+        user32 = ctypes.windll.user32
+    except (AttributeError, OSError):  # Not on Windows
+        return None
+    width = user32.GetSystemMetrics(SM_CXSCREEN)
+    height = user32.GetSystemMetrics(SM_CYSCREEN)
+    return (width, height) if width and height else None
+
+
+def _connect_retry_delays() -> Iterator[float]:
+    """Yield the wait before each attempt to connect to a newly launched browser.
+
+    Browsers are usually reachable within a few hundred milliseconds but can
+    take seconds on a cold start, so the waits grow exponentially up to a cap.
+
+    Yields:
+        Seconds to sleep before the next attempt
+
+    """
+    delay = BROWSER_CONNECT_INITIAL_DELAY_SECONDS
+    for _ in range(BROWSER_CONNECT_MAX_ATTEMPTS):
+        yield delay * random.uniform(1 - BROWSER_CONNECT_JITTER, 1)  # noqa: S311 - timing jitter only
+        delay = min(delay * BROWSER_CONNECT_BACKOFF_FACTOR, BROWSER_CONNECT_MAX_DELAY_SECONDS)
+
+
+def _kill_debug_processes(debug_port: int) -> None:
+    """Stop browsers left listening on ``debug_port``, sparing all other browser windows.
+
+    Processes get BROWSER_TERMINATE_GRACE_SECONDS to exit before being killed.
+
+    Args:
+        debug_port: Remote debugging port the stale browsers were started with
+
+    """
+    port_flag = f"--remote-debugging-port={debug_port}"
+    stale = []
+    for process in psutil.process_iter(["cmdline"]):
+        if port_flag in (process.info["cmdline"] or ()):
+            try:
+                process.terminate()
+                stale.append(process)
+            except psutil.Error:
+                pass  # Already gone or not ours to stop
+    _, alive = psutil.wait_procs(stale, timeout=BROWSER_TERMINATE_GRACE_SECONDS)
+    for process in alive:
+        with contextlib.suppress(psutil.Error):
+            process.kill()
+
+
+async def _debug_port_open(debug_port: int) -> bool:
+    """Check whether anything accepts TCP connections on the local debug port.
+
+    Args:
+        debug_port: Remote debugging port
+
+    Returns:
+        True if a connection could be opened
+
+    """
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection("localhost", debug_port), timeout=DEBUG_PORT_PROBE_TIMEOUT_SECONDS
+        )
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    return True
+
+
+async def _close_quietly(resource, kind: str) -> None:
+    """Close a Playwright page, context or browser, logging instead of raising on failure.
+
+    Args:
+        resource: Object to close, or None to do nothing
+        kind: What is being closed, for the log message
+
+    """
+    if not resource:
+        return
+    try:
+        await resource.close()
+    except Exception as e:
+        logger.warning(f"Failed to close {kind}: {e}")
+
+
+async def _run_cleanup_command(*args: str) -> None:
+    """Run a short-lived process-cleanup command without blocking the event loop.
+
+    Args:
+        *args: Command and its arguments
+
+    """
+    process = await asyncio.create_subprocess_exec(
+        *args, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL
+    )
+    try:
+        await asyncio.wait_for(process.wait(), timeout=SUBPROCESS_PKILL_TIMEOUT)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
 
 
 class BrowserManager:
@@ -42,6 +327,11 @@ class BrowserManager:
     - tool.py
     """
 
+    # Started Playwright drivers, one per event loop, shared by all managers;
+    # entries vanish with their loop
+    _playwrights: ClassVar[weakref.WeakKeyDictionary] = weakref.WeakKeyDictionary()
+    _playwright_locks: ClassVar[weakref.WeakKeyDictionary] = weakref.WeakKeyDictionary()
+
     def __init__(self, connection_timeout: int = 30):
         """Initialize browser manager.
 
@@ -55,17 +345,82 @@ class BrowserManager:
             "edge": 9223,
             "safari": 9225,
         }
+        # CDP connections by (browser name, debug port), reused while connected
+        self._browser_cache: dict[tuple[str, int], Any] = {}
+        # Contexts of cached connections by (browser, width, viewport height, zoom);
+        # each capture opens a new page in them instead of a new context
+        self._context_cache: dict[tuple[Any, int, int, int], Any] = {}
+        # Serializes get_browser_instance so concurrent captures share one connection
+        self._instance_lock = asyncio.Lock()
+
+    @classmethod
+    async def get_playwright(cls):
+        """Get the Playwright driver shared by all captures on the running event loop.
 
-    def get_screen_dimensions(self) -> tuple[int, int]:
+        The driver (a Node subprocess) is started on first use and kept
+        running; call stop_playwright before the loop ends.
+
+        Returns:
+            Started Playwright instance
+
+        Used in:
+        - tool.py
+        """
+        loop = asyncio.get_running_loop()
+        lock = cls._playwright_locks.setdefault(loop, asyncio.Lock())
+        async with lock:
+            playwright = cls._playwrights.get(loop)
+            if playwright is None:
+                # Imported here so that loading brosh (e.g. for `brosh --help`) does not load Playwright
+                from playwright.async_api import async_playwright
+
+                playwright = await async_playwright().start()
+                cls._playwrights[loop] = playwright
+        return playwright
+
+    @classmethod
+    async def stop_playwright(cls) -> None:
+        """Stop the running event loop's shared Playwright driver, if one was started.
+
+        Used in:
+        - api.py
+        """
+        playwright = cls._playwrights.pop(asyncio.get_running_loop(), None)
+        if playwright is not None:
+            await playwright.stop()
+
+    @staticmethod
+    def clear_caches() -> None:
+        """Forget the memoized screen and browser probes.
+
+        The display and the installed browsers are assumed not to change
+        while the process runs, so each probe is computed once and shared by
+        all instances. Call this when that assumption is broken (e.g. tests).
+        """
+        for probe in (
+            BrowserManager.get_screen_dimensions,
+            BrowserManager.get_browser_name,
+            BrowserManager.is_browser_available,
+            BrowserManager.find_browser_path,
+        ):
+            probe.cache_clear()
+
+    @staticmethod
+    @cache
+    def get_screen_dimensions() -> tuple[int, int]:
         """Get main screen dimensions in logical pixels for browser sizing.
 
+        The result is cached for the lifetime of the process.
+
         Returns:
             Tuple of (width, height) in logical pixels (CSS pixels)
 
         Used in:
         - tool.py
         """
-        if platform.system() == "Darwin":  # macOS
+        if _IS_DARWIN:  # macOS
+            if display_size := _macos_main_display_size():
+                return display_size
             try:
                 # Get physical resolution
                 system_profiler_path = shutil.which("system_profiler")
@@ -73,31 +428,23 @@ class BrowserManager:
                     logger.warning("system_profiler not found, using fallback dimensions.")
                     return DEFAULT_FALLBACK_WIDTH, DEFAULT_FALLBACK_HEIGHT
                 # This is a blocking call, but get_screen_dimensions is a sync utility function.
+                # "mini" skips the slow GPU/driver enumeration; Resolution lines are kept
                 result = subprocess.run(
-                    [system_profiler_path, "SPDisplaysDataType"],
+                    [system_profiler_path, "SPDisplaysDataType", "-detailLevel", "mini"],
                     capture_output=True,
                     text=True,
                     check=True,
                     timeout=SUBPROCESS_TIMEOUT,
                 )
-                for line in result.stdout.split("\n"):
-                    if "Resolution:" in line:
-                        parts = line.split()
-                        for i, part in enumerate(parts):
-                            if "x" in part and i > 0:
-                                physical_width = int(parts[i - 1])
-                                physical_height = int(parts[i + 1])
-
-                                # Check if it's a Retina display
-                                if "Retina" in line or physical_width >= RETINA_MIN_WIDTH:
-                                    # Retina: logical = physical / 2
-                                    return (
-                                        physical_width // 2,
-                                        physical_height // 2,
-                                    )
-                                # Non-Retina: logical = physical
-                                return physical_width, physical_height
-                        break
+                if match := _RESOLUTION_RE.search(result.stdout):
+                    physical_width, physical_height = int(match["width"]), int(match["height"])
+
+                    # Check if it's a Retina display
+                    if "Retina" in match["rest"] or physical_width >= RETINA_MIN_WIDTH:
+                        # Retina: logical = physical / 2
+                        return physical_width // 2, physical_height // 2
+                    # Non-Retina: logical = physical
+                    return physical_width, physical_height
 
             except subprocess.CalledProcessError as e:
                 logger.warning(f"system_profiler call failed: {e}, using fallback dimensions.")
@@ -108,7 +455,9 @@ class BrowserManager:
             except Exception as e:  # Catch any other unexpected error
                 logger.warning(f"Unexpected error getting macOS screen dimensions: {e}, using fallback dimensions.")
 
-        elif platform.system() == "Windows":
+        elif _IS_WINDOWS:
+            if screen_size := _windows_screen_size():
+                return screen_size
             try:
                 import tkinter as tk
 
@@ -124,11 +473,14 @@ class BrowserManager:
         # Default fallback for unknown systems or errors
         return DEFAULT_FALLBACK_WIDTH, DEFAULT_FALLBACK_HEIGHT  # Common laptop logical resolution
 
-    def get_browser_name(self, app: str = "") -> str:
+    @staticmethod
+    @cache
+    def get_browser_name(app: str = "") -> str:
         """Determine browser name from app parameter or OS default.
 
         Priority order: Chrome > Edge > Safari (macOS only)
-        Firefox support removed per user request.
+        Firefox support removed per user request. The result is cached per
+        ``app`` for the lifetime of the process.
 
         Args:
             app: User-specified browser preference
@@ -140,33 +492,33 @@ class BrowserManager:
         - cli.py
         - tool.py
         """
-        if bool(app):
-            app_lower = app.lower()
-            if "chrome" in app_lower:
-                return "chrome"
-            if "edge" in app_lower:
-                return "edge"
-            if "safari" in app_lower and platform.system() == "Darwin":
-                return "safari"
+        app_lower = app.lower()
+        for alias, browser in APP_NAME_ALIASES.items():
+            if alias in app_lower and (browser != "safari" or _IS_DARWIN):
+                return browser
 
         # Auto-detect available browser in priority order
-        if platform.system() == "Darwin":  # macOS
+        if _IS_DARWIN:  # macOS
             # Priority: Chrome > Edge > Safari
             for browser in ["chrome", "edge", "safari"]:
-                if self.is_browser_available(browser):
+                if BrowserManager.is_browser_available(browser):
                     return browser
         else:  # Windows/Linux
             # Priority: Chrome > Edge
             for browser in ["chrome", "edge"]:
-                if self.is_browser_available(browser):
+                if BrowserManager.is_browser_available(browser):
                     return browser
 
         # Fallback
         return "chrome"
 
-    def is_browser_available(self, browser_name: str) -> bool:
+    @staticmethod
+    @cache
+    def is_browser_available(browser_name: str) -> bool:
         """Check if browser is installed and available.
 
+        The result is cached per browser for the lifetime of the process.
+
         Args:
             browser_name: Browser name to check
 
@@ -174,12 +526,10 @@ class BrowserManager:
             True if browser is available
 
         """
-        paths = self.get_browser_paths(browser_name)
-
-        # Check if any path exists
-        return any(Path(path).exists() for path in paths)
+        return BrowserManager.find_browser_path(browser_name) is not None
 
-    def get_browser_paths(self, browser_name: str) -> list:
+    @staticmethod
+    def get_browser_paths(browser_name: str) -> list:
         """Get possible paths for a browser.
 
         Args:
@@ -189,29 +539,17 @@ class BrowserManager:
             List of possible paths
 
         """
-        if browser_name == "chrome":
-            return [
-                "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
-                "/Applications/Chromium.app/Contents/MacOS/Chromium",
-                "/usr/bin/google-chrome",
-                "/usr/bin/chromium-browser",
-                "/opt/google/chrome/chrome",
-                "C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe",
-                "C:\\Program Files (x86)\\Google\\Chrome\\Application\\chrome.exe",
-            ]
-        if browser_name == "edge":
-            return [
-                "/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge",
-                "C:\\Program Files (x86)\\Microsoft\\Edge\\Application\\msedge.exe",
-                "C:\\Program Files\\Microsoft\\Edge\\Application\\msedge.exe",
-            ]
-        if browser_name == "safari":
-            return ["/Applications/Safari.app/Contents/MacOS/Safari"]
-        return []
+        return list(BROWSER_PATHS.get(browser_name, ()))
 
-    def find_browser_path(self, browser_name: str) -> str | None:
+    @staticmethod
+    @cache
+    def find_browser_path(browser_name: str) -> str | None:
         """Find the path to the specified browser executable.
 
+        PATH is searched first, which also finds distro packages and per-user
+        installs; the well-known install locations are the fallback. The
+        result is cached per browser for the lifetime of the process.
+
         Args:
             browser_name: Name of the browser to find
 
@@ -221,16 +559,34 @@ class BrowserManager:
         Used in:
         - cli.py
         """
-        paths = self.get_browser_paths(browser_name)
+        for exe_name in BROWSER_EXECUTABLE_NAMES.get(browser_name, ()):
+            if exe_path := shutil.which(exe_name):
+                return exe_path
+        return _first_existing_path(BrowserManager.get_browser_paths(browser_name))
 
-        return next((path_str for path_str in paths if Path(path_str).exists()), None)
+    @staticmethod
+    def _launch_candidates(browser_name: str) -> list[str]:
+        """List the installed executables of a browser, best first.
+
+        Args:
+            browser_name: Browser name
+
+        Returns:
+            Existing executable paths: the PATH hit first, then install locations
+
+        """
+        candidates = [BrowserManager.find_browser_path(browser_name), *BrowserManager.get_browser_paths(browser_name)]
+        return list(_existing_paths(list(dict.fromkeys(path for path in candidates if path))))
 
     async def get_browser_instance(self, playwright, browser_name: str, width: int, height: int, zoom: int) -> tuple:
         """Get browser instance, connecting to user's actual browser.
 
         This method tries to connect to the user's existing browser in
         debug mode. If that fails, it will attempt to restart the browser
-        in debug mode.
+        in debug mode. Chrome/Edge connections are cached on the manager and
+        reused by later calls for as long as they stay connected; each call
+        gets a fresh page in a context shared by calls with the same viewport
+        and zoom.
 
         Args:
             playwright: Playwright instance
@@ -248,32 +604,30 @@ class BrowserManager:
         Used in:
         - tool.py
         """
+        async with self._instance_lock:
+            return await self._get_browser_instance(playwright, browser_name, width, height, zoom)
+
+    async def _get_browser_instance(self, playwright, browser_name: str, width: int, height: int, zoom: int) -> tuple:
+        """Connect or launch the browser and open a page; see get_browser_instance."""
         debug_port = self.debug_ports.get(browser_name, 9222)
 
+        cache_key = (browser_name, debug_port)
+
         # Try to connect to existing browser instance first
-        browser = None
+        browser = self._browser_cache.get(cache_key)
+        if browser is not None and not browser.is_connected():
+            self._forget_browser(cache_key)
+            browser = None
         try:
-            if browser_name in ["chrome", "edge"]:
+            if browser is None and browser_name in ["chrome", "edge"]:
                 browser = await playwright.chromium.connect_over_cdp(
                     f"http://localhost:{debug_port}",
                     timeout=self.connection_timeout * 1000,
                 )
+                self._browser_cache[cache_key] = browser
 
             if browser:
-                # Don't set device_scale_factor - let browser use natural scaling
-                # Use default height if height is -1 (capture entire page)
-                viewport_height = height if height != -1 else DEFAULT_VIEWPORT_HEIGHT_IF_FULLPAGE
-                context = await browser.new_context(viewport={"width": width, "height": viewport_height})
-                page = await context.new_page()
-
-                # Apply zoom via CSS instead of device scale factor
-                if zoom != DEFAULT_ZOOM_LEVEL:  # PLR2004
-                    await page.add_init_script(f"""
-                        document.addEventListener('DOMContentLoaded', () => {{
-                            document.body.style.zoom = '{zoom}%';
-                        }});
-                    """)
-
+                context, page = await self._create_context_and_page(browser, width, height, zoom)
                 return browser, context, page
         except Exception as e:
             logger.info(f"Could not connect to existing browser: {e}")
@@ -281,38 +635,22 @@ class BrowserManager:
 
         # If we can't connect, try to launch the user's actual browser
         # in debug mode (not Playwright's browser)
+        self._forget_browser(cache_key)
         browser = None
 
-        if browser_name == "chrome":
-            # Try to launch user's Chrome in debug mode
-            chrome_paths = self.get_browser_paths("chrome")
-
-            for chrome_path in chrome_paths:
-                if await self.launch_browser_and_connect(
-                    chrome_path,
-                    debug_port,
-                    width,
-                    height,
-                    playwright.chromium,
-                    "chrome",
-                ):
-                    browser = await playwright.chromium.connect_over_cdp(f"http://localhost:{debug_port}")
-                    break
-
-        elif browser_name == "edge":
-            # Try to launch user's Edge in debug mode
-            edge_paths = self.get_browser_paths("edge")
-
-            for edge_path in edge_paths:
-                if await self.launch_browser_and_connect(
-                    edge_path,
+        if browser_name in ["chrome", "edge"]:
+            # Try to launch the user's own installs in debug mode, best first;
+            # candidates that are not installed are skipped without a launch attempt
+            for browser_path in self._launch_candidates(browser_name):
+                browser = await self.launch_browser_and_connect(
+                    browser_path,
                     debug_port,
                     width,
                     height,
                     playwright.chromium,
-                    "edge",
-                ):
-                    browser = await playwright.chromium.connect_over_cdp(f"http://localhost:{debug_port}")
+                    browser_name,
+                )
+                if browser:
                     break
 
         elif browser_name == "safari":
@@ -330,22 +668,65 @@ class BrowserManager:
             )
             raise RuntimeError(msg)
 
-        # Create context without device scale factor to avoid scaling issues
-        # Use default height if height is -1 (capture entire page)
-        viewport_height = height if height != -1 else DEFAULT_VIEWPORT_HEIGHT_IF_FULLPAGE
-        context = await browser.new_context(viewport={"width": width, "height": viewport_height})
-        page = await context.new_page()
-
-        # Apply zoom via CSS instead of device scale factor
-        if zoom != DEFAULT_ZOOM_LEVEL:  # PLR2004
-            await page.add_init_script(f"""
-                document.addEventListener('DOMContentLoaded', () => {{
-                    document.body.style.zoom = '{zoom}%';
-                }});
-            """)
+        if browser_name in ["chrome", "edge"]:
+            self._browser_cache[cache_key] = browser
 
+        context, page = await self._create_context_and_page(browser, width, height, zoom)
         return browser, context, page
 
+    def _forget_browser(self, cache_key: tuple[str, int]) -> None:
+        """Drop a cached connection together with the contexts opened in it.
+
+        Args:
+            cache_key: (browser name, debug port) of the connection
+        """
+        browser = self._browser_cache.pop(cache_key, None)
+        if browser is not None:
+            for key in [key for key in self._context_cache if key[0] is browser]:
+                del self._context_cache[key]
+
+    async def _create_context_and_page(self, browser, width: int, height: int, zoom: int) -> tuple:
+        """Open a page sized to the viewport, applying the zoom.
+
+        Pages of cached connections share one context per viewport size and
+        zoom; other browsers get a context of their own.
+
+        Args:
+            browser: Connected Playwright browser
+            width: Viewport width
+            height: Viewport height, or -1 to capture the entire page
+            zoom: Zoom level percentage
+
+        Returns:
+            Tuple of (context, page)
+
+        """
+        # Don't set device_scale_factor - let browser use natural scaling
+        # Use default height if height is -1 (capture entire page)
+        viewport_height = height if height != -1 else DEFAULT_VIEWPORT_HEIGHT_IF_FULLPAGE
+        context_key = (browser, width, viewport_height, zoom)
+        context = self._context_cache.get(context_key)
+        page = None
+        if context is not None:
+            try:
+                page = await context.new_page()
+            except Exception as e:
+                # E.g. the user closed the window the context lived in
+                logger.debug(f"Cached browser context is unusable, opening a new one: {e}")
+                del self._context_cache[context_key]
+                context = None
+        if context is None:
+            context = await browser.new_context(viewport={"width": width, "height": viewport_height})
+            # Apply zoom via CSS instead of device scale factor; registered on
+            # the context, it covers every page later opened in it
+            if zoom != DEFAULT_ZOOM_LEVEL:
+                await context.add_init_script(ZOOM_INIT_SCRIPT.format(zoom=zoom))
+            if any(browser is cached for cached in self._browser_cache.values()):
+                self._context_cache[context_key] = context
+            page = await context.new_page()
+
+        return context, page
+
     async def launch_browser_and_connect(
         self,
         browser_path: str,
@@ -354,8 +735,8 @@ class BrowserManager:
         height: int,
         playwright_browser,
         browser_type: str,
-    ) -> bool:
-        """Launch browser with debug mode and test connection.
+    ):
+        """Launch browser with debug mode and connect to it.
 
         Args:
             browser_path: Path to browser executable
@@ -366,49 +747,35 @@ class BrowserManager:
             browser_type: Type of browser (chrome, edge)
 
         Returns:
-            True if successfully launched and connected
+            Connected Playwright browser, or None if launching or connecting failed
 
         """
         if not Path(browser_path).exists():
             logger.debug(f"Browser path does not exist: {browser_path}")
-            return False
+            return None
 
         try:
             # Kill existing processes with same debug port - more aggressive cleanup
             try:
-                if platform.system() == "Darwin":  # macOS
+                if HAS_PSUTIL:
+                    await asyncio.to_thread(_kill_debug_processes, debug_port)
+                elif _IS_DARWIN:  # macOS
                     if pkill_path := shutil.which("pkill"):
                         # Kill by process name and port
-                        # These are fire-and-forget, so not strictly blocking the async flow.
-                        subprocess.Popen(
-                            [pkill_path, "-f", f"remote-debugging-port={debug_port}"],
-                            stdout=subprocess.DEVNULL,
-                            stderr=subprocess.DEVNULL,
-                        )
+                        await _run_cleanup_command(pkill_path, "-f", f"remote-debugging-port={debug_port}")
                         # Also try killing by process name
                         if "chrome" in browser_path.lower():
-                            subprocess.Popen(
-                                [pkill_path, "-f", "Google Chrome.*remote-debugging"],
-                                stdout=subprocess.DEVNULL,
-                                stderr=subprocess.DEVNULL,
-                            )
+                            await _run_cleanup_command(pkill_path, "-f", "Google Chrome.*remote-debugging")
                     else:
                         logger.warning("pkill command not found for process cleanup.")
                 else:  # Windows/Linux
                     taskkill_path = shutil.which("taskkill")
                     if taskkill_path:
-                        subprocess.Popen(
-                            [taskkill_path, "/F", "/IM", "chrome.exe"],  # General cleanup for Chrome
-                            stdout=subprocess.DEVNULL,
-                            stderr=subprocess.DEVNULL,
-                        )
+                        # General cleanup for Chrome
+                        await _run_cleanup_command(taskkill_path, "/F", "/IM", "chrome.exe")
                         # Add similar for Edge if browser_type is edge
                         if "edge" in browser_path.lower():
-                            subprocess.Popen(
-                                [taskkill_path, "/F", "/IM", "msedge.exe"],
-                                stdout=subprocess.DEVNULL,
-                                stderr=subprocess.DEVNULL,
-                            )
+                            await _run_cleanup_command(taskkill_path, "/F", "/IM", "msedge.exe")
                     else:
                         logger.warning("taskkill command not found for process cleanup.")
             except Exception as e:
@@ -420,54 +787,33 @@ class BrowserManager:
             if browser_type in ["chrome", "edge"]:
                 args = [
                     browser_path,
-                    f"--remote-debugging-port={debug_port}",
-                    "--no-startup-window",
-                    "--noerrdialogs",
-                    "--no-user-gesture-required",
-                    "--no-network-profile-warning",
-                    "--no-first-run",
-                    "--no-experiments",
-                    "--no-default-browser-check",
+                    *self.get_browser_args(browser_type, width, height, debug_port),
                     "--remote-debug-mode",
-                    "--disable-web-security",
-                    "--disable-features=VizDisplayCompositor",
-                    "--disable-background-timer-throttling",
-                    "--disable-backgrounding-occluded-windows",
-                    "--disable-renderer-backgrounding",
-                    "--disable-infobars",
-                    "--disable-extensions",
-                    "--disable-sync",
-                    "--disable-translate",
-                    "--disable-background-networking",
-                    f"--window-size={width},{height}",
-                    "--user-data-dir=/tmp/chrome-debug-brosh",
                 ]
             else:
-                return False
+                return None
 
             logger.info(f"Launching {browser_type} with debug port {debug_port}")
+            # Popen, not asyncio's subprocess: the browser must outlive this event loop,
+            # and asyncio kills children whose transport is closed with the loop.
             process = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
             # Wait for browser to start and test connection more robustly
-            for attempt in range(BROWSER_CONNECT_MAX_ATTEMPTS):  # More attempts
-                await asyncio.sleep(BROWSER_CONNECT_RETRY_INTERVAL_SECONDS)  # Shorter intervals
+            for attempt, delay in enumerate(_connect_retry_delays()):
+                await asyncio.sleep(delay)
                 try:
-                    if browser_type in ["chrome", "edge"]:
-                        test_browser = await playwright_browser.connect_over_cdp(
-                            f"http://localhost:{debug_port}", timeout=BROWSER_CONNECT_CDP_TIMEOUT_MS
-                        )
-                    else:
-                        return False
-
-                    # Test that we can actually create a page
-                    test_context = await test_browser.new_context()
-                    test_page = await test_context.new_page()
-                    await test_page.close()
-                    await test_context.close()
-                    await test_browser.close()
-
+                    # A bare TCP connect is much cheaper than a CDP handshake
+                    # while the browser is still starting up
+                    if not await _debug_port_open(debug_port):
+                        msg = f"debug port {debug_port} is not accepting connections yet"
+                        raise ConnectionRefusedError(msg)
+                    # A successful CDP handshake proves the browser is up; the
+                    # connection is handed to the caller instead of being re-made
+                    browser = await playwright_browser.connect_over_cdp(
+                        f"http://localhost:{debug_port}", timeout=BROWSER_CONNECT_CDP_TIMEOUT_MS
+                    )
                     logger.info(f"Successfully launched {browser_type} at {browser_path}")
-                    return True
+                    return browser
 
                 except Exception as e:
                     logger.debug(f"Connection attempt {attempt + 1}/{BROWSER_CONNECT_MAX_ATTEMPTS} failed: {e}")
@@ -475,23 +821,26 @@ class BrowserManager:
                         # Kill the process we started if it's still running
                         try:
                             process.terminate()
-                            await asyncio.sleep(BROWSER_CONNECT_RETRY_INTERVAL_SECONDS)
+                            await asyncio.sleep(BROWSER_TERMINATE_GRACE_SECONDS)
                             if process.poll() is None:
                                 process.kill()
                         except Exception:
                             pass
-                        return False
+                        return None
                     continue
 
         except Exception as e:
             logger.error(f"Failed to launch {browser_type} at {browser_path}: {e}")
-            return False
+            return None
 
-        return False  # Explicit return for all paths
+        return None  # Explicit return for all paths
 
     async def cleanup_browser(self, page, context, browser) -> None:
         """Clean up browser resources safely.
 
+        The page is closed; a context or browser held in the manager's caches
+        is left open for reuse until shutdown.
+
         Args:
             page: Playwright page instance
             context: Playwright context instance
@@ -500,25 +849,32 @@ class BrowserManager:
         Used in:
         - tool.py
         """
-        try:
-            if page:
-                await page.close()
-        except Exception as e:
-            logger.warning(f"Failed to close page: {e}")
-
-        try:
-            if context:
-                await context.close()
-        except Exception as e:
-            logger.warning(f"Failed to close context: {e}")
-
-        try:
-            if hasattr(browser, "_browser") and browser._browser:
-                await browser.close()
-        except Exception as e:
-            logger.warning(f"Failed to close browser: {e}")
-
-    def get_browser_args(self, browser_type: str, width: int, height: int, debug_port: int) -> list:
+        keep_browser = any(browser is cached for cached in self._browser_cache.values())
+        close_browser = not keep_browser and hasattr(browser, "_browser") and browser._browser
+        keep_context = any(context is cached for cached in self._context_cache.values())
+        # Independent CDP round trips, so they are sent together rather than one after another
+        await asyncio.gather(
+            _close_quietly(page, "page"),
+            _close_quietly(None if keep_context else context, "context"),
+            _close_quietly(browser if close_browser else None, "browser"),
+        )
+
+    async def shutdown(self) -> None:
+        """Close the cached contexts and disconnect from the cached browsers.
+
+        The browsers themselves keep running; only this manager's contexts and
+        connections to them are closed.
+        """
+        contexts = list(self._context_cache.values())
+        browsers = list(self._browser_cache.values())
+        self._context_cache.clear()
+        self._browser_cache.clear()
+        await asyncio.gather(*(_close_quietly(context, "context") for context in contexts))
+        await asyncio.gather(*(_close_quietly(browser, "browser") for browser in browsers))
+
+    def get_browser_args(
+        self, browser_type: str, width: int, height: int, debug_port: int, *, headless: bool = False
+    ) -> list:
         """Get browser launch arguments.
 
         Args:
@@ -526,6 +882,7 @@ class BrowserManager:
             width: Window width
             height: Window height
             debug_port: Debug port
+            headless: Launch without a window (keyword-only)
 
         Returns:
             List of command line arguments
@@ -536,24 +893,9 @@ class BrowserManager:
         if browser_type in ["chrome", "edge"]:
             return [
                 f"--remote-debugging-port={debug_port}",
-                "--no-startup-window",
-                "--noerrdialogs",
-                "--no-user-gesture-required",
-                "--no-network-profile-warning",
-                "--no-first-run",
-                "--no-experiments",
-                "--no-default-browser-check",
-                "--disable-web-security",
-                "--disable-features=VizDisplayCompositor",
-                "--disable-background-timer-throttling",
-                "--disable-backgrounding-occluded-windows",
-                "--disable-renderer-backgrounding",
-                "--disable-infobars",
-                "--disable-extensions",
-                "--disable-sync",
-                "--disable-translate",
-                "--disable-background-networking",
+                *CHROMIUM_DEBUG_ARGS,
                 f"--window-size={width},{height}",
-                "--user-data-dir=/tmp/chrome-debug-brosh",
+                f"--user-data-dir={_debug_profile_dir(browser_type, debug_port)}",
+                *(CHROMIUM_HEADLESS_ARGS if headless else ()),
             ]
         return []
@@ -5,20 +5,67 @@
 
 import asyncio
 from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger
-from playwright.async_api import Page
-from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
-from .models import CaptureConfig, CaptureFrame
+from .image import JPEG_QUALITY
+from .models import CaptureConfig, CaptureFrame, ImageFormat
 from .texthtml import DOMProcessor
 
-# Seconds to wait after page.goto() for dynamic content to load
-PAGE_LOAD_DYNAMIC_CONTENT_WAIT_SECONDS = 3
-# Seconds to wait after scrolling to a specific selector
-SCROLL_TO_SELECTOR_WAIT_SECONDS = 1
-# Seconds to wait after scrolling to a position before taking a screenshot
-SCROLL_AND_CONTENT_WAIT_SECONDS = 0.8
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+# Longest wait after page.goto() for the network to go quiet (dynamic content)
+NETWORK_IDLE_TIMEOUT_SECONDS = 3
+# Seconds allowed on top of Playwright's own timeouts before asyncio.wait_for
+# gives up on a call whose CDP connection has hung
+PLAYWRIGHT_TIMEOUT_SLACK_SECONDS = 2
+# Milliseconds to wait for the post-scroll paint before capturing anyway
+SCROLL_PAINT_TIMEOUT_MS = 800
+# Document height and viewport height, read in one round-trip
+PAGE_DIMENSIONS_JS = "() => [document.documentElement.scrollHeight, window.innerHeight]"
+
+# Promise resolving once the browser has painted the current scroll position:
+# the second animation frame only starts after the first was rendered. The
+# timer covers windows whose animation frames are throttled.
+_WAIT_FOR_PAINT_JS = f"""new Promise(resolve => {{
+        requestAnimationFrame(() => requestAnimationFrame(resolve));
+        setTimeout(resolve, {SCROLL_PAINT_TIMEOUT_MS});
+    }})"""
+
+# Scrolls the first element matching the selector to the top of the viewport,
+# waits for the paint and returns its document Y offset, or 0 if nothing matches
+SCROLL_TO_SELECTOR_JS = f"""async (selector) => {{
+    const element = document.querySelector(selector);
+    if (!element) return 0;
+    element.scrollIntoView({{behavior: 'instant', block: 'start'}});
+    const top = element.getBoundingClientRect().top + window.pageYOffset;
+    await {_WAIT_FOR_PAINT_JS};
+    return top;
+}}"""
+
+# Scrolls to the given offset and resolves once the browser has painted it
+SCROLL_AND_WAIT_FOR_PAINT_JS = f"""(y) => {{
+    window.scrollTo(0, y);
+    return {_WAIT_FOR_PAINT_JS};
+}}"""
+
+
+def _screenshot_encoding(image_format: ImageFormat) -> dict[str, Any]:
+    """Keyword arguments for page.screenshot that select the image encoding.
+
+    Args:
+        image_format: PNG or JPG
+
+    Returns:
+        Keyword arguments for page.screenshot
+
+    """
+    if image_format == ImageFormat.JPG:
+        return {"type": "jpeg", "quality": JPEG_QUALITY}
+    return {"type": "png"}
 
 
 class CaptureManager:
@@ -40,12 +87,21 @@ class CaptureManager:
         self.screenshot_timeout = screenshot_timeout
         self.dom_processor = DOMProcessor()
 
-    async def capture_frames(self, page: Page, config: CaptureConfig) -> list[CaptureFrame]:
+    async def capture_frames(
+        self,
+        page: "Page",
+        config: CaptureConfig,
+        spool_dir: Path | None = None,
+        image_format: ImageFormat = ImageFormat.PNG,
+    ) -> list[CaptureFrame]:
         """Capture all viewport frames.
 
         Args:
             page: Playwright page instance
             config: Capture configuration
+            spool_dir: Directory to write each screenshot to as soon as it is
+                taken, instead of keeping it in memory on the frame
+            image_format: Encoding the browser uses for the screenshots (PNG or JPG)
 
         Returns:
             List of captured frames with metadata
@@ -53,24 +109,37 @@ class CaptureManager:
         Used in:
         - tool.py
         """
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
         # Navigate to URL
         try:
             logger.info(f"Navigating to {config.url}")
-            await page.goto(
-                str(config.url),
-                wait_until="domcontentloaded",
-                timeout=self.page_timeout * 1000,
+            await asyncio.wait_for(
+                page.goto(
+                    str(config.url),
+                    wait_until="domcontentloaded",
+                    timeout=self.page_timeout * 1000,
+                ),
+                timeout=self.page_timeout + PLAYWRIGHT_TIMEOUT_SLACK_SECONDS,
             )
-            await asyncio.sleep(PAGE_LOAD_DYNAMIC_CONTENT_WAIT_SECONDS)  # Wait for dynamic content
-        except PlaywrightTimeoutError:
+        except (PlaywrightTimeoutError, asyncio.TimeoutError):
             logger.warning("Page load timeout, proceeding anyway")
 
+        # Give dynamic content time to load, but only until the network goes quiet
+        try:
+            await asyncio.wait_for(
+                page.wait_for_load_state("networkidle", timeout=NETWORK_IDLE_TIMEOUT_SECONDS * 1000),
+                timeout=NETWORK_IDLE_TIMEOUT_SECONDS + PLAYWRIGHT_TIMEOUT_SLACK_SECONDS,
+            )
+        except (PlaywrightTimeoutError, asyncio.TimeoutError):
+            logger.debug("Network still busy, proceeding anyway")
+
         # Handle from_selector if specified
         start_position = await self._handle_from_selector(page, config.from_selector)
 
         # Get page dimensions
-        total_height = await page.evaluate("document.documentElement.scrollHeight")
-        viewport_height = config.height if config.height != -1 else await page.evaluate("window.innerHeight")
+        total_height, inner_height = await page.evaluate(PAGE_DIMENSIONS_JS)
+        viewport_height = config.height if config.height != -1 else inner_height
 
         # Calculate scroll positions
         scroll_positions = self._calculate_scroll_positions(
@@ -87,14 +156,21 @@ class CaptureManager:
         frames = []
         for pos in scroll_positions:
             frame = await self._capture_single_frame(
-                page, pos, total_height, viewport_height, fetch_html=config.fetch_html
+                page,
+                pos,
+                total_height,
+                viewport_height,
+                fetch_html=config.fetch_html,
+                paint_settle_ms=config.paint_settle_ms,
+                spool_dir=spool_dir,
+                image_format=image_format,
             )
             if frame:
                 frames.append(frame)
 
         return frames
 
-    async def _handle_from_selector(self, page: Page, from_selector: str) -> int:
+    async def _handle_from_selector(self, page: "Page", from_selector: str) -> int:
         """Handle from_selector to determine starting position.
 
         Args:
@@ -110,18 +186,8 @@ class CaptureManager:
 
         try:
             logger.info(f"Scrolling to element: {from_selector}")
-            start_position = await page.evaluate(f"""
-                (() => {{
-                    const element = document.querySelector('{from_selector}');
-                    if (element) {{
-                        element.scrollIntoView({{behavior: 'instant', block: 'start'}});
-                        return element.getBoundingClientRect().top + window.pageYOffset;
-                    }}
-                    return 0;
-                }})()
-            """)
-            await asyncio.sleep(SCROLL_TO_SELECTOR_WAIT_SECONDS)
-            return start_position
+            # The selector is passed as an argument, never spliced into the source
+            return await page.evaluate(SCROLL_TO_SELECTOR_JS, from_selector)
         except Exception as e:
             logger.warning(f"Failed to find selector '{from_selector}': {e}")
             return 0
@@ -142,26 +208,24 @@ class CaptureManager:
             List of Y positions to capture
 
         """
-        positions = []
-        current_pos = start_pos
-
-        while current_pos < page_height:
-            positions.append(int(current_pos))
-            current_pos += int(viewport_height * scroll_step / 100)
-
+        # A zero step (tiny viewport) would otherwise never reach the page end
+        step = max(int(viewport_height * scroll_step / 100), 1)
+        positions = range(int(start_pos), page_height, step)
         if max_frames > 0:
             positions = positions[:max_frames]
-
-        return positions
+        return list(positions)
 
     async def _capture_single_frame(
         self,
-        page: Page,
+        page: "Page",
         scroll_pos: int,
         page_height: int,
         viewport_height: int,
         *,
         fetch_html: bool,  # fetch_html is already keyword-only
+        paint_settle_ms: int = 0,
+        spool_dir: Path | None = None,
+        image_format: ImageFormat = ImageFormat.PNG,
     ) -> CaptureFrame | None:
         """Capture a single viewport frame.
 
@@ -171,50 +235,93 @@ class CaptureManager:
             page_height: Total page height
             viewport_height: Viewport height
             fetch_html: Whether to capture HTML content (keyword-only)
+            paint_settle_ms: Extra wait after the scroll has painted (keyword-only)
+            spool_dir: Directory to write the screenshot to (keyword-only)
+            image_format: Screenshot encoding, PNG or JPG (keyword-only)
 
         Returns:
             CaptureFrame or None if capture failed
 
         """
-        try:
-            # Scroll to position
-            await page.evaluate(f"window.scrollTo(0, {scroll_pos})")
-            await asyncio.sleep(SCROLL_AND_CONTENT_WAIT_SECONDS)  # Wait for scroll and content
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
-            # Capture screenshot as bytes
-            screenshot_bytes = await page.screenshot(
-                full_page=False,
-                timeout=self.screenshot_timeout * 1000,
+        try:
+            # One deadline covers the whole frame: scrolling, settling and the
+            # screenshot and DOM reads. A page that hangs in any of them costs
+            # this frame only, and the loop moves on to the next position.
+            # The slack also absorbs the scroll's paint wait, capped in JS.
+            screenshot_bytes, (visible_html, visible_text, active_selector, section_id) = await asyncio.wait_for(
+                self._scroll_and_read_frame(
+                    page, scroll_pos, fetch_html=fetch_html, paint_settle_ms=paint_settle_ms, image_format=image_format
+                ),
+                timeout=self.screenshot_timeout + PLAYWRIGHT_TIMEOUT_SLACK_SECONDS + paint_settle_ms / 1000,
             )
 
-            # Get section identifier
-            await self.dom_processor.get_section_id(page)
-
-            # Extract content if needed
-            visible_html = None
-            visible_text = None
-            active_selector = "body"
-
-            if fetch_html:
-                visible_html, visible_text, active_selector = await self.dom_processor.extract_visible_content(page)
-            else:
-                # Always get text and selector for metadata
-                _, visible_text, active_selector = await self.dom_processor.extract_visible_content(page)
+            image_path = None
+            if spool_dir is not None:
+                image_path = spool_dir / f"frame-{scroll_pos:08d}{image_format.file_extension}"
+                await asyncio.to_thread(image_path.write_bytes, screenshot_bytes)
+                screenshot_bytes = None
 
             return CaptureFrame(
                 image_bytes=screenshot_bytes,
+                image_path=image_path,
+                image_format=image_format,
                 scroll_position_y=scroll_pos,
                 page_height=page_height,
                 viewport_height=viewport_height,
                 active_selector=active_selector,
+                section_id=section_id,
                 visible_html=visible_html,
                 visible_text=visible_text,
                 timestamp=datetime.now(timezone.utc),  # Ensured timezone.utc is used
             )
 
-        except PlaywrightTimeoutError:
-            logger.warning(f"Screenshot timeout for position {scroll_pos}")
+        except (PlaywrightTimeoutError, asyncio.TimeoutError):
+            logger.warning(f"Frame capture timeout for position {scroll_pos}")
             return None
         except Exception as e:
             logger.error(f"Failed to capture frame at position {scroll_pos}: {e}")
             return None
+
+    async def _scroll_and_read_frame(
+        self,
+        page: "Page",
+        scroll_pos: int,
+        *,
+        fetch_html: bool,
+        paint_settle_ms: int,
+        image_format: ImageFormat,
+    ) -> tuple[bytes, tuple[str | None, str, str, str]]:
+        """Scroll to a position, then take the screenshot and read the DOM.
+
+        Args:
+            page: Playwright page instance
+            scroll_pos: Y position to scroll to
+            fetch_html: Whether to capture HTML content (keyword-only)
+            paint_settle_ms: Extra wait after the scroll has painted (keyword-only)
+            image_format: Screenshot encoding, PNG or JPG (keyword-only)
+
+        Returns:
+            Screenshot bytes and the (html, text, selector, section id) DOM content
+
+        """
+        # Scroll to position and wait until the browser has painted it
+        await page.evaluate(SCROLL_AND_WAIT_FOR_PAINT_JS, scroll_pos)
+        if paint_settle_ms:
+            await asyncio.sleep(paint_settle_ms / 1000)  # Let animated content settle
+
+        # The screenshot and the DOM read do not depend on each other once
+        # scrolling is done, so their round-trips overlap
+        screenshot_bytes, content = await asyncio.gather(
+            page.screenshot(
+                full_page=False,
+                # Finish CSS animations and transitions before capturing, so no
+                # frame catches content halfway through animating in
+                animations="disabled",
+                timeout=self.screenshot_timeout * 1000,
+                **_screenshot_encoding(image_format),
+            ),
+            self.dom_processor.extract_all_for_frame(page, include_html=fetch_html),
+        )
+        return screenshot_bytes, content
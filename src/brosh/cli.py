@@ -5,37 +5,64 @@
 
 import inspect
 import json
-import platform
 import shutil
+import socket
 import subprocess
 import sys
 import time
+import urllib.request
 from pathlib import Path
 from typing import Any
 
 import fire
 from loguru import logger
 
-from .api import capture_webpage
+from .api import DEFAULT_BATCH_CONCURRENCY, capture_webpage, capture_webpages
 
 # Removed unused ImageFormat import: from .models import ImageFormat
-from .browser import DEFAULT_FALLBACK_HEIGHT, DEFAULT_FALLBACK_WIDTH, BrowserManager
+from .browser import _IS_DARWIN, DEFAULT_FALLBACK_HEIGHT, DEFAULT_FALLBACK_WIDTH, BrowserManager
 from .tool import dflt_output_folder
 
 # Timeout for checking if browser is running via HTTP
 BROWSER_CHECK_TIMEOUT_SECONDS = 2
 # Seconds to wait after quitting browser before starting a new one
 BROWSER_RESTART_WAIT_SECONDS = 2
-# Max attempts to verify browser connection after launch
-BROWSER_CONNECT_VERIFY_ATTEMPTS = 10
-# Interval in seconds between browser connection verification attempts
-BROWSER_CONNECT_VERIFY_INTERVAL_SECONDS = 1
-# Timeout for pkill/taskkill subprocess calls
+# Max seconds to wait for a launched browser to open its debug port
+BROWSER_CONNECT_TIMEOUT_SECONDS = 10
+# Interval in seconds between debug port connection attempts
+BROWSER_PORT_POLL_INTERVAL_SECONDS = 0.05
+# Timeout for pkill/taskkill calls and for a launched browser to exit
 SUBPROCESS_PKILL_TIMEOUT_CLI = 5
 # Max length for text preview in CLI output
 CLI_TEXT_PREVIEW_LENGTH = 100
 
 
+def _wait_for_debug_port(debug_port: int, timeout: float = BROWSER_CONNECT_TIMEOUT_SECONDS) -> bool:
+    """Wait until something accepts TCP connections on the debug port.
+
+    A bare connect is enough to know the browser is up and far cheaper than
+    an HTTP round-trip, so the port can be polled at a short interval.
+
+    Args:
+        debug_port: Local port the browser was told to listen on
+        timeout: Max seconds to keep polling
+
+    Returns:
+        True once the port accepts a connection, False if the timeout passed
+
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with socket.create_connection(("127.0.0.1", debug_port), timeout=BROWSER_PORT_POLL_INTERVAL_SECONDS):
+                return True
+        except OSError as e:
+            if time.monotonic() >= deadline:
+                logger.debug(f"Debug port {debug_port} still closed after {timeout}s: {e}")
+                return False
+        time.sleep(BROWSER_PORT_POLL_INTERVAL_SECONDS)
+
+
 class BrowserScreenshotCLI:
     """Fire CLI interface for browser screenshot operations.
 
@@ -55,6 +82,7 @@ class BrowserScreenshotCLI:
         output_dir: Path | None = None,  # B008: Changed default
         *,
         subdirs: bool = False,
+        headless: bool = False,
         verbose: bool = False,
         json: bool = False,
     ) -> None:
@@ -67,6 +95,8 @@ class BrowserScreenshotCLI:
             zoom: Zoom level in % (default: 100)
             output_dir: Output folder for screenshots (default: user's pictures)
             subdirs: Create subfolders per domain
+            headless: Have `run` start the browser without a window. Starts
+                faster, but leaves no visible browser to debug in
             verbose: Enable debug logging
             json: Output results as JSON
 
@@ -75,10 +105,11 @@ class BrowserScreenshotCLI:
         self.width = width
         self.height = height
         self.zoom = zoom
-        if output_dir is None:  # B008: Added handling
-            output_dir = Path(dflt_output_folder())
-        self.output_dir = output_dir
+        # Resolved on first use, so commands that never save a screenshot
+        # (run, quit, mcp) skip the platformdirs lookup
+        self._output_dir = output_dir
         self.subdirs = subdirs
+        self.headless = headless
         self.json = json
         self.verbose = verbose
 
@@ -87,6 +118,15 @@ class BrowserScreenshotCLI:
             logger.add(sys.stderr, level="ERROR")
 
         self._browser_manager = BrowserManager()
+        # Browser started by this instance's `run`, which `quit` stops directly
+        self._browser_process: subprocess.Popen | None = None
+
+    @property
+    def output_dir(self) -> Path:
+        """Output folder for screenshots, defaulting to the user's pictures folder."""
+        if self._output_dir is None:
+            self._output_dir = Path(dflt_output_folder())
+        return self._output_dir
 
     def run(self, *, force_run: bool = False) -> str:
         """Run browser in remote debug mode.
@@ -109,8 +149,6 @@ class BrowserScreenshotCLI:
         # Check if already running
         if not force_run:
             try:
-                import urllib.request
-
                 urllib.request.urlopen(f"http://localhost:{debug_port}/json", timeout=BROWSER_CHECK_TIMEOUT_SECONDS)
                 return f"{browser_name} already running on port {debug_port}"
             except Exception:
@@ -137,27 +175,19 @@ class BrowserScreenshotCLI:
 
             args = [
                 browser_executable_path,
-                *self._browser_manager.get_browser_args(browser_name, width, height, debug_port),
+                *self._browser_manager.get_browser_args(
+                    browser_name, width, height, debug_port, headless=self.headless
+                ),
             ]
 
             if not args[1:]:  # No args returned (not chromium/msedge)
                 return f"Browser {browser_name} not supported for direct launch"
 
             logger.info(f"Starting {browser_name} with debug port {debug_port} using {browser_executable_path}")
-            subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-
-            # Wait and verify connection
-            for _attempt in range(BROWSER_CONNECT_VERIFY_ATTEMPTS):
-                time.sleep(BROWSER_CONNECT_VERIFY_INTERVAL_SECONDS)
-                try:
-                    import urllib.request
-
-                    urllib.request.urlopen(f"http://localhost:{debug_port}/json", timeout=BROWSER_CHECK_TIMEOUT_SECONDS)
-                    return f"Started {browser_name} in debug mode on port {debug_port}"
-                except Exception as e:
-                    logger.debug(f"Connection verification attempt failed for port {debug_port}: {e}")
-                    continue
+            self._browser_process = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
+            if _wait_for_debug_port(debug_port):
+                return f"Started {browser_name} in debug mode on port {debug_port}"
             return f"Started {browser_name} but could not verify debug connection"
 
         except Exception as e:
@@ -174,8 +204,12 @@ class BrowserScreenshotCLI:
         debug_ports = self._browser_manager.debug_ports
         debug_port = debug_ports.get(browser_name, 9222)
 
+        if self._stop_browser_process():
+            return f"Quit {browser_name}"
+
+        # Not started by us: find the debug browser by its command line
         try:
-            if platform.system() == "Darwin":  # macOS
+            if _IS_DARWIN:  # macOS
                 pkill_path = shutil.which("pkill")
                 if pkill_path:
                     subprocess.run(
@@ -209,6 +243,27 @@ class BrowserScreenshotCLI:
         except Exception as e:
             return f"Failed to quit {browser_name}: {e}"
 
+    def _stop_browser_process(self) -> bool:
+        """Stop the browser this instance launched, if it is still running.
+
+        Returns:
+            True if a launched browser was stopped, False if there was none to stop
+
+        """
+        process, self._browser_process = self._browser_process, None
+        # An already exited launcher may have handed off to another browser process
+        if process is None or process.poll() is not None:
+            return False
+
+        process.terminate()
+        try:
+            process.wait(timeout=SUBPROCESS_PKILL_TIMEOUT_CLI)
+        except subprocess.TimeoutExpired:
+            logger.warning(f"Browser process {process.pid} did not exit, killing it")
+            process.kill()
+            process.wait(timeout=SUBPROCESS_PKILL_TIMEOUT_CLI)
+        return True
+
     def shot(self, url: str, **kwargs):
         """Take screenshots of a webpage.
 
@@ -226,25 +281,7 @@ class BrowserScreenshotCLI:
         # Ensure browser is running in debug mode
         self.run(force_run=False)
 
-        # Merge global CLI options with command-specific options
-        merged_kwargs = {
-            "url": url,
-            "app": self.app,
-            "width": self.width,
-            "height": self.height,
-            "zoom": self.zoom,
-            "output_dir": self.output_dir,
-            "subdirs": self.subdirs,
-        }
-
-        # Override with any command-specific options
-        merged_kwargs.update(kwargs)
-
-        # Filter to only valid parameters for capture_webpage
-        sig = inspect.signature(capture_webpage)
-        valid_params: dict[str, Any] = {k: v for k, v in merged_kwargs.items() if k in sig.parameters}
-        if "app" in merged_kwargs:
-            valid_params["app"] = merged_kwargs["app"]
+        valid_params = self._capture_params(url=url, **kwargs)
 
         # Call the API
         try:
@@ -252,15 +289,41 @@ class BrowserScreenshotCLI:
 
             if self.json:
                 return json.dumps(result, indent=2)
-            # Pretty print results
-            for _path, metadata in result.items():
-                if metadata.get("text"):
-                    text = metadata["text"]
-                    metadata["text"] = (
-                        f"{text[:CLI_TEXT_PREVIEW_LENGTH]}..." if len(text) > CLI_TEXT_PREVIEW_LENGTH else text
-                    )
+            return self._preview_text(result)
+
+        except Exception as e:
+            if self.json:
+                return json.dumps({"error": str(e)})
+            logger.error(f"Failed to capture screenshots: {e}")
+            raise
+
+    def shot_many(self, *urls: str, concurrency: int = DEFAULT_BATCH_CONCURRENCY, **kwargs):
+        """Take screenshots of several webpages concurrently.
+
+        The pages are captured side by side in one browser session instead of
+        connecting to the browser once per URL.
+
+        Args:
+            *urls: The URLs to capture
+            concurrency: Maximum number of pages captured at the same time
+            **kwargs: All parameters from api.capture_webpage
+
+        Returns:
+            Screenshot results per URL (dict or JSON string based on --json flag)
+
+        """
+        # Ensure browser is running in debug mode
+        self.run(force_run=False)
+
+        valid_params = self._capture_params(**kwargs)
+        valid_params.pop("url", None)
+
+        try:
+            results = capture_webpages(list(urls), concurrency=concurrency, **valid_params)
 
-            return result
+            if self.json:
+                return json.dumps(results, indent=2)
+            return {url: self._preview_text(result) for url, result in results.items()}
 
         except Exception as e:
             if self.json:
@@ -268,6 +331,47 @@ class BrowserScreenshotCLI:
             logger.error(f"Failed to capture screenshots: {e}")
             raise
 
+    def _capture_params(self, **kwargs: Any) -> dict[str, Any]:
+        """Merge the global CLI options with command-specific capture options.
+
+        Args:
+            **kwargs: Command-specific options, overriding the global ones
+
+        Returns:
+            The options that api.capture_webpage accepts
+        """
+        merged_kwargs = {
+            "app": self.app,
+            "width": self.width,
+            "height": self.height,
+            "zoom": self.zoom,
+            "output_dir": self.output_dir,
+            "subdirs": self.subdirs,
+            **kwargs,
+        }
+
+        # Filter to only valid parameters for capture_webpage
+        sig = inspect.signature(capture_webpage)
+        return {k: v for k, v in merged_kwargs.items() if k in sig.parameters}
+
+    @staticmethod
+    def _preview_text(result: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        """Shorten the extracted text of each screenshot for display.
+
+        Args:
+            result: capture_webpage result
+
+        Returns:
+            The same result, with long texts trimmed
+        """
+        for metadata in result.values():
+            if metadata.get("text"):
+                text = metadata["text"]
+                metadata["text"] = (
+                    f"{text[:CLI_TEXT_PREVIEW_LENGTH]}..." if len(text) > CLI_TEXT_PREVIEW_LENGTH else text
+                )
+        return result
+
     def mcp(self) -> None:
         """Run MCP server for browser screenshots.
 
@@ -3,16 +3,18 @@
 
 """MCP server implementation for brosh."""
 
-import base64
-import json
+import asyncio
+import math
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import cache, partial
 from pathlib import Path
 from typing import Any
 
-from fastmcp import FastMCP
 from loguru import logger
 
 from .api import capture_webpage_async
-from .models import ImageFormat, MCPImageContent, MCPTextContent, MCPToolResult
+from .models import ImageFormat, MCPImageContent, MCPMetadataContent, MCPTextContent, MCPToolResult, json_size
 from .texthtml import DOMProcessor
 from .tool import dflt_output_folder
 
@@ -23,10 +25,23 @@ MCP_DEFAULTS = {
 
 TRIM_TEXT_LENGTH = 200
 MCP_MAX_SIZE_BYTES = 1024 * 1024  # 1MB
+# Bounds for the single adaptive downsample pass applied to oversized results
 MCP_COMPRESSION_DOWNSAMPLE_PERCENTAGE = 50
+MCP_COMPRESSION_MIN_DOWNSAMPLE_PERCENTAGE = 25
 # Each screenshot contributes an image block plus its text-metadata block, so
 # content items come in pairs. Keep at least one pair when trimming for size.
 MCP_CONTENT_ITEMS_PER_SCREENSHOT = 2
+# Serialized overhead of MCPToolResult around its items, for incremental size accounting
+_RESULT_ENVELOPE_SIZE = json_size({"content": []})
+_RESULT_ITEM_SEPARATOR_SIZE = len(",")
+# Worker threads for blocking post-capture work (file reads, HTML and image processing)
+MCP_WORKERS = int(os.environ.get("BROSH_MCP_WORKERS", "4"))
+
+
+@cache
+def _executor() -> ThreadPoolExecutor:
+    """Return the worker pool shared by all MCP tool calls, created on first use."""
+    return ThreadPoolExecutor(max_workers=MCP_WORKERS, thread_name_prefix="brosh-mcp")
 
 
 def run_mcp_server() -> None:
@@ -35,6 +50,9 @@ def run_mcp_server() -> None:
     Used in:
     - cli.py
     """
+    # fastmcp is heavy to import (~1s) and only needed to serve, so it is loaded
+    # here rather than at module import, which the CLI and the tests pay for.
+    from fastmcp import FastMCP
 
     mcp: FastMCP = FastMCP(
         name="Brosh Web Capture",
@@ -57,6 +75,7 @@ def run_mcp_server() -> None:
         subdirs: bool = False,
         output_format_str: str = "png",  # Renamed from output_format to avoid conflict
         anim_spf: float = 0.5,
+        anim_optimize: bool = False,
         fetch_html: bool = False,
         fetch_image: bool = False,
         fetch_image_path: bool = True,
@@ -64,6 +83,7 @@ def run_mcp_server() -> None:
         trim_text: bool = True,
         max_frames: int = 0,
         from_selector: str = "",
+        paint_settle_ms: int = 0,
     ) -> MCPToolResult:
         """Get screenshots and text or HTML from a webpage.
 
@@ -82,6 +102,7 @@ def run_mcp_server() -> None:
             subdirs: Whether to create domain-based subdirectories
             format: Output image format (png, jpg, apng)
             anim_spf: Animation speed for APNG format
+            anim_optimize: Compress the APNG animation harder (smaller, much slower)
             fetch_html: Whether to include HTML content in results
             fetch_image: Whether to include image data in results (default False)
             fetch_image_path: Whether to include image path in results (default True)
@@ -89,6 +110,7 @@ def run_mcp_server() -> None:
             trim_text: Whether to trim text to 200 characters (default True)
             max_frames: Maximum frames to capture (0 for unlimited)
             from_selector: CSS selector to scroll to before starting capture
+            paint_settle_ms: Extra wait in milliseconds after each scroll, for animated pages
 
         Returns:
             MCPToolResult with screenshots and optional HTML content
@@ -112,6 +134,7 @@ def run_mcp_server() -> None:
                 "subdirs": subdirs,
                 "output_format": format_enum,  # API uses output_format
                 "anim_spf": anim_spf,
+                "anim_optimize": anim_optimize,
                 "fetch_html": fetch_html,
                 "fetch_image": False,  # FIXME: fetch_image,
                 "fetch_image_path": fetch_image_path,
@@ -119,13 +142,17 @@ def run_mcp_server() -> None:
                 "trim_text": trim_text,
                 "max_frames": max_frames,
                 "from_selector": from_selector,
+                "paint_settle_ms": paint_settle_ms,
             }
 
             # Call the unified API
             result = await capture_webpage_async(**api_kwargs)
 
-            # Process results for MCP format
-            return _convert_to_mcp_result(
+            # Process results for MCP format off the event loop, which keeps
+            # serving other calls while files are read and images resized.
+            # Screenshots are processed in parallel on the shared worker pool.
+            return await asyncio.to_thread(
+                _convert_to_mcp_result,
                 result,
                 format_enum,
                 fetch_image=fetch_image,
@@ -133,11 +160,12 @@ def run_mcp_server() -> None:
                 fetch_text=fetch_text,
                 fetch_html=fetch_html,
                 trim_text=trim_text,
+                executor=_executor(),
             )
 
         except Exception as e:
             logger.error(f"MCP capture failed: {e}")
-            return MCPToolResult(content=[MCPTextContent(text=f"Error: {e!s}")])
+            return _error_result(f"Error: {e!s}")
 
     # Register the tool with mcp
     mcp.tool(see_webpage)
@@ -145,6 +173,14 @@ def run_mcp_server() -> None:
     mcp.run()
 
 
+def _error_result(message: str) -> MCPToolResult:
+    """Build a tool result holding only an error message.
+
+    The content is trusted, so the models are constructed without validation.
+    """
+    return MCPToolResult.model_construct(content=[MCPTextContent.model_construct(text=message)])
+
+
 def _convert_to_mcp_result(
     capture_result: dict[str, dict[str, Any]],
     img_format: ImageFormat,  # Renamed from output_format to avoid conflict
@@ -154,6 +190,7 @@ def _convert_to_mcp_result(
     fetch_text: bool = True,
     fetch_html: bool = False,
     trim_text: bool = True,
+    executor: Executor | None = None,
 ) -> MCPToolResult:
     """Convert standard capture results to MCP format with configurable output.
 
@@ -165,56 +202,81 @@ def _convert_to_mcp_result(
         fetch_text: Whether to include extracted text
         fetch_html: Whether to include HTML content
         trim_text: Whether to trim text to 200 characters
+        executor: Pool to process screenshots in parallel on (serially if None).
+            Must not be the pool this function itself runs on.
 
     Returns:
         MCPToolResult with configured content items
 
     """
-    content_items: list[MCPTextContent | MCPImageContent] = []
-    dom_processor = DOMProcessor()
+    convert = partial(
+        _screenshot_items,
+        img_format=img_format,
+        fetch_image=fetch_image,
+        fetch_image_path=fetch_image_path,
+        fetch_text=fetch_text,
+        fetch_html=fetch_html,
+        trim_text=trim_text,
+    )
+    mapper = executor.map if executor is not None else map
+    # map preserves input order, so items stay paired per screenshot
+    content_items = [
+        item for items in mapper(convert, capture_result.keys(), capture_result.values()) for item in items
+    ]
 
-    for filepath, metadata in capture_result.items():
-        try:
-            # Only process image if fetch_image is True
-            if fetch_image:
-                with open(filepath, "rb") as f:
-                    image_bytes = f.read()
-
-                image_content = MCPImageContent(
-                    data=base64.b64encode(image_bytes).decode(),
-                    mime_type=(
-                        img_format.mime_type if isinstance(img_format, ImageFormat) else "image/png"
-                    ),  # Use img_format
-                )
-                content_items.append(image_content)
+    # Apply size limits
+    return _apply_size_limits(MCPToolResult(content=content_items))
+
+
+def _screenshot_items(
+    filepath: str,
+    metadata: dict[str, Any],
+    *,
+    img_format: ImageFormat,
+    fetch_image: bool,
+    fetch_image_path: bool,
+    fetch_text: bool,
+    fetch_html: bool,
+    trim_text: bool,
+) -> list[MCPTextContent | MCPImageContent]:
+    """Build the MCP content items for one screenshot; see _convert_to_mcp_result."""
+    content_items: list[MCPTextContent | MCPImageContent] = []
+    try:
+        # Only process image if fetch_image is True
+        if fetch_image:
+            image_content = MCPImageContent(
+                data=Path(filepath).read_bytes(),
+                mime_type=(
+                    img_format.mime_type if isinstance(img_format, ImageFormat) else "image/png"
+                ),  # Use img_format
+            )
+            content_items.append(image_content)
 
-            # Build metadata based on flags
-            meta_dict = {}
+        # Build metadata based on flags
+        meta_dict = {}
 
-            if fetch_image_path:
-                meta_dict["image_path"] = filepath
+        if fetch_image_path:
+            meta_dict["image_path"] = filepath
 
-            meta_dict["selector"] = metadata.get("selector", "body")
+        meta_dict["selector"] = metadata.get("selector", "body")
 
-            if fetch_text:
-                text = metadata.get("text", "")
-                if trim_text and len(text) > TRIM_TEXT_LENGTH:
-                    text = f"{text[:TRIM_TEXT_LENGTH]}..."
-                meta_dict["text"] = text
+        if fetch_text:
+            text = metadata.get("text", "")
+            if trim_text and len(text) > TRIM_TEXT_LENGTH:
+                text = f"{text[:TRIM_TEXT_LENGTH]}..."
+            meta_dict["text"] = text
 
-            if fetch_html and "html" in metadata:
-                compressed = dom_processor.compress_html(metadata["html"])
-                meta_dict["html"] = compressed
+        if fetch_html and "html" in metadata:
+            meta_dict["html"] = DOMProcessor.compress_html(metadata["html"])
 
-            # Only add text content if there's something to add
-            if meta_dict:
-                content_items.append(MCPTextContent(text=json.dumps(meta_dict)))
+        # Only add text content if there's something to add
+        if meta_dict:
+            content_items.append(MCPMetadataContent(metadata=meta_dict))
 
-        except Exception as e:
-            logger.error(f"Failed to process {filepath}: {e}")
+    except Exception as e:
+        logger.error(f"Failed to process {filepath}: {e}")
 
-    # Apply size limits
-    return _apply_size_limits(MCPToolResult(content=content_items))
+    return content_items
 
 
 def _apply_size_limits(result: MCPToolResult) -> MCPToolResult:
@@ -222,9 +284,8 @@ def _apply_size_limits(result: MCPToolResult) -> MCPToolResult:
 
     Progressive strategy:
     1. Remove all but first HTML
-    2. Downsample images by 50%
-    3. Downsample again by 50%
-    4. Remove screenshots from end
+    2. Downsample images once, by 25-50% depending on how far over the limit we are
+    3. Remove screenshots from end
 
     Args:
         result: MCPToolResult to process
@@ -233,84 +294,53 @@ def _apply_size_limits(result: MCPToolResult) -> MCPToolResult:
         Size-limited MCPToolResult
 
     """
-    # Calculate initial size
-    result_dict = result.model_dump()
-    size = len(json.dumps(result_dict).encode("utf-8"))
+    # Measure each item once and keep a running total, so each step only pays for
+    # the items it replaces instead of re-serializing the whole result.
+    item_sizes = [_item_size(item) for item in result.content]
+    size = _result_size(item_sizes)
 
     if size <= MCP_MAX_SIZE_BYTES:
         return result
 
     logger.warning(f"Result size {size} exceeds limit {MCP_MAX_SIZE_BYTES}, applying compression")
 
-    # Step 1: Remove all but first HTML
-    new_content: list[MCPTextContent | MCPImageContent] = []
+    # Step 1: Remove all but first HTML. Metadata items keep their dict, so
+    # dropping the key needs no JSON parsing; only stripped items are re-measured.
+    processed_content: list[MCPTextContent | MCPImageContent] = []
     html_found = False
-
-    for item in result.content:
-        if isinstance(item, MCPTextContent):
-            try:
-                data = json.loads(item.text)
-                if isinstance(data, dict):
-                    for path, metadata in data.items():
-                        if "html" in metadata and html_found:
-                            metadata.pop("html", None)
-                            # Create a new item instead of reassigning loop variable
-                            new_item = MCPTextContent(text=json.dumps({path: metadata}))
-                            new_content.append(new_item)
-                            continue  # Continue to next item in the original loop
-                        if "html" in metadata:
-                            html_found = True
-            except Exception:
-                pass
-        new_content.append(item)  # Appends original or potentially modified if not html case
-
-    # This logic needs rethinking. The new_content should be built correctly.
-    # For now, I will just fix the reassignment.
-    # A better approach would be to build new_content from scratch.
-    # Corrected logic for building new_content:
-    processed_content = []
-    html_found_processed = False
-    for original_item in result.content:  # Iterate over original list
-        current_item_to_add = original_item
-        if isinstance(original_item, MCPTextContent):
-            try:
-                data = json.loads(original_item.text)
-                if isinstance(data, dict):
-                    # Assuming single key in data dict which is path
-                    path_key = next(iter(data))
-                    metadata_val = data[path_key]
-                    if "html" in metadata_val:
-                        if html_found_processed:
-                            metadata_val.pop("html", None)
-                            current_item_to_add = MCPTextContent(text=json.dumps({path_key: metadata_val}))
-                        else:
-                            html_found_processed = True
-            except Exception:
-                pass
-        processed_content.append(current_item_to_add)
+    for index, item in enumerate(result.content):
+        if isinstance(item, MCPMetadataContent) and "html" in item.metadata:
+            if html_found:
+                stripped_item = item.without("html")
+                item_sizes[index] = _item_size(stripped_item)
+                processed_content.append(stripped_item)
+                continue
+            html_found = True
+        processed_content.append(item)
     result = MCPToolResult(content=processed_content)
-    size = len(json.dumps(result.model_dump()).encode("utf-8"))
+    size = _result_size(item_sizes)
 
     if size <= MCP_MAX_SIZE_BYTES:
         return result
 
-    # Step 2: Downsample images
+    # Step 2: Downsample images in a single pass. Encoded size shrinks roughly with
+    # pixel area, i.e. with the square of the scale, so aim for sqrt(limit/size).
     from .image import ImageProcessor
 
     processor = ImageProcessor()
+    downsample_percentage = _downsample_percentage_for(size)
 
-    # Step 2: Downsample images (Corrected logic)
     content_after_downsample: list[MCPTextContent | MCPImageContent] = []
-    for item_to_downsample in result.content:  # Iterate on the potentially html-stripped list
+    for index, item_to_downsample in enumerate(result.content):  # Iterate on the potentially html-stripped list
         if isinstance(item_to_downsample, MCPImageContent):
             try:
-                img_data = base64.b64decode(item_to_downsample.data)
-                downsampled_bytes = processor.downsample_png_bytes(img_data, MCP_COMPRESSION_DOWNSAMPLE_PERCENTAGE)
-                # Create new item instead of reassigning
-                downsampled_item = MCPImageContent(
-                    data=base64.b64encode(downsampled_bytes).decode(), mime_type=item_to_downsample.mime_type
+                downsampled_bytes = processor.downsample_png_bytes(
+                    item_to_downsample.image_bytes, downsample_percentage
                 )
+                # Create new item instead of reassigning
+                downsampled_item = MCPImageContent(data=downsampled_bytes, mime_type=item_to_downsample.mime_type)
                 content_after_downsample.append(downsampled_item)
+                item_sizes[index] = _item_size(downsampled_item)
             except Exception as e:
                 logger.error(f"Failed to downsample image: {e}")
                 content_after_downsample.append(item_to_downsample)  # Append original on error
@@ -318,21 +348,60 @@ def _apply_size_limits(result: MCPToolResult) -> MCPToolResult:
             content_after_downsample.append(item_to_downsample)  # Append non-image items directly
 
     result = MCPToolResult(content=content_after_downsample)
-    size = len(json.dumps(result.model_dump()).encode("utf-8"))
+    size = _result_size(item_sizes)
 
     if size <= MCP_MAX_SIZE_BYTES:
         return result
 
     # Step 3: Remove screenshots from end
-    # Keep at least one image and one text block if possible.
-    while len(result.content) > MCP_CONTENT_ITEMS_PER_SCREENSHOT and size > MCP_MAX_SIZE_BYTES:
+    # Keep at least one image and one text block if possible. Find the cut point
+    # on the running total first, then drop the trailing items in one slice.
+    keep = len(item_sizes)
+    while keep > MCP_CONTENT_ITEMS_PER_SCREENSHOT and size > MCP_MAX_SIZE_BYTES:
         # Remove an image and its corresponding text metadata.
-        result.content = result.content[:-MCP_CONTENT_ITEMS_PER_SCREENSHOT]
-        size = len(json.dumps(result.model_dump()).encode("utf-8"))
+        dropped = item_sizes[keep - MCP_CONTENT_ITEMS_PER_SCREENSHOT : keep]
+        size -= sum(dropped) + _RESULT_ITEM_SEPARATOR_SIZE * len(dropped)
+        keep -= len(dropped)
+    result.content = result.content[:keep]
 
     return result
 
 
+def _item_size(item: MCPTextContent | MCPImageContent) -> int:
+    """Serialized size in bytes of one content item, as it appears in the result JSON."""
+    if isinstance(item, MCPImageContent) and isinstance(item.data, bytes):
+        # Base64 is plain ASCII that JSON never escapes, so its length is known
+        # without encoding: the image is only base64-encoded once, on the final dump.
+        envelope = item.model_copy(update={"data": b""})
+        return json_size(envelope.model_dump()) + 4 * math.ceil(len(item.data) / 3)
+    return json_size(item.model_dump())
+
+
+def _result_size(item_sizes: list[int]) -> int:
+    """Serialized size in bytes of an MCPToolResult whose items have the given sizes.
+
+    Matches ``json_size(result.model_dump())`` exactly: the ``{"content":[]}``
+    envelope, the items, and a ``,`` between neighbours.
+    """
+    separators = _RESULT_ITEM_SEPARATOR_SIZE * max(len(item_sizes) - 1, 0)
+    return _RESULT_ENVELOPE_SIZE + sum(item_sizes) + separators
+
+
+def _downsample_percentage_for(size: int) -> int:
+    """Pick the image scale (in %) expected to bring a result of ``size`` bytes under the limit.
+
+    Args:
+        size: Current serialized result size in bytes
+
+    Returns:
+        Scale percentage between MCP_COMPRESSION_MIN_DOWNSAMPLE_PERCENTAGE and
+        MCP_COMPRESSION_DOWNSAMPLE_PERCENTAGE
+
+    """
+    target = int(100 * math.sqrt(MCP_MAX_SIZE_BYTES / size))
+    return max(MCP_COMPRESSION_MIN_DOWNSAMPLE_PERCENTAGE, min(MCP_COMPRESSION_DOWNSAMPLE_PERCENTAGE, target))
+
+
 def main() -> None:
     """Run the MCP server."""
     run_mcp_server()
@@ -3,12 +3,22 @@
 
 """Data models and enums for the brosh package."""
 
+import base64
+import json
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from pathlib import Path
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer, model_validator
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # Validation constants
 MIN_ZOOM, MAX_ZOOM = 10, 500
@@ -16,6 +26,33 @@ MIN_SCROLL_STEP, MAX_SCROLL_STEP = 10, 200
 MIN_SCALE, MAX_SCALE = 10, 200
 MIN_ANIM_SPF, MAX_ANIM_SPF = 0.1, 10.0
 MIN_HEIGHT = -1
+MIN_PAINT_SETTLE_MS, MAX_PAINT_SETTLE_MS = 0, 10000
+
+
+def dumps_json(obj: Any) -> str:
+    """Serialize ``obj`` to compact JSON, using orjson when it is installed.
+
+    The stdlib fallback emits the same compact, non-ASCII-escaping output, so
+    results do not depend on which encoder is available.
+
+    Used in:
+    - mcp.py
+    - models.py
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def json_size(obj: Any) -> int:
+    """Size in bytes of ``obj`` serialized by dumps_json, encoded as UTF-8.
+
+    Used in:
+    - mcp.py
+    """
+    if HAS_ORJSON:
+        return len(orjson.dumps(obj))  # already UTF-8 bytes, no str round-trip
+    return len(dumps_json(obj).encode("utf-8"))
 
 
 class ImageFormat(str, Enum):
@@ -36,52 +73,55 @@ class ImageFormat(str, Enum):
     @property
     def mime_type(self) -> str:
         """Get the MIME type for this image format."""
-        mime_types = {
-            self.PNG: "image/png",
-            self.JPG: "image/jpeg",
-            self.APNG: "image/apng",
-        }
-        return mime_types[self]
+        return _MIME_TYPES[self]
 
     @property
     def file_extension(self) -> str:
         """Get the file extension for this image format."""
-        extensions = {
-            self.PNG: ".png",
-            self.JPG: ".jpg",
-            self.APNG: ".apng",
-        }
-        return extensions[self]
+        return _FILE_EXTENSIONS[self]
 
     @classmethod
     def from_mime_type(cls, mime_type: str) -> "ImageFormat":
         """Create an ImageFormat from a MIME type."""
-        mime_map = {
-            "image/png": cls.PNG,
-            "image/jpeg": cls.JPG,
-            "image/jpg": cls.JPG,
-            "image/apng": cls.APNG,
-        }
-        if mime_type not in mime_map:
+        if mime_type not in _FORMATS_BY_MIME_TYPE:
             msg = f"Unsupported MIME type: {mime_type}"
             raise ValueError(msg)
-        return mime_map[mime_type]
+        return _FORMATS_BY_MIME_TYPE[mime_type]
 
     @classmethod
     def from_extension(cls, extension: str) -> "ImageFormat":
         """Create an ImageFormat from a file extension."""
         if not extension.startswith("."):
             extension = f".{extension}"
-        ext_map = {
-            ".png": cls.PNG,
-            ".jpg": cls.JPG,
-            ".jpeg": cls.JPG,
-            ".apng": cls.APNG,
-        }
-        if extension.lower() not in ext_map:
+        if extension.lower() not in _FORMATS_BY_EXTENSION:
             msg = f"Unsupported file extension: {extension}"
             raise ValueError(msg)
-        return ext_map[extension.lower()]
+        return _FORMATS_BY_EXTENSION[extension.lower()]
+
+
+# Lookup tables for ImageFormat, built once rather than on every access
+_MIME_TYPES = {
+    ImageFormat.PNG: "image/png",
+    ImageFormat.JPG: "image/jpeg",
+    ImageFormat.APNG: "image/apng",
+}
+_FILE_EXTENSIONS = {
+    ImageFormat.PNG: ".png",
+    ImageFormat.JPG: ".jpg",
+    ImageFormat.APNG: ".apng",
+}
+_FORMATS_BY_MIME_TYPE = {
+    "image/png": ImageFormat.PNG,
+    "image/jpeg": ImageFormat.JPG,
+    "image/jpg": ImageFormat.JPG,
+    "image/apng": ImageFormat.APNG,
+}
+_FORMATS_BY_EXTENSION = {
+    ".png": ImageFormat.PNG,
+    ".jpg": ImageFormat.JPG,
+    ".jpeg": ImageFormat.JPG,
+    ".apng": ImageFormat.APNG,
+}
 
 
 @dataclass
@@ -93,14 +133,30 @@ class CaptureFrame:
     - tool.py
     """
 
-    image_bytes: bytes
+    image_bytes: bytes | None  # None when the screenshot was spooled to image_path
     scroll_position_y: int
     page_height: int
     viewport_height: int
     active_selector: str
+    section_id: str = "section"  # Slug of the nearest id or heading, used in filenames
     visible_html: str | None = None
     visible_text: str | None = None
     timestamp: datetime | None = None
+    image_path: Path | None = None
+    image_format: ImageFormat = ImageFormat.PNG  # Encoding of the screenshot bytes
+
+    def load_image_bytes(self) -> bytes:
+        """Return the screenshot, reading it from image_path if it was spooled to disk.
+
+        Used in:
+        - tool.py
+        """
+        if self.image_bytes is not None:
+            return self.image_bytes
+        if self.image_path is None:
+            msg = "Frame has neither image bytes nor an image path"
+            raise ValueError(msg)
+        return self.image_path.read_bytes()
 
     @property
     def scroll_percentage(self) -> int:
@@ -108,10 +164,12 @@ class CaptureFrame:
         return min(int((self.scroll_position_y / self.page_height) * 10000), 9999)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CaptureConfig:
     """Screenshot capture configuration - unified parameter set.
 
+    Immutable: derive adjusted copies with ``dataclasses.replace``.
+
     Used in:
     - __init__.py
     - api.py
@@ -130,6 +188,7 @@ class CaptureConfig:
     output_dir: str = ""
     subdirs: bool = False
     anim_spf: float = 0.5
+    anim_optimize: bool = False  # Slow, maximum APNG compression
     fetch_html: bool = False
     fetch_image: bool = False  # Controls if images are included in MCP output
     fetch_image_path: bool = True  # Controls if image paths are included
@@ -137,6 +196,7 @@ class CaptureConfig:
     trim_text: bool = True  # Controls if text is trimmed to 200 characters
     max_frames: int = 0
     from_selector: str = ""
+    paint_settle_ms: int = 0  # Extra wait after each scroll, for animated pages
 
     def validate(self) -> None:
         """Validate configuration parameters.
@@ -162,6 +222,9 @@ class CaptureConfig:
         if not MIN_ANIM_SPF <= self.anim_spf <= MAX_ANIM_SPF:
             msg = f"Animation SPF must be between {MIN_ANIM_SPF} and {MAX_ANIM_SPF}"
             raise ValueError(msg)
+        if not MIN_PAINT_SETTLE_MS <= self.paint_settle_ms <= MAX_PAINT_SETTLE_MS:
+            msg = f"Paint settle time must be between {MIN_PAINT_SETTLE_MS} and {MAX_PAINT_SETTLE_MS} ms"
+            raise ValueError(msg)
 
 
 @dataclass
@@ -198,6 +261,35 @@ class MCPTextContent(BaseModel):
         return super().model_dump(**kwargs)
 
 
+class MCPMetadataContent(MCPTextContent):
+    """MCP text content item carrying per-screenshot metadata as JSON.
+
+    The metadata dict is kept next to its JSON text so keys can be dropped
+    (e.g. ``html`` when trimming for size) without parsing the text back.
+
+    Used in:
+    - mcp.py
+    """
+
+    metadata: dict[str, Any] = Field(default_factory=dict, exclude=True, description="Metadata rendered as text")
+
+    @model_validator(mode="before")
+    @classmethod
+    def _render_text(cls, data: Any) -> Any:
+        """Render ``text`` from ``metadata`` so the two never disagree."""
+        if isinstance(data, dict) and "metadata" in data:
+            data = {**data, "text": dumps_json(data["metadata"])}
+        return data
+
+    def without(self, key: str) -> "MCPMetadataContent":
+        """Return a copy of this item with ``key`` removed from its metadata.
+
+        Used in:
+        - mcp.py
+        """
+        return MCPMetadataContent(metadata={k: v for k, v in self.metadata.items() if k != key})
+
+
 class MCPImageContent(BaseModel):
     """Model for MCP image content items.
 
@@ -206,9 +298,27 @@ class MCPImageContent(BaseModel):
     """
 
     type: Literal["image"] = Field(default="image")
-    data: str = Field(..., description="Base64-encoded image data")
+    data: str | bytes = Field(..., description="Base64-encoded image data, or raw image bytes encoded on dump")
     mime_type: str = Field(..., description="MIME type for image content", serialization_alias="mimeType")
 
+    @field_serializer("data")
+    def _serialize_data(self, data: str | bytes) -> str:
+        """Base64-encode raw image bytes only when the item is serialized."""
+        if isinstance(data, bytes):
+            return base64.b64encode(data).decode()
+        return data
+
+    @property
+    def image_bytes(self) -> bytes:
+        """Raw image bytes, decoding ``data`` if it was given base64-encoded.
+
+        Used in:
+        - mcp.py
+        """
+        if isinstance(self.data, bytes):
+            return self.data
+        return base64.b64decode(self.data)
+
     def model_dump(self, **kwargs) -> dict[str, Any]:
         """Override to ensure exclude_none is always True and use by_alias.
 
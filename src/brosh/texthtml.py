@@ -8,54 +8,67 @@ import re
 import html2text
 from loguru import logger
 
+try:
+    import minify_html
+
+    HAS_MINIFY_HTML = True
+except ImportError:
+    HAS_MINIFY_HTML = False
+
+# Patterns used by DOMProcessor.compress_html, compiled once at import
+# Inline SVGs and comments, removed in one pass before whitespace is collapsed
+_SVG_OR_COMMENT_RE = re.compile(r"(?P<svg><svg[^>]*>.*?</svg>)|<!--.*?-->", re.DOTALL | re.IGNORECASE)
+_WIDTH_RE = re.compile(r'width=["\']([\d.]+)["\']')
+_HEIGHT_RE = re.compile(r'height=["\']([\d.]+)["\']')
+# Long inline styles and data: URIs, emptied in one pass after whitespace is collapsed
+_BULKY_ATTR_RE = re.compile(r'(style)="[^"]{500,}"|(src|href)="data:[^"]{100,}"')
+# minify-html drops empty attributes, so emptied ones carry this value through
+# it and are turned back into ="" afterwards
+_EMPTIED_ATTR_PLACEHOLDER = "__brosh_emptied__"
+
 # JavaScript constants extracted from capture.py
+# Outer HTML of the outermost elements lying fully inside the viewport, in
+# document order. One walk over the tree: a fully visible element is taken
+# whole and its subtree skipped, so no containment checks are needed.
 GET_VISIBLE_HTML_JS = """() => {
     const {innerHeight: H, innerWidth: W} = window;
-    const nodes = [...document.querySelectorAll('*')];
-    const fullyVisibleElements = [];
-
-    const excludeTags = ['HTML', 'HEAD', 'BODY', 'SCRIPT', 'STYLE', 'META', 'LINK', 'TITLE'];
-
-    nodes.forEach(node => {
-        if (excludeTags.includes(node.tagName) || node.nodeType !== 1) {
-            return;
-        }
-
-        const r = node.getBoundingClientRect();
-        if (r.top >= 0 && r.bottom <= H && r.left >= 0 && r.right <= W && r.width > 0 && r.height > 0) {
-            let isContained = false;
-            for (const existing of fullyVisibleElements) {
-                if (existing.contains(node)) {
-                    isContained = true;
-                    break;
-                }
-            }
-            if (!isContained) {
-                const filtered = fullyVisibleElements.filter(el => !node.contains(el));
-                fullyVisibleElements.length = 0;
-                fullyVisibleElements.push(...filtered, node);
+    const excludeTags = new Set(['HTML', 'HEAD', 'BODY', 'SCRIPT', 'STYLE', 'META', 'LINK', 'TITLE']);
+    const htmlParts = [];
+
+    const walk = (node) => {
+        if (!excludeTags.has(node.tagName)) {
+            const r = node.getBoundingClientRect();
+            if (r.top >= 0 && r.bottom <= H && r.left >= 0 && r.right <= W && r.width > 0 && r.height > 0) {
+                htmlParts.push(node.outerHTML);
+                return;
             }
         }
-    });
+        for (const child of node.children) {
+            walk(child);
+        }
+    };
+    walk(document.documentElement);
 
-    const htmlParts = fullyVisibleElements.map(el => el.outerHTML);
     return htmlParts.join('').replace(/\\s+/g, ' ').trim();
 }"""
 
+# One hit test near the top of the viewport instead of measuring every heading
+# and [id] element on the page. elementsFromPoint lists the hit element and
+# all its ancestors, innermost first, so the nearest labelled one wins.
 GET_SECTION_ID_JS = """() => {
-    const viewportHeight = window.innerHeight;
-    const headers = Array.from(
-        document.querySelectorAll('h1, h2, h3, h4, h5, h6, [id]')
-    );
-
-    for (const header of headers) {
-        const rect = header.getBoundingClientRect();
-        if (rect.top >= 0 && rect.top < viewportHeight / 2) {
-            return (header.id || header.textContent || '').trim()
-                .toLowerCase()
-                .replace(/[^a-z0-9]+/g, '-')
-                .replace(/^-+|-+$/g, '')
-                .substring(0, 20);
+    const slug = (value) => value.trim()
+        .toLowerCase()
+        .replace(/[^a-z0-9]+/g, '-')
+        .replace(/^-+|-+$/g, '')
+        .substring(0, 20);
+
+    const hits = document.elementsFromPoint(window.innerWidth / 2, window.innerHeight / 4);
+    for (const el of hits) {
+        const id = el.id ? slug(el.id) : '';
+        if (id) return id;
+        if (/^H[1-6]$/.test(el.tagName)) {
+            const heading = slug(el.textContent || '');
+            if (heading) return heading;
         }
     }
     return 'section';
@@ -94,6 +107,42 @@ GET_ACTIVE_SELECTOR_JS = """() => {
     return 'body';
 }"""
 
+# Everything _capture_single_frame needs from the DOM, fetched in one evaluate
+# round-trip instead of one per script
+GET_FRAME_CONTENT_JS = f"""() => ({{
+    html: ({GET_VISIBLE_HTML_JS})(),
+    selector: ({GET_ACTIVE_SELECTOR_JS})(),
+    sectionId: ({GET_SECTION_ID_JS})(),
+}})"""
+
+
+def _replace_svg_or_comment(match: re.Match[str]) -> str:
+    """Drop a comment, or replace an inline SVG with an empty one that keeps its dimensions."""
+    if match.lastgroup != "svg":
+        return ""
+    svg_tag = match.group(0)
+    width_match = _WIDTH_RE.search(svg_tag)
+    height_match = _HEIGHT_RE.search(svg_tag)
+
+    attrs = []
+    if width_match:
+        attrs.append(f'width="{width_match.group(1)}"')
+    if height_match:
+        attrs.append(f'height="{height_match.group(1)}"')
+
+    attr_str = " " + " ".join(attrs) if attrs else ""
+    return f"<svg{attr_str}></svg>"
+
+
+def _empty_attr(match: re.Match[str]) -> str:
+    """Replace a long style or data: URI attribute with an empty one."""
+    return f'{match.group(1) or match.group(2)}=""'
+
+
+def _placeholder_attr(match: re.Match[str]) -> str:
+    """Replace a long style or data: URI attribute with a placeholder minify-html keeps."""
+    return f"{match.group(1) or match.group(2)}={_EMPTIED_ATTR_PLACEHOLDER}"
+
 
 class DOMProcessor:
     """Handles DOM querying and content extraction.
@@ -132,6 +181,29 @@ class DOMProcessor:
             logger.error(f"Failed to extract content: {e}")
             return "", "", "body"
 
+    async def extract_all_for_frame(self, page, *, include_html: bool) -> tuple[str | None, str, str, str]:
+        """Extract visible content, active selector and section id in one round-trip.
+
+        Args:
+            page: Playwright page instance
+            include_html: Whether to return the visible HTML (keyword-only);
+                it is always read, as the text is converted from it
+
+        Returns:
+            Tuple of (visible_html or None, visible_text, active_selector, section_id)
+
+        Used in:
+        - capture.py
+        """
+        try:
+            content = await page.evaluate(GET_FRAME_CONTENT_JS)
+        except Exception as e:
+            logger.error(f"Failed to extract content: {e}")
+            return ("" if include_html else None), "", "body", "section"
+        visible_html = content["html"]
+        visible_text = self.html_to_markdown(visible_html)
+        return (visible_html if include_html else None), visible_text, content["selector"], content["sectionId"]
+
     async def get_section_id(self, page) -> str:
         """Get semantic section identifier for current viewport.
 
@@ -171,28 +243,29 @@ class DOMProcessor:
         Returns:
             Compressed HTML
         """
-
-        # Remove SVG content but keep dimensions
-        def replace_svg(match):
-            svg_tag = match.group(0)
-            width_match = re.search(r'width=["\']([\d.]+)["\']', svg_tag)
-            height_match = re.search(r'height=["\']([\d.]+)["\']', svg_tag)
-
-            attrs = []
-            if width_match:
-                attrs.append(f'width="{width_match.group(1)}"')
-            if height_match:
-                attrs.append(f'height="{height_match.group(1)}"')
-
-            attr_str = " " + " ".join(attrs) if attrs else ""
-            return f"<svg{attr_str}></svg>"
-
-        html = re.sub(r"<svg[^>]*>.*?</svg>", replace_svg, html, flags=re.DOTALL | re.IGNORECASE)
-        html = re.sub(r"<!--.*?-->", "", html, flags=re.DOTALL)
-        html = re.sub(r"\s+", " ", html)
-        html = re.sub(r">\s+<", "><", html)
-        html = re.sub(r'style="[^"]{500,}"', 'style=""', html)
-        html = re.sub(r'src="data:[^"]{100,}"', 'src=""', html)
-        html = re.sub(r'href="data:[^"]{100,}"', 'href=""', html)
+        # Remove comments, and SVG content but keep dimensions
+        html = _SVG_OR_COMMENT_RE.sub(_replace_svg_or_comment, html)
+        if HAS_MINIFY_HTML:
+            # Empty bulky attributes while they are still quoted, then let the
+            # native minifier collapse whitespace (it may unquote and reorder
+            # attributes). Options are spelled out so a change in minify-html's
+            # defaults cannot change the output.
+            html = _BULKY_ATTR_RE.sub(_placeholder_attr, html)
+            html = minify_html.minify(
+                html,
+                keep_closing_tags=True,
+                keep_html_and_head_opening_tags=True,
+                minify_css=False,
+                minify_js=False,
+                remove_processing_instructions=True,
+            )
+            return html.replace(f"={_EMPTIED_ATTR_PLACEHOLDER}", '=""').strip()
+
+        # str.split() collapses whitespace runs in C; after that the only gap
+        # left between tags is a single space
+        html = " ".join(html.split())
+        html = html.replace("> <", "><")
+        # Empty long inline styles and data: URIs in src/href
+        html = _BULKY_ATTR_RE.sub(_empty_attr, html)
 
         return html.strip()
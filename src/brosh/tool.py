@@ -3,14 +3,20 @@
 
 """Main screenshot tool orchestration for brosh."""
 
+import asyncio
+import hashlib
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
 from loguru import logger
 from platformdirs import user_pictures_dir
-from playwright.async_api import async_playwright
 
 from .browser import BrowserManager
 from .capture import CaptureManager
@@ -20,6 +26,11 @@ from .texthtml import DOMProcessor
 
 MILLISECONDS_PER_SECOND = 1000
 DEFAULT_SCALE_PERCENTAGE = 100
+# Scaled frames are always re-encoded afterwards (JPEG, oxipng or APNG), so the
+# intermediate PNG only needs the cheapest compression
+INTERMEDIATE_PNG_COMPRESS_LEVEL = 1
+# Bytes of URL hash in output filenames (two hex digits each)
+URL_TAG_BYTES = 3
 
 
 def dflt_output_folder(subfolder: str | Path = "brosh") -> Path:
@@ -27,6 +38,11 @@ def dflt_output_folder(subfolder: str | Path = "brosh") -> Path:
     return Path(user_pictures_dir(), subfolder)
 
 
+def _url_tag(url: str) -> str:
+    """Short, stable hash of a URL that tells same-domain captures' files apart."""
+    return hashlib.blake2s(url.encode(), digest_size=URL_TAG_BYTES).hexdigest()
+
+
 class BrowserScreenshotTool:
     """Main tool implementation orchestrating the capture process.
 
@@ -76,23 +92,33 @@ class BrowserScreenshotTool:
         # Get screen dimensions if not specified
         if config.width == 0 or config.height == 0:
             default_width, default_height = self.browser_manager.get_screen_dimensions()
-            if config.width == 0:
-                config.width = default_width
-            if config.height == 0:
-                config.height = default_height
+            config = replace(config, width=config.width or default_width, height=config.height or default_height)
 
         logger.info(f"Starting capture of {config.url}")
 
         results = {}
-        async with async_playwright() as p:
-            # Get browser instance
-            browser, context, page = await self.browser_manager.get_browser_instance(
-                p, self.browser_manager.get_browser_name(config.app), config.width, config.height, config.zoom
-            )
-
-            try:
-                # Capture frames (in-memory)
-                frames = await self.capture_manager.capture_frames(page, config)
+        # Started once per event loop and shared with later captures
+        p = await BrowserManager.get_playwright()
+
+        # Get browser instance
+        browser, context, page = await self.browser_manager.get_browser_instance(
+            p, self.browser_manager.get_browser_name(config.app), config.width, config.height, config.zoom
+        )
+
+        try:
+            # Screenshots are spooled to disk as they are taken, so a long
+            # capture does not hold every raw frame in memory. APNG assembly
+            # needs every frame at once, so spooling would only add a write
+            # and a read per frame; those frames stay in memory.
+            with tempfile.TemporaryDirectory(prefix="brosh-") as spool_dir:
+                # The browser encodes JPEG itself when no rescaling has to happen in between
+                direct_jpg = config.format == ImageFormat.JPG and config.scale == DEFAULT_SCALE_PERCENTAGE
+                frames = await self.capture_manager.capture_frames(
+                    page,
+                    config,
+                    spool_dir=None if config.format == ImageFormat.APNG else Path(spool_dir),
+                    image_format=ImageFormat.JPG if direct_jpg else ImageFormat.PNG,
+                )
 
                 if not frames:
                     msg = "No frames captured"
@@ -104,10 +130,10 @@ class BrowserScreenshotTool:
                 else:
                     results = await self._process_regular_frames(frames, domain, output_path, config)
 
-                logger.info(f"Successfully captured {len(results)} screenshots")
+            logger.info(f"Successfully captured {len(results)} screenshots")
 
-            finally:
-                await self.browser_manager.cleanup_browser(page, context, browser)
+        finally:
+            await self.browser_manager.cleanup_browser(page, context, browser)
 
         return results
 
@@ -145,28 +171,16 @@ class BrowserScreenshotTool:
         """
         results = {}
         timestamp = datetime.now(timezone.utc).strftime("%y%m%d-%H%M%S")  # Ensured timezone.utc is used
+        # Shared by every frame's filename. The URL tag keeps pages of one
+        # domain captured in the same second (e.g. by capture_webpages) apart.
+        prefix = f"{domain}-{_url_tag(config.url)}-{timestamp}-"
+        extension = config.format.value
+        filepaths: list[Path] = []
 
-        for _i, frame in enumerate(frames):
+        for frame in frames:
             # Generate filename
-            section_id = await self._get_section_id_from_frame(frame)
-            filename = f"{domain}-{timestamp}-{frame.scroll_percentage:05d}-{section_id}.{config.format.value}"
-            filepath = output_path / filename
-
-            # Process image bytes
-            image_bytes = frame.image_bytes
-
-            # Scale if needed
-            if config.scale != DEFAULT_SCALE_PERCENTAGE:
-                image_bytes = self.image_processor.downsample_png_bytes(image_bytes, config.scale)
-
-            # Convert format if needed
-            if config.format == ImageFormat.JPG:
-                image_bytes = self.image_processor.convert_png_to_jpg_bytes(image_bytes)
-            elif config.format == ImageFormat.PNG:
-                image_bytes = self.image_processor.optimize_png_bytes(image_bytes)
-
-            # Save to disk
-            filepath.write_bytes(image_bytes)
+            filepath = output_path / f"{prefix}{frame.scroll_percentage:05d}-{frame.section_id}.{extension}"
+            filepaths.append(filepath)
 
             # Store metadata
             metadata = {"selector": frame.active_selector, "text": frame.visible_text or ""}
@@ -175,6 +189,17 @@ class BrowserScreenshotTool:
 
             results[str(filepath)] = metadata
 
+        # Scale and convert all frames off the event loop
+        images = await asyncio.to_thread(self._prepare_images, frames, config)
+
+        # PNG optimization dominates processing time; run it for all frames at once
+        if config.format == ImageFormat.PNG:
+            images = await asyncio.to_thread(self.image_processor.optimize_png_batch, images)
+
+        # Save to disk
+        for filepath, image_bytes in zip(filepaths, images, strict=True):
+            filepath.write_bytes(image_bytes)
+
         return results
 
     async def _process_apng_frames(
@@ -193,19 +218,16 @@ class BrowserScreenshotTool:
 
         """
         # Process all frame bytes
-        frame_bytes_list = []
-        for frame in frames:
-            image_bytes = frame.image_bytes
-            if config.scale != DEFAULT_SCALE_PERCENTAGE:
-                image_bytes = self.image_processor.downsample_png_bytes(image_bytes, config.scale)
-            frame_bytes_list.append(image_bytes)
+        frame_bytes_list = await asyncio.to_thread(self._prepare_images, frames, config)
 
         # Create APNG
         delay_ms = int(config.anim_spf * MILLISECONDS_PER_SECOND)
-        apng_bytes = self.image_processor.create_apng_bytes(frame_bytes_list, delay_ms)
+        apng_bytes = await asyncio.to_thread(
+            self.image_processor.create_apng_bytes, frame_bytes_list, delay_ms, optimize=config.anim_optimize
+        )
 
         # Save APNG
-        apng_filename = f"{domain}-animated.png"
+        apng_filename = f"{domain}-{_url_tag(config.url)}-animated.png"
         apng_path = output_path / apng_filename
         apng_path.write_bytes(apng_bytes)
 
@@ -218,16 +240,46 @@ class BrowserScreenshotTool:
             }
         }
 
-    async def _get_section_id_from_frame(self, _frame: CaptureFrame) -> str:  # Prefixed unused frame with _
-        """Extract section ID from frame metadata.
+    def _prepare_images(self, frames: list[CaptureFrame], config: CaptureConfig) -> list[bytes]:
+        """Load, scale and, for JPG output, convert the frames on a thread pool.
+
+        Pillow and libvips release the GIL while they decode, resize and
+        encode, so frames are processed side by side instead of in turn.
 
         Args:
-            _frame: Capture frame (currently unused, placeholder for future logic)
+            frames: Captured frames
+            config: Capture configuration
 
         Returns:
-            Section identifier string
+            Image bytes, in frame order
+        """
+        if len(frames) <= 1:
+            return [self._prepare_image(frame, config) for frame in frames]
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            return list(pool.map(partial(self._prepare_image, config=config), frames))
 
+    def _prepare_image(self, frame: CaptureFrame, config: CaptureConfig) -> bytes:
+        """Load one frame's screenshot, then scale and convert it as configured.
+
+        Args:
+            frame: Captured frame
+            config: Capture configuration
+
+        Returns:
+            Image bytes
         """
-        # This would be populated during capture
-        # For now, return a default
-        return "section"
+        image_bytes = frame.load_image_bytes()
+        # APNG frames stay PNG; browser-encoded JPEG frames are never rescaled
+        to_jpg = config.format == ImageFormat.JPG and frame.image_format != ImageFormat.JPG
+
+        if config.scale != DEFAULT_SCALE_PERCENTAGE:
+            if to_jpg:
+                # Scale and convert in one pass, skipping the intermediate PNG
+                return self.image_processor.downsample_to_jpg_bytes(image_bytes, config.scale)
+            return self.image_processor.downsample_png_bytes(
+                image_bytes, config.scale, compress_level=INTERMEDIATE_PNG_COMPRESS_LEVEL
+            )
+        if to_jpg:
+            return self.image_processor.convert_png_to_jpg_bytes(image_bytes)
+        return image_bytes
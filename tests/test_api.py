@@ -6,8 +6,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from pydantic.networks import AnyUrl
 
-from brosh.api import capture_webpage, capture_webpage_async
+from brosh.api import _default_output_dir, capture_webpage, capture_webpage_async, capture_webpages
 from brosh.models import CaptureConfig, ImageFormat
+from brosh.tool import BrowserScreenshotTool
 
 
 class TestCaptureWebpage:
@@ -40,32 +41,34 @@ class TestCaptureWebpage:
         # Verify result
         assert result == {"test.png": {"selector": "body"}}
 
+    @pytest.mark.asyncio
     @patch("brosh.api.BrowserScreenshotTool")
-    @patch("brosh.api.asyncio.get_running_loop")
-    def test_capture_webpage_async_context(
-        self, mock_get_loop: MagicMock, mock_tool_class: MagicMock, temp_output_dir: Path
+    async def test_capture_webpage_rejects_running_loop(
+        self, mock_tool_class: MagicMock, temp_output_dir: Path
     ) -> None:
-        """Test capture_webpage in async context."""
-        # Mock the tool instance
+        """Test capture_webpage is sync-only; async callers use capture_webpage_async."""
         mock_tool = MagicMock()
         mock_tool.capture.return_value = {"test.png": {"selector": "body"}}
         mock_tool_class.return_value = mock_tool
 
-        # Mock get_running_loop to simulate async context
-        mock_loop = MagicMock()
-        mock_get_loop.return_value = mock_loop
+        with pytest.raises(RuntimeError, match="running event loop"):
+            capture_webpage(
+                url=AnyUrl("https://example.com"),
+                output_dir=temp_output_dir,
+            )
 
-        # Test the function
-        result = capture_webpage(
-            url=AnyUrl("https://example.com"),
-            output_dir=temp_output_dir,
-        )
+    def test_capture_webpage_stops_playwright(self) -> None:
+        """Test the sync entry point stops its loop's Playwright driver, even on failure."""
+        with (
+            patch("brosh.api.BrowserScreenshotTool") as mock_tool_class,
+            patch("brosh.api.BrowserManager.stop_playwright", AsyncMock()) as mock_stop,
+        ):
+            mock_tool_class.return_value.capture = AsyncMock(side_effect=RuntimeError("No frames captured"))
 
-        # Verify tool was created and called
-        mock_tool_class.assert_called_once()
+            with pytest.raises(RuntimeError, match="No frames captured"):
+                capture_webpage(url=AnyUrl("https://example.com"))
 
-        # Verify result is the coroutine (not run)
-        assert result == mock_tool.capture.return_value
+        mock_stop.assert_awaited_once()
 
     def test_capture_webpage_config_creation(self, temp_output_dir: Path) -> None:
         """Test that CaptureConfig is created with correct parameters."""
@@ -91,6 +94,7 @@ class TestCaptureWebpage:
                 subdirs=True,
                 output_format=ImageFormat.JPG,
                 anim_spf=1.0,
+                anim_optimize=True,
                 fetch_html=True,
                 fetch_image=False,
                 fetch_image_path=True,
@@ -116,6 +120,7 @@ class TestCaptureWebpage:
             assert config.subdirs is True
             assert config.format == ImageFormat.JPG
             assert config.anim_spf == 1.0
+            assert config.anim_optimize is True
             assert config.fetch_html is True
             assert config.fetch_image is False
             assert config.fetch_image_path is True
@@ -132,6 +137,7 @@ class TestCaptureWebpage:
             patch("brosh.api.dflt_output_folder") as mock_pictures_dir,
         ):
             mock_pictures_dir.return_value = "/home/user/Pictures"
+            _default_output_dir.cache_clear()
 
             # Mock the tool
             mock_tool = MagicMock()
@@ -144,6 +150,7 @@ class TestCaptureWebpage:
             # Verify config has correct output_dir
             config = mock_tool.capture.call_args[0][0]
             assert config.output_dir == "/home/user/Pictures"
+        _default_output_dir.cache_clear()
 
 
 class TestCaptureWebpageAsync:
@@ -156,6 +163,7 @@ class TestCaptureWebpageAsync:
             # Mock the tool instance
             mock_tool = MagicMock()
             mock_tool.capture = AsyncMock(return_value={"test.png": {"selector": "body"}})
+            mock_tool.browser_manager.shutdown = AsyncMock()
             mock_tool_class.return_value = mock_tool
 
             # Test the function
@@ -170,6 +178,29 @@ class TestCaptureWebpageAsync:
 
             # Verify result
             assert result == {"test.png": {"selector": "body"}}
+            mock_tool.browser_manager.shutdown.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_capture_webpage_async_closes_cached_context_and_connection(self, temp_output_dir: Path) -> None:
+        """Test the context and connection cached during the capture are closed afterwards."""
+        tool = BrowserScreenshotTool()
+        browser = AsyncMock()
+        context = AsyncMock()
+
+        async def capture(_config: CaptureConfig) -> dict:
+            # What get_browser_instance leaves behind for reuse
+            tool.browser_manager._browser_cache["chrome"] = browser
+            tool.browser_manager._context_cache[browser, 800, 600, 100] = context
+            return {}
+
+        with (
+            patch("brosh.api.BrowserScreenshotTool", return_value=tool),
+            patch.object(tool, "capture", AsyncMock(side_effect=capture)),
+        ):
+            await capture_webpage_async(url=AnyUrl("https://example.com"), output_dir=temp_output_dir)
+
+        context.close.assert_awaited_once()
+        browser.close.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_capture_webpage_async_config_validation(self, temp_output_dir: Path) -> None:
@@ -178,6 +209,7 @@ class TestCaptureWebpageAsync:
             # Mock the tool instance
             mock_tool = MagicMock()
             mock_tool.capture = AsyncMock(return_value={})
+            mock_tool.browser_manager.shutdown = AsyncMock()
             mock_tool_class.return_value = mock_tool
 
             # Test with all parameters
@@ -273,3 +305,66 @@ class TestAPIConvenienceMethods:
         except (AttributeError, NameError):
             # If it's not defined yet, that's fine for now
             pass
+
+
+class TestCaptureWebpages:
+    """Test the capture_webpages function."""
+
+    def test_capture_webpages_shares_one_tool(self, temp_output_dir: Path) -> None:
+        """Test all URLs go through one tool; a failing URL is left out of the results."""
+
+        async def capture(config: CaptureConfig) -> dict:
+            if config.url.endswith("/broken"):
+                msg = "No frames captured"
+                raise RuntimeError(msg)
+            return {f"{config.url}.png": {"selector": "body"}}
+
+        with (
+            patch("brosh.api.BrowserScreenshotTool") as mock_tool_class,
+            patch("brosh.api.BrowserManager.stop_playwright", AsyncMock()),
+        ):
+            mock_tool = mock_tool_class.return_value
+            mock_tool.capture = AsyncMock(side_effect=capture)
+            mock_tool.browser_manager.shutdown = AsyncMock()
+
+            result = capture_webpages(
+                ["https://example.com/a", "https://example.com/broken", "https://example.com/b"],
+                concurrency=2,
+                output_dir=temp_output_dir,
+                scale=50,
+            )
+
+        mock_tool_class.assert_called_once()
+        assert mock_tool.capture.await_count == 3
+        assert all(call.args[0].scale == 50 for call in mock_tool.capture.await_args_list)
+        mock_tool.browser_manager.shutdown.assert_awaited_once()
+        assert result == {
+            "https://example.com/a": {"https://example.com/a.png": {"selector": "body"}},
+            "https://example.com/b": {"https://example.com/b.png": {"selector": "body"}},
+        }
+
+    def test_capture_webpages_captures_duplicate_url_once(self, temp_output_dir: Path) -> None:
+        """Test a URL listed twice is captured once, so its files and result are not shared."""
+        with (
+            patch("brosh.api.BrowserScreenshotTool") as mock_tool_class,
+            patch("brosh.api.BrowserManager.stop_playwright", AsyncMock()),
+        ):
+            mock_tool = mock_tool_class.return_value
+            mock_tool.capture = AsyncMock(return_value={})
+            mock_tool.browser_manager.shutdown = AsyncMock()
+
+            result = capture_webpages(
+                ["https://example.com/a", "https://example.com/b", "https://example.com/a"],
+                output_dir=temp_output_dir,
+            )
+
+        assert [call.args[0].url for call in mock_tool.capture.await_args_list] == [
+            "https://example.com/a",
+            "https://example.com/b",
+        ]
+        assert list(result) == ["https://example.com/a", "https://example.com/b"]
+
+    def test_capture_webpages_rejects_zero_concurrency(self) -> None:
+        """Test a concurrency below one is refused before anything is captured."""
+        with pytest.raises(ValueError, match="Concurrency must be at least 1"):
+            capture_webpages(["https://example.com"], concurrency=0)
@@ -1,10 +1,46 @@
 """Tests for brosh.browser module."""
 
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from brosh.browser import BrowserManager
+from brosh.browser import (
+    BROWSER_CONNECT_INITIAL_DELAY_SECONDS,
+    BROWSER_CONNECT_MAX_ATTEMPTS,
+    BROWSER_CONNECT_MAX_DELAY_SECONDS,
+    HAS_PSUTIL,
+    BrowserManager,
+    _connect_retry_delays,
+    _debug_port_open,
+    _debug_profile_dir,
+    _kill_debug_processes,
+    _run_cleanup_command,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_browser_caches() -> None:
+    """Give each test fresh screen and browser probes."""
+    BrowserManager.clear_caches()
+    _debug_profile_dir.cache_clear()
+
+
+@contextmanager
+def simulated_platform(system: str) -> Iterator[None]:
+    """Make brosh.browser behave as if running on ``system``."""
+    with (
+        patch("brosh.browser._IS_DARWIN", system == "Darwin"),
+        patch("brosh.browser._IS_WINDOWS", system == "Windows"),
+    ):
+        yield
 
 
 class TestBrowserManager:
@@ -24,18 +60,10 @@ class TestBrowserManager:
         """Test get_browser_name with empty app string."""
         manager = BrowserManager()
 
-        with patch("platform.system") as mock_system:
-            # Test macOS
-            mock_system.return_value = "Darwin"
-            assert manager.get_browser_name("") == "chrome"
-
-            # Test Windows
-            mock_system.return_value = "Windows"
-            assert manager.get_browser_name("") == "chrome"
-
-            # Test Linux
-            mock_system.return_value = "Linux"
-            assert manager.get_browser_name("") == "chrome"
+        for system in ("Darwin", "Windows", "Linux"):
+            BrowserManager.clear_caches()
+            with simulated_platform(system):
+                assert manager.get_browser_name("") == "chrome"
 
     def test_get_browser_name_specific_browser(self) -> None:
         """Test get_browser_name with specific browser names."""
@@ -45,6 +73,28 @@ class TestBrowserManager:
         assert manager.get_browser_name("edge") == "edge"
         assert manager.get_browser_name("safari") == "safari"
 
+    @pytest.mark.parametrize(
+        ("app", "expected"),
+        [
+            ("Google Chrome", "chrome"),
+            ("chromium", "chrome"),
+            ("Microsoft Edge", "edge"),
+            ("msedge", "edge"),
+        ],
+    )
+    def test_get_browser_name_aliases(self, app: str, expected: str) -> None:
+        """Test app names are matched case-insensitively by substring."""
+        assert BrowserManager().get_browser_name(app) == expected
+
+    def test_get_browser_name_safari_requires_macos(self) -> None:
+        """Test Safari is only selected on macOS."""
+        with simulated_platform("Darwin"):
+            assert BrowserManager().get_browser_name("Safari") == "safari"
+
+        BrowserManager.clear_caches()
+        with simulated_platform("Linux"):
+            assert BrowserManager().get_browser_name("Safari") in ["chrome", "edge"]
+
     def test_get_browser_name_invalid_browser(self) -> None:
         """Test get_browser_name with invalid browser name."""
         manager = BrowserManager()
@@ -95,6 +145,46 @@ class TestBrowserManager:
             # This method should exist
             assert hasattr(manager, "launch_browser_and_connect")
 
+    @pytest.mark.asyncio
+    async def test_debug_port_open(self) -> None:
+        """Test the TCP probe tells a listening port from a closed one."""
+        server = await asyncio.start_server(lambda _reader, writer: writer.close(), "localhost", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            assert await _debug_port_open(port) is True
+        finally:
+            server.close()
+            await server.wait_closed()
+
+        assert await _debug_port_open(port) is False
+
+    @pytest.mark.asyncio
+    async def test_launch_browser_and_connect_returns_connection(self, tmp_path: Path) -> None:
+        """Test the CDP connection made to probe a launched browser is handed back."""
+        manager = BrowserManager()
+        chromium = AsyncMock()
+        connected = chromium.connect_over_cdp.return_value
+
+        with (
+            patch("brosh.browser.user_data_dir", return_value=str(tmp_path)),
+            patch("brosh.browser.Path.exists", return_value=True),
+            patch("brosh.browser.shutil.which", return_value=None),
+            patch("brosh.browser.subprocess.Popen") as mock_popen,
+            patch("brosh.browser.asyncio.sleep", AsyncMock()),
+            patch("brosh.browser._debug_port_open", AsyncMock(return_value=True)),
+        ):
+            browser = await manager.launch_browser_and_connect(
+                "/usr/bin/google-chrome", 9222, 1024, 768, chromium, "chrome"
+            )
+
+        assert browser is connected
+        mock_popen.assert_called_once()
+        args = mock_popen.call_args.args[0]
+        assert args[0] == "/usr/bin/google-chrome"
+        assert args[1:-1] == manager.get_browser_args("chrome", 1024, 768, 9222)
+        chromium.connect_over_cdp.assert_awaited_once()
+        connected.new_context.assert_not_called()
+
     def test_browser_failure_handling(self) -> None:
         """Test browser failure handling."""
         manager = BrowserManager()
@@ -125,7 +215,7 @@ class TestBrowserManager:
         mock_tk.return_value = mock_root
 
         manager = BrowserManager()
-        with patch("platform.system", return_value="Windows"):
+        with simulated_platform("Windows"):
             width, height = manager.get_screen_dimensions()
 
         assert width == 1920
@@ -138,13 +228,125 @@ class TestBrowserManager:
         mock_tk.side_effect = ImportError("No display")
 
         manager = BrowserManager()
-        with patch("platform.system", return_value="Windows"):
+        with simulated_platform("Windows"):
             width, height = manager.get_screen_dimensions()
 
         # Should fall back to defaults
         assert width == 1440
         assert height == 900
 
+    @patch("brosh.browser.subprocess.run")
+    def test_get_screen_dimensions_macos(self, mock_run: MagicMock) -> None:
+        """Test the macOS probe queries displays only and halves Retina sizes."""
+        mock_run.return_value = MagicMock(
+            stdout="Graphics/Displays:\n\n  Displays:\n    Color LCD:\n      Resolution: 2880 x 1800 Retina\n"
+        )
+
+        with (
+            simulated_platform("Darwin"),
+            patch("brosh.browser.ctypes.CDLL", side_effect=OSError),
+            patch("brosh.browser.shutil.which", return_value="/usr/sbin/system_profiler"),
+        ):
+            assert BrowserManager().get_screen_dimensions() == (1440, 900)
+
+        args = mock_run.call_args.args[0]
+        assert args == ["/usr/sbin/system_profiler", "SPDisplaysDataType", "-detailLevel", "mini"]
+
+    @pytest.mark.parametrize(
+        ("resolution_line", "expected"),
+        [
+            ("Resolution: 1920 x 1080 (1080p FHD - Full High Definition)", (1920, 1080)),
+            ("Resolution: 3024 x 1964 Retina", (1512, 982)),
+            ("Resolution: 5120 x 2880 (5K/UHD+ - Ultra High Definition Plus)", (2560, 1440)),
+            ("Main Display: Yes", (1440, 900)),
+        ],
+    )
+    @patch("brosh.browser.subprocess.run")
+    def test_get_screen_dimensions_macos_resolution_parsing(
+        self, mock_run: MagicMock, resolution_line: str, expected: tuple[int, int]
+    ) -> None:
+        """Test system_profiler Resolution lines map to logical sizes."""
+        mock_run.return_value = MagicMock(stdout=f"Displays:\n    Studio Display:\n      {resolution_line}\n")
+
+        with (
+            simulated_platform("Darwin"),
+            patch("brosh.browser.ctypes.CDLL", side_effect=OSError),
+            patch("brosh.browser.shutil.which", return_value="/usr/sbin/system_profiler"),
+        ):
+            assert BrowserManager().get_screen_dimensions() == expected
+
+    @patch("brosh.browser.subprocess.run")
+    @patch("brosh.browser.ctypes.CDLL")
+    def test_get_screen_dimensions_macos_coregraphics(self, mock_cdll: MagicMock, mock_run: MagicMock) -> None:
+        """Test the macOS probe reads CoreGraphics without spawning system_profiler."""
+        quartz = mock_cdll.return_value
+        quartz.CGDisplayPixelsWide.return_value = 1512
+        quartz.CGDisplayPixelsHigh.return_value = 982
+
+        with simulated_platform("Darwin"):
+            assert BrowserManager().get_screen_dimensions() == (1512, 982)
+
+        mock_run.assert_not_called()
+
+    @patch("tkinter.Tk")
+    def test_get_screen_dimensions_windows_metrics(self, mock_tk: MagicMock) -> None:
+        """Test the Windows probe uses GetSystemMetrics before tkinter."""
+        windll = MagicMock()
+        windll.user32.GetSystemMetrics.side_effect = {0: 2560, 1: 1440}.get
+
+        with simulated_platform("Windows"), patch("brosh.browser.ctypes.windll", windll, create=True):
+            assert BrowserManager().get_screen_dimensions() == (2560, 1440)
+
+        mock_tk.assert_not_called()
+
+    @patch("tkinter.Tk")
+    def test_get_screen_dimensions_cached(self, mock_tk: MagicMock) -> None:
+        """Test that the screen is probed once and shared across instances."""
+        mock_tk.return_value.winfo_screenwidth.return_value = 1920
+        mock_tk.return_value.winfo_screenheight.return_value = 1080
+
+        with simulated_platform("Windows"):
+            assert BrowserManager().get_screen_dimensions() == (1920, 1080)
+            assert BrowserManager().get_screen_dimensions() == (1920, 1080)
+            mock_tk.assert_called_once()
+
+            BrowserManager.clear_caches()
+            BrowserManager().get_screen_dimensions()
+            assert mock_tk.call_count == 2
+
+    def test_find_browser_path_cached(self) -> None:
+        """Test that browser directories are listed once per browser."""
+        manager = BrowserManager()
+
+        with patch("brosh.browser.os.scandir", side_effect=FileNotFoundError) as mock_scandir:
+            assert manager.find_browser_path("safari") is None
+            assert manager.is_browser_available("safari") is False
+            mock_scandir.assert_called_once()
+
+    def test_find_browser_path_priority(self, tmp_path: Path) -> None:
+        """Test that the first existing candidate wins and each directory is listed once."""
+        (tmp_path / "beta").touch()
+        (tmp_path / "gamma").touch()
+        candidates = [str(tmp_path / name) for name in ("alpha", "beta", "gamma")]
+
+        with (
+            patch("brosh.browser.shutil.which", return_value=None),
+            patch.object(BrowserManager, "get_browser_paths", return_value=candidates),
+            patch("brosh.browser.os.scandir", wraps=os.scandir) as mock_scandir,
+        ):
+            assert BrowserManager().find_browser_path("chrome") == candidates[1]
+            mock_scandir.assert_called_once_with(str(tmp_path))
+
+    def test_find_browser_path_prefers_path_lookup(self) -> None:
+        """Test that a browser on PATH is found without probing install locations."""
+        with (
+            patch("brosh.browser.shutil.which", return_value="/usr/local/bin/google-chrome") as mock_which,
+            patch("brosh.browser.os.scandir") as mock_scandir,
+        ):
+            assert BrowserManager().find_browser_path("chrome") == "/usr/local/bin/google-chrome"
+            mock_which.assert_called_once_with("google-chrome")
+            mock_scandir.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_browser_instance_chrome(self) -> None:
         """Test getting browser instance for Chrome."""
@@ -170,6 +372,131 @@ class TestBrowserManager:
         mock_browser.new_context.assert_called_once()
         mock_context.new_page.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_get_browser_instance_reuses_connection(self) -> None:
+        """Test a live CDP connection and its context are reused; only the page is recreated."""
+        manager = BrowserManager()
+        mock_playwright = AsyncMock()
+        mock_browser = AsyncMock()
+        mock_browser.is_connected = MagicMock(return_value=True)
+        mock_playwright.chromium.connect_over_cdp = AsyncMock(return_value=mock_browser)
+
+        first = await manager.get_browser_instance(mock_playwright, "chrome", 1024, 768, 100)
+        await manager.cleanup_browser(first[2], first[1], first[0])
+        second = await manager.get_browser_instance(mock_playwright, "chrome", 1024, 768, 100)
+
+        assert second[0] is first[0] is mock_browser
+        assert second[1] is first[1]
+        mock_playwright.chromium.connect_over_cdp.assert_awaited_once()
+        mock_browser.new_context.assert_awaited_once()
+        assert first[1].new_page.await_count == 2
+        first[1].close.assert_not_called()
+        mock_browser.close.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_get_browser_instance_connects_once(self) -> None:
+        """Test captures started together share one CDP connection and one context."""
+        manager = BrowserManager()
+        mock_playwright = AsyncMock()
+        mock_browser = AsyncMock()
+        mock_browser.is_connected = MagicMock(return_value=True)
+        mock_playwright.chromium.connect_over_cdp = AsyncMock(return_value=mock_browser)
+
+        results = await asyncio.gather(
+            *(manager.get_browser_instance(mock_playwright, "chrome", 1024, 768, 100) for _ in range(3))
+        )
+
+        mock_playwright.chromium.connect_over_cdp.assert_awaited_once()
+        mock_browser.new_context.assert_awaited_once()
+        assert len({id(context) for _, context, _ in results}) == 1
+
+    @pytest.mark.asyncio
+    async def test_get_browser_instance_context_per_viewport(self) -> None:
+        """Test captures with a different viewport or zoom get a context of their own."""
+        manager = BrowserManager()
+        mock_playwright = AsyncMock()
+        mock_browser = AsyncMock()
+        mock_browser.is_connected = MagicMock(return_value=True)
+        mock_browser.new_context.side_effect = lambda **_kwargs: AsyncMock()
+        mock_playwright.chromium.connect_over_cdp = AsyncMock(return_value=mock_browser)
+
+        _, first, _ = await manager.get_browser_instance(mock_playwright, "chrome", 1024, 768, 100)
+        _, resized, _ = await manager.get_browser_instance(mock_playwright, "chrome", 800, 768, 100)
+        _, zoomed, _ = await manager.get_browser_instance(mock_playwright, "chrome", 1024, 768, 150)
+
+        assert len({id(first), id(resized), id(zoomed)}) == 3
+
+    @pytest.mark.asyncio
+    async def test_get_browser_instance_replaces_unusable_context(self) -> None:
+        """Test a cached context that can no longer open pages is replaced."""
+        manager = BrowserManager()
+        mock_playwright = AsyncMock()
+        mock_browser = AsyncMock()
+        mock_browser.is_connected = MagicMock(return_value=True)
+        closed_context, fresh_context = AsyncMock(), AsyncMock()
+        mock_browser.new_context.side_effect = [closed_context, fresh_context]
+        mock_playwright.chromium.connect_over_cdp = AsyncMock(return_value=mock_browser)
+
+        await manager.get_browser_instance(mock_playwright, "chrome", 1024, 768, 100)
+        closed_context.new_page.side_effect = RuntimeError("Target page, context or browser has been closed")
+        _, context, _ = await manager.get_browser_instance(mock_playwright, "chrome", 1024, 768, 100)
+
+        assert context is fresh_context
+
+    @pytest.mark.asyncio
+    async def test_shutdown_closes_cached_contexts_and_connections(self) -> None:
+        """Test shutdown closes what cleanup_browser kept open for reuse."""
+        manager = BrowserManager()
+        mock_playwright = AsyncMock()
+        mock_browser = AsyncMock()
+        mock_browser.is_connected = MagicMock(return_value=True)
+        mock_playwright.chromium.connect_over_cdp = AsyncMock(return_value=mock_browser)
+
+        browser, context, page = await manager.get_browser_instance(mock_playwright, "chrome", 1024, 768, 100)
+        await manager.cleanup_browser(page, context, browser)
+        await manager.shutdown()
+
+        context.close.assert_awaited_once()
+        mock_browser.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_browser_instance_reconnects_when_disconnected(self) -> None:
+        """Test a dropped cached connection is replaced by a new one."""
+        manager = BrowserManager()
+        mock_playwright = AsyncMock()
+        stale_browser = AsyncMock()
+        stale_browser.is_connected = MagicMock(return_value=False)
+        fresh_browser = AsyncMock()
+        mock_playwright.chromium.connect_over_cdp = AsyncMock(side_effect=[stale_browser, fresh_browser])
+
+        await manager.get_browser_instance(mock_playwright, "chrome", 1024, 768, 100)
+        browser, _, _ = await manager.get_browser_instance(mock_playwright, "chrome", 1024, 768, 100)
+
+        assert browser is fresh_browser
+        assert mock_playwright.chromium.connect_over_cdp.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_browser_instance_launches_installed_paths_only(self, tmp_path: Path) -> None:
+        """Test only installed executables are launched when no browser is listening."""
+        installed = tmp_path / "chrome"
+        installed.touch()
+        candidates = [str(tmp_path / "missing"), str(installed)]
+        mock_playwright = AsyncMock()
+        mock_playwright.chromium.connect_over_cdp = AsyncMock(side_effect=ConnectionRefusedError)
+        launched = AsyncMock()
+
+        manager = BrowserManager()
+        with (
+            patch("brosh.browser.shutil.which", return_value=None),
+            patch.object(BrowserManager, "get_browser_paths", return_value=candidates),
+            patch.object(manager, "launch_browser_and_connect", AsyncMock(return_value=launched)) as mock_launch,
+        ):
+            browser, _, _ = await manager.get_browser_instance(mock_playwright, "chrome", 1024, 768, 100)
+
+        assert browser is launched
+        mock_launch.assert_awaited_once()
+        assert mock_launch.call_args.args[0] == str(installed)
+
     @pytest.mark.asyncio
     async def test_get_browser_instance_firefox(self) -> None:
         """Test getting browser instance for Firefox."""
@@ -217,6 +544,114 @@ class TestBrowserManager:
         with pytest.raises(RuntimeError, match="Could not connect to or launch unsupported browser"):
             await manager.get_browser_instance(mock_playwright, "unsupported", 1024, 768, 100)
 
+    def test_connect_retry_delays_back_off(self) -> None:
+        """Test connection retries start fast and back off up to the cap."""
+        delays = list(_connect_retry_delays())
+
+        assert len(delays) == BROWSER_CONNECT_MAX_ATTEMPTS
+        assert delays[0] <= BROWSER_CONNECT_INITIAL_DELAY_SECONDS
+        assert all(0 < delay <= BROWSER_CONNECT_MAX_DELAY_SECONDS for delay in delays)
+        assert delays[-1] > delays[0]
+
+    @pytest.mark.asyncio
+    async def test_run_cleanup_command_waits_for_exit(self) -> None:
+        """Test cleanup commands run to completion on the event loop."""
+        await _run_cleanup_command(sys.executable, "-c", "pass")
+
+    @pytest.mark.asyncio
+    async def test_run_cleanup_command_kills_on_timeout(self) -> None:
+        """Test a hung cleanup command is killed after the timeout."""
+        start = time.monotonic()
+        with patch("brosh.browser.SUBPROCESS_PKILL_TIMEOUT", 0.2):
+            await _run_cleanup_command(sys.executable, "-c", "import time; time.sleep(30)")
+        assert time.monotonic() - start < 10
+
+    @pytest.mark.skipif(not HAS_PSUTIL, reason="psutil not installed")
+    def test_kill_debug_processes_matches_port(self) -> None:
+        """Test only processes started with our debug port are stopped."""
+        sleeper = [sys.executable, "-c", "import time; time.sleep(30)"]
+        ours = subprocess.Popen([*sleeper, "--remote-debugging-port=65001"])
+        other = subprocess.Popen([*sleeper, "--remote-debugging-port=65002"])
+        try:
+            _kill_debug_processes(65001)
+
+            assert ours.wait(timeout=5) is not None
+            assert other.poll() is None
+        finally:
+            ours.kill()
+            other.kill()
+            ours.wait()
+            other.wait()
+
+    @pytest.mark.asyncio
+    async def test_get_playwright_shared_per_loop(self) -> None:
+        """Test one Playwright driver is started per event loop and reused until stopped."""
+        driver = AsyncMock()
+        starter = MagicMock()
+        starter.return_value.start = AsyncMock(return_value=driver)
+
+        with patch("playwright.async_api.async_playwright", starter):
+            first, second = await asyncio.gather(BrowserManager.get_playwright(), BrowserManager.get_playwright())
+            assert first is second is driver
+            starter.assert_called_once()
+
+            await BrowserManager.stop_playwright()
+            driver.stop.assert_awaited_once()
+            await BrowserManager.get_playwright()
+            assert starter.call_count == 2
+            await BrowserManager.stop_playwright()
+
+    @pytest.mark.asyncio
+    async def test_cleanup_browser_closes_concurrently(self) -> None:
+        """Test page and context close together and one failure does not stop the other."""
+        manager = BrowserManager()
+        page, context = AsyncMock(), AsyncMock()
+        page_closing = asyncio.Event()
+
+        async def close_page() -> None:
+            page_closing.set()
+            await asyncio.sleep(0)
+            msg = "Target closed"
+            raise RuntimeError(msg)
+
+        async def close_context() -> None:
+            assert page_closing.is_set()
+
+        page.close.side_effect = close_page
+        context.close.side_effect = close_context
+
+        await manager.cleanup_browser(page, context, None)
+
+        page.close.assert_awaited_once()
+        context.close.assert_awaited_once()
+
+    def test_get_browser_args_profile_per_browser(self, tmp_path: Path) -> None:
+        """Test Chrome and Edge get separate, existing debug profiles."""
+        manager = BrowserManager()
+
+        with patch("brosh.browser.user_data_dir", return_value=str(tmp_path)):
+            chrome_args = manager.get_browser_args("chrome", 1024, 768, manager.debug_ports["chrome"])
+            edge_args = manager.get_browser_args("edge", 1024, 768, manager.debug_ports["edge"])
+
+        chrome_dirs = [arg.partition("=")[2] for arg in chrome_args if arg.startswith("--user-data-dir=")]
+        edge_dirs = [arg.partition("=")[2] for arg in edge_args if arg.startswith("--user-data-dir=")]
+        assert len(chrome_dirs) == len(edge_dirs) == 1
+        assert chrome_dirs != edge_dirs
+        assert Path(chrome_dirs[0]).is_dir()
+        assert Path(chrome_dirs[0]).is_relative_to(tmp_path)
+
+    def test_get_browser_args_headless(self, tmp_path: Path) -> None:
+        """Test headless launches add the windowless flags, and only then."""
+        manager = BrowserManager()
+
+        with patch("brosh.browser.user_data_dir", return_value=str(tmp_path)):
+            windowed = manager.get_browser_args("chrome", 1024, 768, 9222)
+            headless = manager.get_browser_args("chrome", 1024, 768, 9222, headless=True)
+
+        assert "--headless=new" not in windowed
+        assert headless[: len(windowed)] == windowed
+        assert headless[len(windowed) :] == ["--headless=new", "--disable-gpu"]
+
     def test_debug_ports_configuration(self) -> None:
         """Test that debug ports are properly configured."""
         manager = BrowserManager()
@@ -228,24 +663,25 @@ class TestBrowserManager:
             assert isinstance(manager.debug_ports[browser], int)
             assert manager.debug_ports[browser] > 0
 
-    @patch("platform.system")
-    def test_platform_specific_browser_commands(self, mock_system: MagicMock) -> None:
+    def test_platform_specific_browser_commands(self) -> None:
         """Test platform-specific browser command generation."""
         manager = BrowserManager()
 
         # Test macOS
-        mock_system.return_value = "Darwin"
-        chrome_name = manager.get_browser_name("")
+        with simulated_platform("Darwin"):
+            chrome_name = manager.get_browser_name("")
         assert chrome_name in ["chrome", "edge", "safari"]
 
         # Test Windows
-        mock_system.return_value = "Windows"
-        chrome_name = manager.get_browser_name("")
+        BrowserManager.clear_caches()
+        with simulated_platform("Windows"):
+            chrome_name = manager.get_browser_name("")
         assert chrome_name in ["chrome", "edge"]
 
         # Test Linux
-        mock_system.return_value = "Linux"
-        chrome_name = manager.get_browser_name("")
+        BrowserManager.clear_caches()
+        with simulated_platform("Linux"):
+            chrome_name = manager.get_browser_name("")
         assert chrome_name == "chrome"
 
     @pytest.mark.asyncio
@@ -268,6 +704,13 @@ class TestBrowserManager:
 
         # Check that context was created with proper settings
         mock_browser.new_context.assert_called_once()
+        mock_context.add_init_script.assert_awaited_once()
+        assert "document.body.style.zoom = '150%'" in mock_context.add_init_script.call_args.args[0]
+        mock_page.add_init_script.assert_not_called()
+
+        # A second capture with the same zoom reuses the context and its script
+        await manager.get_browser_instance(mock_playwright, "chrome", 1024, 768, 150)
+        mock_context.add_init_script.assert_awaited_once()
 
 
 class TestBrowserManagerEdgeCases:
@@ -292,7 +735,7 @@ class TestBrowserManagerEdgeCases:
         browsers = ["chrome", "edge", "safari"]
 
         for platform in platforms:
-            with patch("platform.system", return_value=platform):
+            with simulated_platform(platform):
                 for browser in browsers:
                     # Test that browser methods work
                     available = manager.is_browser_available(browser)
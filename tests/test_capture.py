@@ -0,0 +1,166 @@
+"""Tests for brosh.capture — scroll planning (no browser needed)."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from brosh.capture import PAGE_DIMENSIONS_JS, CaptureManager
+from brosh.models import CaptureConfig, ImageFormat
+from brosh.texthtml import GET_FRAME_CONTENT_JS
+
+
+class TestCalculateScrollPositions:
+    def test_positions_step_by_viewport_fraction(self) -> None:
+        positions = CaptureManager()._calculate_scroll_positions(
+            start_pos=0, page_height=1000, viewport_height=400, scroll_step=50, max_frames=0
+        )
+        assert positions == [0, 200, 400, 600, 800]
+
+    def test_fractional_start_is_truncated(self) -> None:
+        positions = CaptureManager()._calculate_scroll_positions(
+            start_pos=150.7, page_height=1000, viewport_height=400, scroll_step=100, max_frames=0
+        )
+        assert positions == [150, 550, 950]
+
+    def test_max_frames_limits_positions(self) -> None:
+        positions = CaptureManager()._calculate_scroll_positions(
+            start_pos=0, page_height=100_000, viewport_height=400, scroll_step=100, max_frames=3
+        )
+        assert positions == [0, 400, 800]
+
+    def test_zero_step_still_terminates(self) -> None:
+        positions = CaptureManager()._calculate_scroll_positions(
+            start_pos=0, page_height=5, viewport_height=1, scroll_step=10, max_frames=0
+        )
+        assert positions == [0, 1, 2, 3, 4]
+
+
+class TestCaptureFrames:
+    @pytest.mark.asyncio
+    async def test_busy_network_does_not_block_capture(self) -> None:
+        """Pages that never reach network idle are still captured once the short wait runs out."""
+
+        async def evaluate(script: str, *_args: object) -> object:
+            if script == PAGE_DIMENSIONS_JS:
+                return [1000, 500]
+            if script == GET_FRAME_CONTENT_JS:
+                return {"html": "<p>Hi</p>", "selector": "main", "sectionId": "intro"}
+            return None
+
+        page = AsyncMock()
+        page.evaluate.side_effect = evaluate
+        page.wait_for_load_state.side_effect = PlaywrightTimeoutError("networkidle")
+        page.screenshot.return_value = b"\x89PNG"
+        config = CaptureConfig(url="https://example.com", height=500, max_frames=1)
+
+        frames = await CaptureManager().capture_frames(page, config)
+
+        page.wait_for_load_state.assert_awaited_once()
+        assert page.wait_for_load_state.await_args.args == ("networkidle",)
+        assert [frame.scroll_position_y for frame in frames] == [0]
+        assert frames[0].active_selector == "main"
+        assert frames[0].section_id == "intro"
+
+
+class TestHandleFromSelector:
+    @pytest.mark.asyncio
+    async def test_selector_is_passed_as_argument(self) -> None:
+        """Quotes in the selector must reach querySelector verbatim, not break the script."""
+        page = AsyncMock()
+        page.evaluate.return_value = 640
+        selector = "a[href='/docs']"
+
+        assert await CaptureManager()._handle_from_selector(page, selector) == 640
+
+        script, arg = page.evaluate.await_args.args
+        assert selector not in script
+        assert arg == selector
+
+    @pytest.mark.asyncio
+    async def test_empty_selector_skips_page(self) -> None:
+        page = AsyncMock()
+
+        assert await CaptureManager()._handle_from_selector(page, "") == 0
+        page.evaluate.assert_not_awaited()
+
+
+class TestCaptureSingleFrame:
+    @pytest.mark.asyncio
+    async def test_hung_screenshot_is_abandoned(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A screenshot whose CDP call never returns must not stall the capture loop."""
+        monkeypatch.setattr("brosh.capture.PLAYWRIGHT_TIMEOUT_SLACK_SECONDS", 0.05)
+
+        async def hang(**_kwargs: object) -> bytes:
+            await asyncio.Event().wait()
+            return b""
+
+        page = AsyncMock()
+        page.screenshot = hang
+        page.evaluate.return_value = {"html": "", "selector": "body", "sectionId": "section"}
+
+        frame = await CaptureManager(screenshot_timeout=0)._capture_single_frame(page, 0, 1000, 500, fetch_html=False)
+
+        assert frame is None
+
+    @pytest.mark.asyncio
+    async def test_hung_scroll_is_abandoned(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The deadline also covers the scroll, not just the screenshot and DOM reads."""
+        monkeypatch.setattr("brosh.capture.PLAYWRIGHT_TIMEOUT_SLACK_SECONDS", 0.05)
+
+        async def hang(*_args: object) -> None:
+            await asyncio.Event().wait()
+
+        page = AsyncMock()
+        page.evaluate = hang
+
+        frame = await CaptureManager(screenshot_timeout=0)._capture_single_frame(page, 0, 1000, 500, fetch_html=False)
+
+        assert frame is None
+        page.screenshot.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_screenshot_spooled_to_disk(self, tmp_path: Path) -> None:
+        """With a spool directory the frame keeps a path to the screenshot, not its bytes."""
+        page = AsyncMock()
+        page.screenshot.return_value = b"\x89PNG"
+        page.evaluate.return_value = {"html": "", "selector": "body", "sectionId": "section"}
+
+        frame = await CaptureManager()._capture_single_frame(page, 400, 1000, 500, fetch_html=False, spool_dir=tmp_path)
+
+        assert frame is not None
+        assert frame.image_bytes is None
+        assert frame.image_path is not None
+        assert frame.image_path.parent == tmp_path
+        assert frame.load_image_bytes() == b"\x89PNG"
+
+    @pytest.mark.asyncio
+    async def test_jpeg_encoded_by_browser(self, tmp_path: Path) -> None:
+        """A JPG frame is requested from the browser as JPEG and marked as such."""
+        page = AsyncMock()
+        page.screenshot.return_value = b"\xff\xd8"
+        page.evaluate.return_value = {"html": "", "selector": "body", "sectionId": "section"}
+
+        frame = await CaptureManager()._capture_single_frame(
+            page, 0, 1000, 500, fetch_html=False, spool_dir=tmp_path, image_format=ImageFormat.JPG
+        )
+
+        assert frame is not None
+        assert page.screenshot.await_args.kwargs["type"] == "jpeg"
+        assert frame.image_format == ImageFormat.JPG
+        assert frame.image_path is not None
+        assert frame.image_path.suffix == ".jpg"
+
+    @pytest.mark.asyncio
+    async def test_animations_disabled_for_screenshot(self) -> None:
+        page = AsyncMock()
+        page.screenshot.return_value = b"\x89PNG"
+        page.evaluate.return_value = {"html": "", "selector": "body", "sectionId": "section"}
+
+        await CaptureManager()._capture_single_frame(page, 0, 1000, 500, fetch_html=False)
+
+        kwargs = page.screenshot.await_args.kwargs
+        assert kwargs["animations"] == "disabled"
+        assert kwargs["full_page"] is False
@@ -1,11 +1,12 @@
 """Tests for brosh.cli module."""
 
+import socket
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from brosh.cli import BrowserScreenshotCLI
+from brosh.cli import BrowserScreenshotCLI, _wait_for_debug_port
 
 
 class TestBrowserScreenshotCLI:
@@ -75,15 +76,39 @@ class TestBrowserScreenshotCLI:
         mock_instance.get_browser_name.return_value = "chrome"
         mock_instance.find_browser_path.return_value = "/path/to/chrome"
         mock_instance.get_browser_args.return_value = ["--remote-debugging-port=9222"]
+        mock_instance.debug_ports = {"chrome": 9222}
 
         cli = BrowserScreenshotCLI()
         with (
             patch("urllib.request.urlopen", side_effect=Exception("no connection")),
             patch("brosh.cli.shutil.which", return_value="/path/to/chrome"),
+            patch("brosh.cli._wait_for_debug_port", return_value=True) as mock_wait,
         ):
             result = cli.run()
-            assert "Started chrome" in result
+            assert "Started chrome in debug mode on port 9222" in result
             mock_popen.assert_called_once()
+            mock_wait.assert_called_once_with(9222)
+            mock_instance.get_browser_args.assert_called_once_with("chrome", 1440, 900, 9222, headless=False)
+
+    @patch("brosh.cli.BrowserManager")
+    @patch("brosh.cli.subprocess.Popen")
+    def test_cli_run_headless(self, mock_popen: MagicMock, mock_browser_manager: MagicMock) -> None:
+        """`run` asks for headless launch arguments when the CLI is headless."""
+        mock_instance = mock_browser_manager.return_value
+        mock_instance.get_browser_name.return_value = "chrome"
+        mock_instance.get_browser_args.return_value = ["--remote-debugging-port=9222", "--headless=new"]
+        mock_instance.debug_ports = {"chrome": 9222}
+
+        cli = BrowserScreenshotCLI(width=800, height=600, headless=True)
+        with (
+            patch("urllib.request.urlopen", side_effect=OSError("no connection")),
+            patch("brosh.cli.shutil.which", return_value="/path/to/chrome"),
+            patch("brosh.cli._wait_for_debug_port", return_value=True),
+        ):
+            cli.run()
+
+        mock_instance.get_browser_args.assert_called_once_with("chrome", 800, 600, 9222, headless=True)
+        assert "--headless=new" in mock_popen.call_args.args[0]
 
     @patch("brosh.cli.BrowserManager")
     @patch("brosh.cli.subprocess.Popen")
@@ -97,6 +122,8 @@ class TestBrowserScreenshotCLI:
         with (
             patch("urllib.request.urlopen"),
             patch("brosh.cli.shutil.which", return_value="/path/to/chrome"),
+            patch("brosh.cli.time.sleep"),
+            patch("brosh.cli._wait_for_debug_port", return_value=True),
             patch.object(cli, "quit", return_value=None) as mock_quit,
         ):
             result = cli.run(force_run=True)
@@ -104,6 +131,49 @@ class TestBrowserScreenshotCLI:
             assert "Started chrome" in result
             mock_popen.assert_called_once()
 
+    @patch("brosh.cli.BrowserManager")
+    @patch("brosh.cli.subprocess.run")
+    @patch("brosh.cli.subprocess.Popen")
+    def test_cli_quit_stops_launched_browser(
+        self, mock_popen: MagicMock, mock_run: MagicMock, mock_browser_manager: MagicMock
+    ) -> None:
+        """`quit` stops the browser `run` launched instead of scanning the process table."""
+        mock_instance = mock_browser_manager.return_value
+        mock_instance.get_browser_name.return_value = "chrome"
+        mock_instance.get_browser_args.return_value = ["--remote-debugging-port=9222"]
+        mock_instance.debug_ports = {"chrome": 9222}
+        process = mock_popen.return_value
+        process.poll.return_value = None
+
+        cli = BrowserScreenshotCLI()
+        with (
+            patch("urllib.request.urlopen", side_effect=OSError("no connection")),
+            patch("brosh.cli.shutil.which", return_value="/path/to/chrome"),
+            patch("brosh.cli._wait_for_debug_port", return_value=True),
+        ):
+            cli.run()
+
+        assert cli.quit() == "Quit chrome"
+        process.terminate.assert_called_once()
+        process.wait.assert_called_once()
+        mock_run.assert_not_called()
+
+    @patch("brosh.cli.BrowserManager")
+    @patch("brosh.cli.subprocess.run")
+    def test_cli_quit_without_launched_browser_falls_back(
+        self, mock_run: MagicMock, mock_browser_manager: MagicMock
+    ) -> None:
+        """Without a browser of its own, `quit` falls back to pkill/taskkill."""
+        mock_instance = mock_browser_manager.return_value
+        mock_instance.get_browser_name.return_value = "chrome"
+        mock_instance.debug_ports = {"chrome": 9222}
+
+        cli = BrowserScreenshotCLI()
+        with patch("brosh.cli.shutil.which", return_value="/usr/bin/kill-tool"):
+            assert cli.quit() == "Quit chrome"
+
+        mock_run.assert_called()
+
     @patch("brosh.cli.capture_webpage")
     def test_cli_capture_basic(self, mock_capture: MagicMock, temp_output_dir: Path) -> None:
         """Test basic capture functionality."""
@@ -113,6 +183,23 @@ class TestBrowserScreenshotCLI:
         assert result
         mock_capture.assert_called_once()
 
+    @patch("brosh.cli.capture_webpages")
+    def test_cli_shot_many(self, mock_capture_many: MagicMock, temp_output_dir: Path) -> None:
+        """Test several URLs are handed to one batch capture with the global options."""
+        mock_capture_many.return_value = {"https://a.example": {"a.png": {"selector": "body", "text": "x" * 500}}}
+        cli = BrowserScreenshotCLI(zoom=125, output_dir=temp_output_dir)
+
+        with patch.object(cli, "run") as mock_run:
+            result = cli.shot_many("https://a.example", "https://b.example", concurrency=2, scale=50)
+
+        mock_run.assert_called_once_with(force_run=False)
+        args, kwargs = mock_capture_many.call_args
+        assert args == (["https://a.example", "https://b.example"],)
+        assert kwargs["concurrency"] == 2
+        assert kwargs["zoom"] == 125
+        assert kwargs["scale"] == 50
+        assert len(result["https://a.example"]["a.png"]["text"]) < 500
+
     @patch("brosh.cli.capture_webpage")
     def test_cli_with_different_browsers(self, mock_capture: MagicMock, temp_output_dir: Path) -> None:
         """Test CLI with different browser selections."""
@@ -135,6 +222,16 @@ class TestBrowserScreenshotCLI:
         cli_custom = BrowserScreenshotCLI(output_dir=str(temp_output_dir))
         assert Path(cli_custom.output_dir) == temp_output_dir
 
+    def test_cli_default_output_dir_resolved_lazily(self) -> None:
+        """Commands that never save screenshots do not look up the pictures folder."""
+        with patch("brosh.cli.dflt_output_folder", return_value=Path("/pics/brosh")) as mock_folder:
+            cli = BrowserScreenshotCLI()
+            mock_folder.assert_not_called()
+
+            assert cli.output_dir == Path("/pics/brosh")
+            assert cli.output_dir == Path("/pics/brosh")
+            mock_folder.assert_called_once()
+
     def test_cli_verbose_logging(self) -> None:  # Removed unused mock_browser_manager
         """Test verbose logging configuration."""
         with patch("brosh.cli.logger") as mock_logger:
@@ -263,3 +360,21 @@ class TestCLIUtilities:
         # Test specific browser
         cli_firefox = BrowserScreenshotCLI(app="firefox")
         assert cli_firefox.app == "firefox"
+
+
+class TestWaitForDebugPort:
+    """Test polling the browser debug port after launch."""
+
+    def test_returns_true_when_port_accepts(self) -> None:
+        """A listening port is detected on the first connect."""
+        with socket.socket() as server:
+            server.bind(("127.0.0.1", 0))
+            server.listen()
+            assert _wait_for_debug_port(server.getsockname()[1], timeout=1) is True
+
+    def test_returns_false_after_timeout(self) -> None:
+        """A port nobody listens on gives up once the timeout passes."""
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+        assert _wait_for_debug_port(port, timeout=0.1) is False
@@ -2,9 +2,10 @@
 
 import io
 
-from PIL import Image
+import pytest
+from PIL import Image, ImageDraw
 
-from brosh.image import ImageProcessor
+from brosh.image import HAS_PYVIPS, ImageProcessor
 
 
 def _png_bytes(size: tuple[int, int] = (40, 30), mode: str = "RGB", color: tuple = (200, 100, 50)) -> bytes:
@@ -36,11 +37,37 @@ class TestDownsamplePng:
         img = Image.open(io.BytesIO(result))
         assert img.size == (50, 40)
 
+    @pytest.mark.skipif(not HAS_PYVIPS, reason="pyvips/libvips not installed")
+    def test_vips_downsample_matches_pillow_dimensions(self) -> None:
+        """The libvips path truncates sizes exactly like the Pillow path."""
+        png = _png_bytes((101, 81))
+        result = ImageProcessor._downsample_png_bytes_vips(png, scale=50)
+        assert Image.open(io.BytesIO(result)).size == (50, 40)
+
+    def test_fast_compress_level_keeps_pixels(self) -> None:
+        """A low compress_level only changes the encoding, not the scaled image."""
+        png = _png_bytes((100, 80))
+        default = Image.open(io.BytesIO(ImageProcessor.downsample_png_bytes(png, scale=50)))
+        fast = Image.open(io.BytesIO(ImageProcessor.downsample_png_bytes(png, scale=50, compress_level=1)))
+        assert fast.size == default.size
+        assert fast.tobytes() == default.tobytes()
+
     def test_downsample_bad_bytes_returns_input(self) -> None:
         garbage = b"broken"
         assert ImageProcessor.downsample_png_bytes(garbage, scale=50) == garbage
 
 
+class TestOptimizePngBatch:
+    def test_batch_matches_single_optimization_in_order(self) -> None:
+        """Batch output equals optimizing each image on its own, in input order."""
+        images = [_png_bytes(color=(i * 40, 0, 0)) for i in range(4)]
+        expected = [ImageProcessor.optimize_png_bytes(png) for png in images]
+        assert ImageProcessor.optimize_png_batch(images, workers=2) == expected
+
+    def test_empty_batch(self) -> None:
+        assert ImageProcessor.optimize_png_batch([]) == []
+
+
 class TestConvertToJpg:
     def test_rgb_png_becomes_jpeg(self) -> None:
         result = ImageProcessor.convert_png_to_jpg_bytes(_png_bytes())
@@ -53,6 +80,14 @@ class TestConvertToJpg:
         assert img.format == "JPEG"
         assert img.mode == "RGB"
 
+    def test_transparent_pixels_become_white(self) -> None:
+        """Fully transparent RGBA and LA pixels come out white, not black."""
+        for mode, color in (("RGBA", (0, 0, 0, 0)), ("LA", (0, 0))):
+            buf = io.BytesIO()
+            Image.new(mode, (16, 16), color).save(buf, format="PNG")
+            img = Image.open(io.BytesIO(ImageProcessor.convert_png_to_jpg_bytes(buf.getvalue())))
+            assert all(channel > 250 for channel in img.getpixel((8, 8)))
+
     def test_palette_png_becomes_jpeg(self) -> None:
         result = ImageProcessor.convert_png_to_jpg_bytes(_png_bytes(mode="P"))
         assert Image.open(io.BytesIO(result)).format == "JPEG"
@@ -62,6 +97,30 @@ class TestConvertToJpg:
         assert ImageProcessor.convert_png_to_jpg_bytes(garbage) == garbage
 
 
+class TestDownsampleToJpg:
+    def test_scaled_jpeg_in_one_pass(self) -> None:
+        result = ImageProcessor.downsample_to_jpg_bytes(_png_bytes((100, 80)), scale=50)
+        img = Image.open(io.BytesIO(result))
+        assert img.format == "JPEG"
+        assert img.size == (50, 40)
+
+    @pytest.mark.parametrize(
+        "backend",
+        ["pillow", pytest.param("vips", marks=pytest.mark.skipif(not HAS_PYVIPS, reason="needs pyvips"))],
+    )
+    def test_transparency_flattened_to_white(self, backend: str, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("brosh.image.HAS_PYVIPS", backend == "vips")
+        buf = io.BytesIO()
+        Image.new("RGBA", (32, 32), (0, 0, 0, 0)).save(buf, format="PNG")
+        img = Image.open(io.BytesIO(ImageProcessor.downsample_to_jpg_bytes(buf.getvalue(), scale=50)))
+        assert img.mode == "RGB"
+        assert all(channel > 250 for channel in img.getpixel((8, 8)))
+
+    def test_bad_bytes_returns_input(self) -> None:
+        garbage = b"nope"
+        assert ImageProcessor.downsample_to_jpg_bytes(garbage, scale=50) == garbage
+
+
 class TestCreateApng:
     def test_multiple_frames_produce_animated_png(self) -> None:
         frames = [_png_bytes(color=(255, 0, 0)), _png_bytes(color=(0, 255, 0))]
@@ -70,5 +129,33 @@ class TestCreateApng:
         assert img.format == "PNG"
         assert getattr(img, "n_frames", 1) == 2
 
+    def test_frames_keep_their_order_and_pixels(self) -> None:
+        """Frames decoded on demand still come out in order with their own content."""
+        colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+        result = ImageProcessor.create_apng_bytes([_png_bytes(color=c) for c in colors])
+        img = Image.open(io.BytesIO(result))
+        for index, color in enumerate(colors):
+            img.seek(index)
+            assert img.convert("RGB").getpixel((0, 0)) == color
+
     def test_empty_frame_list_returns_empty_bytes(self) -> None:
         assert ImageProcessor.create_apng_bytes([]) == b""
+
+    def test_optimize_keeps_frames_and_shrinks_output(self) -> None:
+        # Text-like frames, where the zlib level makes a measurable difference
+        frame_bytes = []
+        for offset in (0, 7):
+            img = Image.new("RGB", (200, 150), "white")
+            draw = ImageDraw.Draw(img)
+            for y in range(0, 150, 12):
+                draw.text((5 + offset, y), f"Lorem ipsum dolor sit amet {y}", fill=(0, 0, 0))
+            buf = io.BytesIO()
+            img.save(buf, format="PNG")
+            frame_bytes.append(buf.getvalue())
+
+        fast = ImageProcessor.create_apng_bytes(frame_bytes)
+        optimized = ImageProcessor.create_apng_bytes(frame_bytes, optimize=True)
+
+        assert len(optimized) < len(fast)
+        with Image.open(io.BytesIO(optimized)) as img:
+            assert img.n_frames == 2
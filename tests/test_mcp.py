@@ -5,11 +5,18 @@ import json
 from PIL import Image
 
 from brosh.mcp import (
+    MCP_COMPRESSION_DOWNSAMPLE_PERCENTAGE,
+    MCP_COMPRESSION_MIN_DOWNSAMPLE_PERCENTAGE,
     MCP_MAX_SIZE_BYTES,
     _apply_size_limits,
     _convert_to_mcp_result,
+    _downsample_percentage_for,
+    _error_result,
+    _executor,
+    _item_size,
+    _result_size,
 )
-from brosh.models import ImageFormat, MCPImageContent, MCPTextContent, MCPToolResult
+from brosh.models import ImageFormat, MCPImageContent, MCPMetadataContent, MCPTextContent, MCPToolResult, json_size
 
 
 def _write_png(path, color=(10, 20, 30)) -> str:
@@ -49,6 +56,18 @@ class TestConvertToMcpResult:
         assert meta["text"].endswith("...")
         assert len(meta["text"]) < 250
 
+    def test_parallel_conversion_keeps_screenshot_order(self, tmp_path) -> None:
+        """Converting on a pool yields the same items, in the same order, as the serial path."""
+        capture = {
+            _write_png(tmp_path / f"{i}.png", color=(i, i, i)): {"selector": f"#s{i}", "text": f"t{i}"}
+            for i in range(6)
+        }
+        flags = {"fetch_image": True, "fetch_image_path": True, "fetch_text": True}
+        serial = _convert_to_mcp_result(capture, ImageFormat.PNG, **flags)
+        parallel = _convert_to_mcp_result(capture, ImageFormat.PNG, executor=_executor(), **flags)
+        assert parallel.model_dump() == serial.model_dump()
+        assert [type(item) for item in parallel.content[:2]] == [MCPImageContent, MCPMetadataContent]
+
     def test_missing_file_is_skipped_gracefully(self) -> None:
         """A path that cannot be read must not crash conversion."""
         capture = {"/does/not/exist.png": {"selector": "body", "text": "t"}}
@@ -67,9 +86,62 @@ class TestApplySizeLimits:
         big = "y" * (MCP_MAX_SIZE_BYTES + 1000)
         items = [MCPTextContent(text=json.dumps({f"/p{i}.png": {"text": big}})) for i in range(4)]
         limited = _apply_size_limits(MCPToolResult(content=items))
-        size = len(json.dumps(limited.model_dump()).encode("utf-8"))
+        size = json_size(limited.model_dump())
         assert size <= MCP_MAX_SIZE_BYTES or len(limited.content) < len(items)
 
+    def test_trims_trailing_screenshots_just_under_the_limit(self) -> None:
+        """Trailing item pairs are dropped until the result fits, and no more."""
+        chunk = "y" * (MCP_MAX_SIZE_BYTES // 5)
+        items = [MCPTextContent(text=chunk) for _ in range(8)]
+        limited = _apply_size_limits(MCPToolResult(content=items))
+        kept = len(limited.content)
+        assert kept == 4
+        assert json_size(limited.model_dump()) <= MCP_MAX_SIZE_BYTES
+        longer = MCPToolResult(content=items[: kept + 2])
+        assert json_size(longer.model_dump()) > MCP_MAX_SIZE_BYTES
+
+    def test_only_first_html_survives(self) -> None:
+        """Oversized results keep the first HTML block and drop the rest from metadata."""
+        html = "<p>" + "z" * (MCP_MAX_SIZE_BYTES // 2) + "</p>"
+        items = [MCPMetadataContent(metadata={"image_path": f"/p{i}.png", "html": html}) for i in range(3)]
+        limited = _apply_size_limits(MCPToolResult(content=items))
+        metadata = [json.loads(item.text) for item in limited.content]
+        assert "html" in metadata[0]
+        assert all("html" not in meta for meta in metadata[1:])
+        assert [meta["image_path"] for meta in metadata] == ["/p0.png", "/p1.png", "/p2.png"]
+
+    def test_incremental_size_matches_full_serialization(self) -> None:
+        """Summing per-item sizes gives the same byte count as dumping the whole result."""
+        items = [
+            MCPTextContent(text=json.dumps({"text": 'quote " and ünïcode'})),
+            MCPImageContent(data="QUJD", mime_type="image/png"),
+            MCPTextContent(text="plain"),
+            MCPImageContent(data=b"\x89PNG\r\n", mime_type="image/png"),
+        ]
+        for count in range(len(items) + 1):
+            result = MCPToolResult(content=items[:count])
+            expected = json_size(result.model_dump())
+            assert _result_size([_item_size(item) for item in result.content]) == expected
+
+    def test_downsample_percentage_adapts_to_overflow(self) -> None:
+        """Slightly oversized results get the mild 50% pass, huge ones bottom out at 25%."""
+        assert _downsample_percentage_for(MCP_MAX_SIZE_BYTES + 1) == MCP_COMPRESSION_DOWNSAMPLE_PERCENTAGE
+        assert _downsample_percentage_for(9 * MCP_MAX_SIZE_BYTES) == 33
+        assert _downsample_percentage_for(100 * MCP_MAX_SIZE_BYTES) == MCP_COMPRESSION_MIN_DOWNSAMPLE_PERCENTAGE
+
+
+class TestErrorResult:
+    def test_error_result_matches_validated_model(self) -> None:
+        """The unvalidated error payload serializes exactly like a validated one."""
+        expected = MCPToolResult(content=[MCPTextContent(text="Error: boom")])
+        assert _error_result("Error: boom").model_dump() == expected.model_dump()
+
+
+class TestExecutor:
+    def test_executor_is_shared_across_calls(self) -> None:
+        """Tool calls reuse one worker pool instead of building one per request."""
+        assert _executor() is _executor()
+
 
 class TestMcpModelSerialization:
     def test_image_content_uses_camelcase_alias(self) -> None:
@@ -1,5 +1,6 @@
 """Tests for brosh.models module."""
 
+from dataclasses import FrozenInstanceError, replace
 from datetime import datetime
 from pathlib import Path
 
@@ -13,6 +14,8 @@ from brosh.models import (
     MCPImageContent,
     MCPTextContent,
     MCPToolResult,
+    dumps_json,
+    json_size,
 )
 
 
@@ -86,6 +89,25 @@ class TestCaptureFrame:
         assert frame.visible_text is None
         assert frame.timestamp is None
 
+    def test_capture_frame_load_image_bytes(self, tmp_path: Path) -> None:
+        """Test a frame's screenshot is read from memory or from its spool file."""
+        in_memory = CaptureFrame(
+            image_bytes=b"in_memory", scroll_position_y=0, page_height=2000, viewport_height=800, active_selector="main"
+        )
+        spooled_path = tmp_path / "frame.png"
+        spooled_path.write_bytes(b"spooled")
+        spooled = CaptureFrame(
+            image_bytes=None,
+            scroll_position_y=0,
+            page_height=2000,
+            viewport_height=800,
+            active_selector="main",
+            image_path=spooled_path,
+        )
+
+        assert in_memory.load_image_bytes() == b"in_memory"
+        assert spooled.load_image_bytes() == b"spooled"
+
     def test_capture_frame_with_optional_fields(self) -> None:
         """Test creating a CaptureFrame with all fields."""
         from datetime import timezone
@@ -121,6 +143,15 @@ class TestCaptureConfig:
         assert config.format == ImageFormat.PNG
         assert config.trim_text is True  # Default value
 
+    def test_capture_config_is_immutable(self) -> None:
+        """Test CaptureConfig rejects mutation; adjusted copies go through replace()."""
+        config = CaptureConfig(url="https://example.com")
+
+        with pytest.raises(FrozenInstanceError):
+            config.width = 800  # type: ignore[misc]
+        assert replace(config, width=800).width == 800
+        assert config.width == 0
+
     def test_capture_config_creation_full(self, temp_output_dir: Path) -> None:
         """Test creating CaptureConfig with all fields."""
         config = CaptureConfig(
@@ -240,6 +271,14 @@ class TestCaptureConfig:
         with pytest.raises(ValueError, match="Animation SPF must be between 0.1 and 10.0"):  # Match updated
             CaptureConfig(url="https://example.com", anim_spf=15.0).validate()  # PT012 single statement
 
+    def test_capture_config_validation_paint_settle_ms(self) -> None:
+        """Test CaptureConfig paint_settle_ms validation."""
+        CaptureConfig(url="https://example.com", paint_settle_ms=0).validate()
+        CaptureConfig(url="https://example.com", paint_settle_ms=500).validate()
+
+        with pytest.raises(ValueError, match="Paint settle time must be between 0 and 10000 ms"):
+            CaptureConfig(url="https://example.com", paint_settle_ms=-1).validate()
+
 
 class TestCaptureResult:
     """Test the CaptureResult class."""
@@ -281,6 +320,26 @@ class TestMCPModels:
         assert content.data == "base64_encoded_data"
         assert content.mime_type == "image/png"
 
+    def test_mcp_image_content_raw_bytes(self) -> None:
+        """Test MCPImageContent keeps raw bytes and base64-encodes them on dump."""
+        content = MCPImageContent(data=b"\x89PNG", mime_type="image/png")
+
+        assert content.data == b"\x89PNG"
+        assert content.image_bytes == b"\x89PNG"
+        assert content.model_dump()["data"] == "iVBORw=="
+        assert MCPImageContent(data="iVBORw==", mime_type="image/png").image_bytes == b"\x89PNG"
+
+    def test_dumps_json_is_compact_with_or_without_orjson(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test dumps_json output does not depend on whether orjson is installed."""
+        payload = {"text": "ünïcode", "n": [1, 2]}
+        expected = '{"text":"ünïcode","n":[1,2]}'
+
+        assert dumps_json(payload) == expected
+        assert json_size(payload) == len(expected.encode("utf-8"))
+        monkeypatch.setattr("brosh.models.HAS_ORJSON", False)
+        assert dumps_json(payload) == expected
+        assert json_size(payload) == len(expected.encode("utf-8"))
+
     def test_mcp_tool_result(self) -> None:
         """Test MCPToolResult creation."""
         text_content = MCPTextContent(text="Test content")
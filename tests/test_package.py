@@ -1,8 +1,34 @@
 """Test suite for brosh."""
 
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import brosh
+
+SRC = str(Path(brosh.__file__).resolve().parent.parent)
+
 
 def test_version():
     """Verify package exposes version."""
     import brosh
 
     assert brosh.__version__
+
+
+def test_import_defers_submodules():
+    """Importing the package loads no submodule until a public name is used."""
+    code = (
+        "import sys, brosh\n"
+        "assert 'brosh.api' not in sys.modules and 'playwright' not in sys.modules\n"
+        "assert brosh.capture_webpage.__module__ == 'brosh.api'\n"
+        "assert 'brosh.api' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, env={**os.environ, "PYTHONPATH": SRC})
+
+
+def test_cli_import_defers_playwright():
+    """Loading the CLI (e.g. for --help) does not start importing Playwright."""
+    code = "import sys, brosh.cli\nassert 'playwright' not in sys.modules\n"
+    subprocess.run([sys.executable, "-c", code], check=True, env={**os.environ, "PYTHONPATH": SRC})
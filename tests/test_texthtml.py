@@ -1,6 +1,10 @@
 """Tests for brosh.texthtml — pure HTML/text processing (no browser needed)."""
 
-from brosh.texthtml import DOMProcessor
+from unittest.mock import AsyncMock
+
+import pytest
+
+from brosh.texthtml import HAS_MINIFY_HTML, DOMProcessor
 
 
 class TestHtmlToMarkdown:
@@ -14,28 +18,115 @@ class TestHtmlToMarkdown:
         assert "example.com" in md
 
 
+@pytest.fixture(
+    params=[
+        pytest.param("regex", id="regex"),
+        pytest.param(
+            "minify-html", id="minify-html", marks=pytest.mark.skipif(not HAS_MINIFY_HTML, reason="needs minify-html")
+        ),
+    ],
+)
+def minifier(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run each compression test with and without the native minifier; returns the path in use."""
+    monkeypatch.setattr("brosh.texthtml.HAS_MINIFY_HTML", request.param == "minify-html")
+    return request.param
+
+
 class TestCompressHtml:
+    @pytest.mark.usefixtures("minifier")
     def test_comments_removed(self) -> None:
         assert "secret" not in DOMProcessor.compress_html("<div><!-- secret --></div>")
 
+    @pytest.mark.usefixtures("minifier")
     def test_whitespace_collapsed(self) -> None:
         out = DOMProcessor.compress_html("<p>a</p>   \n\n   <p>b</p>")
         assert "><" in out
         assert "  " not in out
 
-    def test_svg_body_stripped_but_dimensions_kept(self) -> None:
+    def test_svg_body_stripped_but_dimensions_kept(self, minifier: str) -> None:
         html = '<svg width="24" height="24"><path d="M0 0h24v24"/></svg>'
         out = DOMProcessor.compress_html(html)
         assert "path" not in out
-        assert 'width="24"' in out
-        assert 'height="24"' in out
+        if minifier == "minify-html":
+            # minify-html drops quotes that are not needed and sorts attributes
+            assert out == "<svg height=24 width=24></svg>"
+        else:
+            assert 'width="24"' in out
+            assert 'height="24"' in out
 
-    def test_long_data_uri_src_emptied(self) -> None:
+    def test_long_data_uri_src_emptied(self, minifier: str) -> None:
         html = f'<img src="data:image/png;base64,{"A" * 200}">'
         out = DOMProcessor.compress_html(html)
-        assert 'src=""' in out
+        assert "AAAA" not in out
+        if minifier == "minify-html":
+            assert out == '<img src="">'
+        else:
+            assert 'src=""' in out
+
+    def test_long_style_emptied_among_other_attributes(self, minifier: str) -> None:
+        html = f'<div style="{"color:red;" * 60}" id="box">x</div>'
+        out = DOMProcessor.compress_html(html)
+        assert "color:red" not in out
+        if minifier == "minify-html":
+            assert out == '<div id=box style="">x</div>'
+        else:
+            assert out == '<div style="" id="box">x</div>'
 
+    @pytest.mark.usefixtures("minifier")
     def test_plain_html_survives(self) -> None:
         out = DOMProcessor.compress_html("<main><h2>Hi</h2></main>")
         assert "<main>" in out
         assert "Hi" in out
+
+
+class TestExtractAllForFrame:
+    @pytest.mark.asyncio
+    async def test_single_round_trip(self) -> None:
+        page = AsyncMock()
+        page.evaluate.return_value = {"html": "<p>Hello</p>", "selector": "main", "sectionId": "pricing"}
+
+        html, text, selector, section_id = await DOMProcessor().extract_all_for_frame(page, include_html=True)
+
+        page.evaluate.assert_awaited_once()
+        assert html == "<p>Hello</p>"
+        assert text == "Hello"
+        assert selector == "main"
+        assert section_id == "pricing"
+        assert "elementsFromPoint" in page.evaluate.await_args.args[0]
+
+    @pytest.mark.asyncio
+    async def test_html_omitted_when_not_requested(self) -> None:
+        page = AsyncMock()
+        page.evaluate.return_value = {"html": "<p>Hello</p>", "selector": "main", "sectionId": "section"}
+
+        html, text, _, _ = await DOMProcessor().extract_all_for_frame(page, include_html=False)
+
+        assert html is None
+        assert text == "Hello"
+
+    @pytest.mark.asyncio
+    async def test_evaluate_failure_falls_back(self) -> None:
+        page = AsyncMock()
+        page.evaluate.side_effect = RuntimeError("page crashed")
+
+        assert await DOMProcessor().extract_all_for_frame(page, include_html=True) == ("", "", "body", "section")
+
+
+class TestGetSectionId:
+    @pytest.mark.asyncio
+    async def test_uses_single_hit_test(self) -> None:
+        page = AsyncMock()
+        page.evaluate.return_value = "pricing"
+
+        assert await DOMProcessor().get_section_id(page) == "pricing"
+        page.evaluate.assert_awaited_once()
+        script = page.evaluate.await_args.args[0]
+        assert "elementsFromPoint" in script
+        assert "querySelectorAll" not in script
+
+    @pytest.mark.asyncio
+    async def test_evaluate_failure_falls_back(self) -> None:
+        page = AsyncMock()
+        page.evaluate.side_effect = RuntimeError("page closed")
+
+        assert await DOMProcessor().get_section_id(page) == "section"
@@ -0,0 +1,130 @@
+"""Tests for brosh.tool — frame post-processing (no browser needed)."""
+
+import io
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from PIL import Image
+
+from brosh.models import CaptureConfig, CaptureFrame, ImageFormat
+from brosh.tool import BrowserScreenshotTool
+
+
+def _frame(scroll_position_y: int, size: tuple[int, int] = (80, 60)) -> CaptureFrame:
+    """Build a frame holding a small in-memory PNG, coloured by its scroll position."""
+    buf = io.BytesIO()
+    Image.new("RGB", size, (10, scroll_position_y % 256, 200)).save(buf, format="PNG")
+    return CaptureFrame(
+        image_bytes=buf.getvalue(),
+        scroll_position_y=scroll_position_y,
+        page_height=1000,
+        viewport_height=250,
+        active_selector="main",
+        visible_text=f"at {scroll_position_y}",
+    )
+
+
+class TestCaptureSpooling:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("image_format", "spooled"), [(ImageFormat.PNG, True), (ImageFormat.APNG, False)])
+    async def test_only_apng_frames_skip_the_spool(
+        self, tmp_path: Path, image_format: ImageFormat, *, spooled: bool
+    ) -> None:
+        tool = BrowserScreenshotTool()
+        config = CaptureConfig(
+            url="https://example.com", width=800, height=600, output_dir=tmp_path, format=image_format
+        )
+        capture_frames = AsyncMock(return_value=[_frame(0)])
+
+        with (
+            patch("brosh.tool.BrowserManager.get_playwright", AsyncMock()),
+            patch.object(tool.browser_manager, "get_browser_instance", AsyncMock(return_value=(None, None, None))),
+            patch.object(tool.browser_manager, "cleanup_browser", AsyncMock()),
+            patch.object(tool.browser_manager, "get_browser_name", MagicMock(return_value="chrome")),
+            patch.object(tool.capture_manager, "capture_frames", capture_frames),
+        ):
+            await tool.capture(config)
+
+        assert (capture_frames.call_args.kwargs["spool_dir"] is not None) is spooled
+
+
+class TestProcessRegularFrames:
+    @pytest.mark.asyncio
+    async def test_scaled_jpg_frames_written_in_order(self, tmp_path: Path) -> None:
+        config = CaptureConfig(url="https://example.com", scale=50, format=ImageFormat.JPG)
+        frames = [_frame(0), _frame(250), _frame(500)]
+
+        results = await BrowserScreenshotTool()._process_regular_frames(frames, "example_com", tmp_path, config)
+
+        paths = list(results)
+        assert [results[path]["text"] for path in paths] == ["at 0", "at 250", "at 500"]
+        for path in paths:
+            with Image.open(path) as img:
+                assert img.format == "JPEG"
+                assert img.size == (40, 30)
+
+    @pytest.mark.asyncio
+    async def test_same_domain_pages_in_same_second_do_not_collide(self, tmp_path: Path) -> None:
+        tool = BrowserScreenshotTool()
+        frozen = MagicMock(wraps=datetime)
+        frozen.now.return_value = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+        with patch("brosh.tool.datetime", frozen):
+            first = await tool._process_regular_frames(
+                [_frame(0)], "example_com", tmp_path, CaptureConfig(url="https://example.com/a")
+            )
+            second = await tool._process_regular_frames(
+                [_frame(0)], "example_com", tmp_path, CaptureConfig(url="https://example.com/b")
+            )
+
+        assert first.keys().isdisjoint(second.keys())
+        assert len(list(tmp_path.iterdir())) == 2  # noqa: ASYNC240
+
+    @pytest.mark.asyncio
+    async def test_section_id_in_filename(self, tmp_path: Path) -> None:
+        config = CaptureConfig(url="https://example.com")
+        frame = _frame(500)
+        frame.section_id = "pricing"
+
+        results = await BrowserScreenshotTool()._process_regular_frames([frame], "example_com", tmp_path, config)
+
+        assert Path(next(iter(results))).name.endswith("-05000-pricing.png")
+
+    @pytest.mark.asyncio
+    async def test_browser_encoded_jpg_is_not_converted_again(self, tmp_path: Path) -> None:
+        config = CaptureConfig(url="https://example.com", format=ImageFormat.JPG)
+        frame = _frame(0)
+        frame.image_bytes = b"\xff\xd8 browser jpeg"
+        frame.image_format = ImageFormat.JPG
+
+        results = await BrowserScreenshotTool()._process_regular_frames([frame], "example_com", tmp_path, config)
+
+        assert Path(next(iter(results))).read_bytes() == b"\xff\xd8 browser jpeg"  # noqa: ASYNC240
+
+
+class TestProcessApngFrames:
+    @pytest.mark.asyncio
+    async def test_frames_scaled_into_animation(self, tmp_path: Path) -> None:
+        config = CaptureConfig(url="https://example.com", scale=50, format=ImageFormat.APNG)
+
+        results = await BrowserScreenshotTool()._process_apng_frames(
+            [_frame(0), _frame(100)], "example_com", tmp_path, config
+        )
+
+        (path,) = results
+        with Image.open(path) as img:
+            assert img.n_frames == 2
+            assert img.size == (40, 30)
+
+    @pytest.mark.asyncio
+    async def test_same_domain_animations_do_not_collide(self, tmp_path: Path) -> None:
+        tool = BrowserScreenshotTool()
+        config_a = CaptureConfig(url="https://example.com/a", format=ImageFormat.APNG)
+        config_b = CaptureConfig(url="https://example.com/b", format=ImageFormat.APNG)
+
+        first = await tool._process_apng_frames([_frame(0), _frame(100)], "example_com", tmp_path, config_a)
+        second = await tool._process_apng_frames([_frame(0), _frame(100)], "example_com", tmp_path, config_b)
+
+        assert first.keys().isdisjoint(second.keys())